@@ -0,0 +1 @@
+"""Performance benchmarks for the omi-sync pipeline (run with python -m benchmarks)."""
@@ -0,0 +1,53 @@
+"""Command-line entry point: python -m benchmarks [options]."""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.importtime import run_imports
+from benchmarks.suite import CASES, compare, run_suite
+from benchmarks.synthetic import SIZES, TRANSCRIPT_SEGMENTS
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", default="1k,10k", help=f"Comma-separated, from {', '.join(SIZES)} or plain numbers.")
+    parser.add_argument("--transcripts", default="short,typical,long", help="Comma-separated transcript profiles.")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated case names.")
+    parser.add_argument("--skip-imports", action="store_true", help="Skip the import-time budget check.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best is kept.")
+    parser.add_argument("--output", type=Path, help="Write results JSON here.")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Flag regressions against a results JSON.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+
+    sizes = [SIZES.get(s) or int(s) for s in args.sizes.split(",")]
+    transcripts = args.transcripts.split(",")
+    names = args.cases.split(",")
+    unknown = [t for t in transcripts if t not in TRANSCRIPT_SEGMENTS] + [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown transcript profile or case: {', '.join(unknown)}")
+
+    results = run_suite(sizes, transcripts, names, args.repeat)
+    over_budget = []
+    if not args.skip_imports:
+        imports = run_imports(max(args.repeat, 5))
+        results["imports"] = [dict(asdict(r), key=r.key) for r in imports]
+        over_budget = [r for r in imports if not r.ok]
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    failed = bool(over_budget)
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        failed = failed or bool(regressions)
+        if not regressions:
+            print("No regressions")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
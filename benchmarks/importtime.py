@@ -0,0 +1,91 @@
+"""Import-time benchmark: cold-start cost of the CLI and its entry modules."""
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Heavy dependencies an entry module must not load just by being imported
+_DEFERRED = ("dotenv", "yaml", "httpx", "dateutil", "multiprocessing")
+
+# module -> (budget in seconds, modules it must not load at import time)
+IMPORT_BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "omi_sync.cli": (0.100, _DEFERRED + ("pytz",)),
+    "omi_sync.config": (0.050, _DEFERRED + ("pytz",)),
+    "omi_sync.verify": (0.100, _DEFERRED + ("pytz",)),
+    "omi_sync.sync_engine": (0.150, _DEFERRED),
+    "omi_sync.daemon": (0.175, _DEFERRED),
+}
+
+_PROBE = (
+    "import sys; before = set(sys.modules); import {module}; "
+    "print(','.join(sorted(set(sys.modules) - before)))"
+)
+
+
+@dataclass
+class ImportResult:
+    """Best-of-N import time of one module in a fresh interpreter."""
+    module: str
+    seconds: float
+    budget_seconds: float
+    unexpected: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"import[{self.module}]"
+
+    @property
+    def ok(self) -> bool:
+        return self.seconds <= self.budget_seconds and not self.unexpected
+
+
+def parse_importtime(stderr: str, package: str = "omi_sync") -> float:
+    """
+    Seconds spent importing package, from python -X importtime output.
+
+    Sums the cumulative time of the top-level imports of package, which
+    excludes interpreter startup (site, encodings).
+    """
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # column header
+        # One leading space marks an import made directly by the statement
+        if not name.startswith("  ") and name.strip().split(".")[0] == package:
+            total_us += int(cumulative)
+    return total_us / 1e6
+
+
+def measure_import(module: str, repeat: int = 5) -> Tuple[float, List[str]]:
+    """Import module in fresh interpreters; return best seconds and modules it loaded."""
+    import omi_sync
+    env = dict(os.environ, PYTHONPATH=str(Path(omi_sync.__file__).parent.parent))
+    best = float("inf")
+    loaded: List[str] = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        best = min(best, parse_importtime(proc.stderr))
+        loaded = proc.stdout.strip().split(",")
+    return best, loaded
+
+
+def run_imports(repeat: int = 5, log=print) -> List[ImportResult]:
+    """Measure every budgeted module."""
+    results = []
+    for module, (budget, deferred) in IMPORT_BUDGETS.items():
+        seconds, loaded = measure_import(module, repeat)
+        unexpected = sorted(m for m in loaded if m in deferred)
+        result = ImportResult(module, seconds, budget, unexpected)
+        status = "ok" if result.ok else "OVER BUDGET"
+        extra = f"  loads {', '.join(unexpected)}" if unexpected else ""
+        log(f"{result.key:<55} {seconds * 1000:8.1f}ms / {budget * 1000:.0f}ms  {status}{extra}")
+        results.append(result)
+    return results
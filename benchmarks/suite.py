@@ -0,0 +1,459 @@
+"""Benchmark cases for each stage of the sync pipeline."""
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.synthetic import generate_conversations
+
+# A case prepares its inputs from a workload and returns the callable to
+# time plus the number of items one call processes.
+Case = Callable[["Workload"], Tuple[Callable[[], Any], int]]
+
+CASES: Dict[str, Case] = {}
+
+GENERATED_AT = "2026-01-01T00:00:00-05:00"
+
+
+def case(name: str):
+    """Register a benchmark case under name."""
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+    return register
+
+
+@dataclass
+class BenchmarkResult:
+    """Best-of-N timing for one case at one workload size."""
+    name: str
+    size: int
+    transcript: str
+    items: int
+    seconds: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}/{self.transcript}]"
+
+    @property
+    def per_item_us(self) -> float:
+        return self.seconds / self.items * 1e6 if self.items else 0.0
+
+
+class Workload:
+    """Synthetic conversations of one size and transcript profile, in a scratch vault."""
+
+    def __init__(self, size: int, transcript: str):
+        self.size = size
+        self.transcript = transcript
+        self.root = Path(tempfile.mkdtemp(prefix="omi-sync-bench-"))
+
+    def close(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def vault(self, name: str) -> Path:
+        """A fresh, empty vault directory."""
+        path = self.root / name
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+        return path
+
+    @cached_property
+    def data(self) -> List[Dict[str, Any]]:
+        return generate_conversations(self.size, self.transcript)
+
+    @cached_property
+    def config(self):
+        from omi_sync.config import Config
+        return Config(api_key="bench", vault_path=self.vault("config"))
+
+    @cached_property
+    def conversations(self):
+        from omi_sync.models import parse_conversation
+        return [parse_conversation(d) for d in self.data]
+
+    @cached_property
+    def by_day(self):
+        from omi_sync.timezone_utils import get_local_date
+        days = defaultdict(list)
+        for conv in self.conversations:
+            days[get_local_date(conv.finished_at, self.config.timezone)].append(conv)
+        return dict(days)
+
+    @cached_property
+    def notable_ids(self):
+        from omi_sync.notable import is_notable
+        return {c.id for c in self.conversations if is_notable(c, self.config)}
+
+    @cached_property
+    def synced_vault(self) -> Path:
+        """A vault after one full sync of the workload."""
+        from omi_sync.config import Config
+        from omi_sync.sync_engine import SyncEngine
+        vault = self.vault("synced")
+        SyncEngine(Config(api_key="bench", vault_path=vault)).sync(self.data)
+        return vault
+
+
+@case("parse_conversation")
+def _parse(w: Workload):
+    from omi_sync.models import parse_conversation
+    data = w.data
+    return lambda: [parse_conversation(d) for d in data], len(data)
+
+
+@case("is_finalized")
+def _finalized(w: Workload):
+    from omi_sync.finalization import is_finalized
+    convs = w.conversations
+    return lambda: [is_finalized(c, 10) for c in convs], len(convs)
+
+
+@case("is_notable")
+def _notable(w: Workload):
+    from omi_sync.notable import is_notable
+    convs, config = w.conversations, w.config
+    return lambda: [is_notable(c, config) for c in convs], len(convs)
+
+
+# Keyword list for the keyword cases: hundreds of names of the kind people
+# add (people, projects, clients), then the defaults
+MANY_KEYWORDS = 500
+
+
+def _many_keywords() -> List[str]:
+    from omi_sync.config import Config
+    names = [f"{first} {last}" for first in ("Ada", "Bo", "Cy", "Dee", "Eli") for last in range(MANY_KEYWORDS // 5)]
+    return names + Config(api_key="bench", vault_path=Path(".")).notable_keywords
+
+
+@case("keyword_loop_500")
+def _keyword_loop(w: Workload):
+    """The per-keyword loop the compiled matcher replaced, for comparison."""
+    keywords = _many_keywords()
+    texts = [f"{c.title} {c.overview}" for c in w.conversations]
+
+    def run():
+        for text in texts:
+            lowered = text.lower()
+            any(k.lower() in lowered for k in keywords)
+    return run, len(texts)
+
+
+@case("keyword_matcher_500")
+def _keyword_matcher(w: Workload):
+    from omi_sync.keywords import KeywordMatcher
+    matcher = KeywordMatcher(_many_keywords())
+    texts = [f"{c.title} {c.overview}" for c in w.conversations]
+    return lambda: [matcher.search(t) for t in texts], len(texts)
+
+
+@case("transcript_scan")
+def _transcript_scan(w: Workload):
+    """Scanning every transcript for the 500 keywords, with nothing cached."""
+    from omi_sync.keywords import KeywordMatcher
+    from omi_sync.transcript_scan import TranscriptScanner
+    matcher = KeywordMatcher(_many_keywords())
+    convs = w.conversations
+    return lambda: [TranscriptScanner(matcher).scan(c) for c in convs], len(convs)
+
+
+@case("transcript_scan_cached")
+def _transcript_scan_cached(w: Workload):
+    """The same once every transcript's result is cached: hashing only."""
+    from omi_sync.keywords import KeywordMatcher
+    from omi_sync.transcript_scan import TranscriptScanner
+    scanner = TranscriptScanner(KeywordMatcher(_many_keywords()))
+    convs = w.conversations
+    for c in convs:
+        scanner.scan(c)
+    return lambda: [scanner.scan(c) for c in convs], len(convs)
+
+
+# A rules file of the size people grow: per-project keyword rules, meeting
+# shapes by category and speakers, places, and one transcript rule
+def _many_rules() -> List[Dict[str, Any]]:
+    rules = [
+        {"name": "long", "duration_minutes": {"min": 25}},
+        {"name": "busy", "action_items": {"min": 2}},
+        {"name": "spoken", "keywords": {"any": ["diagnosis", "contract"], "in": ["transcript"]}, "duration_minutes": {"min": 5}},
+        {"name": "clinic", "location": ["clinic", "hospital"]},
+        {"name": "german", "language": ["de"], "speakers": {"min": 2}},
+    ]
+    for i in range(15):
+        rules.append({"name": f"project {i}", "keywords": [f"Project {i}", f"Client {i}"]})
+    for category in ("work", "business", "education", "health"):
+        rules.append({"name": f"{category} meeting", "category": [category], "speakers": {"min": 3}})
+    return rules
+
+
+@case("notable_rules")
+def _notable_rules(w: Workload):
+    """is_notable with a 24-rule rules file in place of the built-in rules."""
+    from omi_sync.notable import is_notable
+    from omi_sync.rules import RuleSet, compile_rule
+    convs, config = w.conversations, w.config
+    spec = _many_rules()
+
+    def run():
+        # Compiled per run, as the engine does
+        rules = RuleSet([compile_rule(r, "rule") for r in spec])
+        return [is_notable(c, config, rules=rules) for c in convs]
+    return run, len(convs)
+
+
+@case("finalized_mask")
+def _finalized_mask(w: Workload):
+    from omi_sync.columns import ConversationColumns
+    from omi_sync.finalization import finalized_mask
+    convs = w.conversations
+    return lambda: finalized_mask(ConversationColumns.of(convs), 10), len(convs)
+
+
+@case("notable_mask")
+def _notable_mask(w: Workload):
+    from omi_sync.notable import notable_mask
+    convs, config = w.conversations, w.config
+    return lambda: notable_mask(convs, config), len(convs)
+
+
+@case("get_local_date")
+def _get_local_date(w: Workload):
+    from omi_sync.timezone_utils import get_local_date
+    finished, tz = [c.finished_at for c in w.conversations], w.config.timezone
+    return lambda: [get_local_date(f, tz) for f in finished], len(finished)
+
+
+# Instants for local_dates_bulk: one every 97 seconds from 2024, so the
+# batch spans several DST changes whatever the workload size
+BULK_INSTANTS = 1_000_000
+
+
+@case("local_dates_bulk")
+def _local_dates_bulk(w: Workload):
+    from omi_sync.timezone_utils import zone_table
+    table = zone_table(w.config.timezone)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+    epochs = [start + 97 * i for i in range(BULK_INSTANTS)]
+    return lambda: table.local_dates(epochs), len(epochs)
+
+
+@case("generate_raw_daily")
+def _raw(w: Workload):
+    from omi_sync.generators.raw import generate_raw_daily
+    days, config = w.by_day, w.config
+    return lambda: [generate_raw_daily(c, d, config, GENERATED_AT) for d, c in days.items()], len(days)
+
+
+@case("generate_event_note")
+def _event(w: Workload):
+    from omi_sync.generators.event import generate_event_note
+    notable = [c for c in w.conversations if c.id in w.notable_ids]
+    config = w.config
+    return lambda: [generate_event_note(c, config, GENERATED_AT) for c in notable], len(notable)
+
+
+@case("generate_highlights")
+def _highlights(w: Workload):
+    from omi_sync.generators.highlights import generate_highlights
+    days, config, notable_ids = w.by_day, w.config, w.notable_ids
+    return lambda: [
+        generate_highlights(c, d, notable_ids, config, GENERATED_AT) for d, c in days.items()
+    ], len(days)
+
+
+def _event_frontmatters(w: Workload) -> List[Dict[str, Any]]:
+    """The frontmatter mappings of the workload's event notes."""
+    from omi_sync.people import extract_people
+    from omi_sync.timezone_utils import format_time_local, get_local_date
+    tz = w.config.timezone
+    frontmatters = []
+    for c in w.conversations:
+        local_date = get_local_date(c.finished_at, tz)
+        heading = f"{format_time_local(c.started_at, tz)} — {c.title} (omi:{c.id})"
+        frontmatters.append({
+            "category": c.category or "", "date": local_date, "duration_minutes": c.duration_minutes,
+            "finished_at": c.finished_at.isoformat(), "generated_at": GENERATED_AT,
+            "language": c.language or "", "omi_id": c.id, "omi_sync": True, "people": extract_people(c),
+            "raw_daily": f"[[{local_date}]]", "raw_link": f"[[{local_date}#{heading}]]",
+            "source": c.source or "", "started_at": c.started_at.isoformat(),
+        })
+    return frontmatters
+
+
+@case("frontmatter_emit")
+def _frontmatter_emit(w: Workload):
+    from omi_sync.frontmatter_writer import write_frontmatter
+    frontmatters = _event_frontmatters(w)
+    return lambda: [write_frontmatter(f) for f in frontmatters], len(frontmatters)
+
+
+@case("frontmatter_yaml_dump")
+def _frontmatter_yaml(w: Workload):
+    """The yaml.dump path write_frontmatter replaces, for comparison."""
+    from omi_sync.frontmatter_writer import _yaml_dump
+    frontmatters = _event_frontmatters(w)
+    return lambda: [_yaml_dump(f) for f in frontmatters], len(frontmatters)
+
+
+@case("write_file_atomic")
+def _write(w: Workload):
+    from omi_sync.file_writer import write_file_atomic
+    from omi_sync.generators.raw import generate_raw_daily
+    contents = [(d, generate_raw_daily(c, d, w.config, GENERATED_AT)) for d, c in w.by_day.items()]
+    out = w.vault("writes")
+    return lambda: [write_file_atomic(out / f"{d}.md", text) for d, text in contents], len(contents)
+
+
+def _journal_commit(policy: str) -> Case:
+    def prepare(w: Workload):
+        from omi_sync.generators.raw import generate_raw_daily
+        from omi_sync.journal import RunJournal
+        vault = w.vault(f"commit-{policy}")
+        contents = [
+            (vault / "Omi" / "Raw" / f"{d}.md", generate_raw_daily(c, d, w.config, GENERATED_AT))
+            for d, c in w.by_day.items()
+        ]
+
+        def commit():
+            journal = RunJournal(vault / "Omi" / ".omi-sync", vault, fsync=policy)
+            for path, text in contents:
+                staged, _ = journal.stage(path, text)
+                journal.record_write(path, staged)
+            journal.apply()
+            journal.clear()
+        return commit, len(contents)
+    return prepare
+
+
+# Staging a run's files and committing them, per fsync policy
+for _policy in ("none", "batched", "strict"):
+    case(f"journal_commit_{_policy}")(_journal_commit(_policy))
+
+
+def _staged_writes(workers: int) -> Case:
+    def prepare(w: Workload):
+        from omi_sync.generators.raw import generate_raw_daily
+        from omi_sync.journal import RunJournal
+        from omi_sync.write_queue import WriteQueue
+        vault = w.vault(f"queue-{workers}")
+        contents = [generate_raw_daily(c, d, w.config, GENERATED_AT) for d, c in w.by_day.items()]
+
+        def stage():
+            journal = RunJournal(vault / "Omi" / ".omi-sync", vault)
+            with WriteQueue(workers) as queue:
+                for text in contents:
+                    queue.submit([(journal.write_staged, (journal.reserve(), text))])
+                queue.barrier()
+            journal.clear()
+        return stage, len(contents)
+    return prepare
+
+
+# Staging files inline vs. on writer threads
+for _workers in (0, 4):
+    case(f"write_queue_{_workers}")(_staged_writes(_workers))
+
+
+@case("state_save")
+def _state_save(w: Workload):
+    from omi_sync.state import StateManager
+    state = StateManager(w.synced_vault)
+    return state.save, len(state.get_all_entries())
+
+
+@case("state_load")
+def _state_load(w: Workload):
+    from omi_sync.state import StateManager
+    vault = w.synced_vault
+    return lambda: StateManager(vault), len(StateManager(vault).get_all_entries())
+
+
+@case("apply_override")
+def _apply_override(w: Workload):
+    import json
+    import os
+    from omi_sync.config import Config
+    from omi_sync.sync_engine import SyncEngine
+    config = Config(api_key="bench", vault_path=w.vault("overrides"))
+    engine = SyncEngine(config)
+    engine.sync(w.data)
+    path = engine.state.get_notable_overrides_path()
+    omi_id = w.data[0]["id"]
+    flips = iter(range(1, 1 << 30))
+
+    def flip():
+        # Alternate one conversation's override, with a new mtime each time
+        n = next(flips)
+        path.write_text(json.dumps({omi_id: n % 2 == 0}))
+        os.utime(path, ns=(n * 1_000_000_000, n * 1_000_000_000))
+        return engine.apply_override_changes()
+
+    return flip, 1
+
+
+@case("rebuild_index_from_vault")
+def _rebuild(w: Workload):
+    from omi_sync.config import Config
+    from omi_sync.rebuild import rebuild_index_from_vault
+    config = Config(api_key="bench", vault_path=w.synced_vault)
+    return lambda: rebuild_index_from_vault(config, full=True), w.size
+
+
+def run_case(name: str, workload: Workload, repeat: int = 3) -> BenchmarkResult:
+    """Time one case, best of repeat runs."""
+    fn, items = CASES[name](workload)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return BenchmarkResult(name, workload.size, workload.transcript, items, best)
+
+
+def run_suite(sizes: List[int], transcripts: List[str], names: List[str], repeat: int = 3, log=print) -> Dict[str, Any]:
+    """Run the selected cases over every size and transcript profile."""
+    results = []
+    for size in sizes:
+        for transcript in transcripts:
+            workload = Workload(size, transcript)
+            try:
+                for name in names:
+                    result = run_case(name, workload, repeat)
+                    log(f"{result.key:<55} {result.seconds:10.4f}s  {result.per_item_us:10.1f} us/item")
+                    results.append(result)
+            finally:
+                workload.close()
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": [dict(asdict(r), key=r.key) for r in results],
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[str]:
+    """
+    Describe every case that got slower than baseline by more than threshold.
+
+    Covers both stage cases and import times; cases missing from either
+    side are ignored.
+    """
+    before = {r["key"]: r["seconds"] for r in baseline["results"] + baseline.get("imports", [])}
+    regressions = []
+    for r in current["results"] + current.get("imports", []):
+        old = before.get(r["key"])
+        if old and r["seconds"] > old * (1 + threshold):
+            regressions.append(f"{r['key']}: {old:.4f}s -> {r['seconds']:.4f}s (+{(r['seconds'] / old - 1) * 100:.0f}%)")
+    return regressions
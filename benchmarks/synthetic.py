@@ -0,0 +1,67 @@
+"""Deterministic synthetic Omi conversations for benchmarks."""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+# Segments per conversation for each transcript profile
+TRANSCRIPT_SEGMENTS = {
+    "short": 4,
+    "typical": 60,
+    "long": 1500,
+}
+
+# Named sizes accepted on the command line
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+_WORDS = (
+    "project budget launch review customer design sprint hiring roadmap "
+    "metrics feedback deadline contract vendor migration onboarding travel "
+    "dinner weekend groceries school doctor appointment therapy planning "
+    "standup retro interview session one-on-one"
+).split()
+_CATEGORIES = ["business", "personal", "health", "education", "other"]
+_EPOCH = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+
+
+def generate_conversations(count: int, transcript: str = "typical", per_day: int = 12, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Return count API-shaped conversation dicts, newest first like the API.
+
+    Output depends only on the arguments. About per_day conversations fall
+    on each day, with a mix that makes a realistic share of them notable.
+    """
+    rng = random.Random(seed)
+    segments = TRANSCRIPT_SEGMENTS[transcript]
+    conversations = []
+    for i in range(count):
+        day, slot = divmod(i, per_day)
+        started = _EPOCH + timedelta(days=day, minutes=slot * 50 + rng.randint(0, 20))
+        duration = rng.choice([2, 5, 8, 12, 18, 30, 45])
+        conversations.append({
+            "id": f"conv_{i:07d}",
+            "started_at": started.isoformat(),
+            "finished_at": (started + timedelta(minutes=duration)).isoformat(),
+            "language": "en",
+            "source": "omi",
+            "structured": {
+                "title": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 5))).capitalize(),
+                "overview": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(10, 40))),
+                "category": rng.choice(_CATEGORIES),
+                "action_items": [
+                    {"description": f"Follow up on {rng.choice(_WORDS)}", "completed": rng.random() < 0.3}
+                    for _ in range(rng.choice([0, 0, 0, 1, 2, 3]))
+                ],
+            },
+            "transcript_segments": [
+                {
+                    "speaker": f"SPEAKER_{s % 3:02d}",
+                    "text": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 30))),
+                    "start": s * 5.0,
+                    "end": s * 5.0 + 4.5,
+                    "is_user": s % 3 == 0,
+                }
+                for s in range(segments)
+            ],
+        })
+    conversations.reverse()
+    return conversations
@@ -1,7 +1,10 @@
 """Omi API client with retry logic."""
 import time
 import httpx
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Iterator, List, Dict, Any, Optional
+
+from omi_sync.profiling import StageTimer
 
 
 class OmiAPIError(Exception):
@@ -15,6 +18,10 @@ class OmiClient:
 
     PRD: Handle retries on 5xx with exponential backoff (max attempts 5),
     429 with Retry-After if present, pagination.
+
+    Time spent on requests (including retries) and on decoding pages is
+    recorded on timer as fetch.request and fetch.decode, and every retry
+    is counted in retries.
     """
 
     def __init__(
@@ -23,11 +30,14 @@ class OmiClient:
         base_url: str = "https://api.omi.me/v1/dev",
         max_retries: int = 5,
         page_size: int = 25,
+        timer: Optional[StageTimer] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.max_retries = max_retries
         self.page_size = page_size
+        self.timer = timer or StageTimer()
+        self.retries = 0
         self._client = httpx.Client(timeout=30.0)
 
     def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
@@ -44,11 +54,13 @@ class OmiClient:
 
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", "1"))
+                    self.retries += 1
                     time.sleep(retry_after)
                     continue
 
                 if response.status_code >= 500:
                     if attempt < self.max_retries:
+                        self.retries += 1
                         time.sleep(0.01 * (2 ** attempt))  # Fast backoff for tests
                         continue
                     raise OmiAPIError(f"Max retries exceeded: {response.status_code}")
@@ -58,40 +70,58 @@ class OmiClient:
 
             except httpx.HTTPError as e:
                 if attempt < self.max_retries:
+                    self.retries += 1
                     time.sleep(0.01 * (2 ** attempt))
                     continue
                 raise OmiAPIError(f"Request failed: {e}") from e
 
         raise OmiAPIError("Max retries exceeded")
 
-    def fetch_all_conversations(self) -> List[Dict[str, Any]]:
+    def iter_conversations(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Fetch all conversations with pagination.
+        Yield conversations one page at a time.
 
         PRD: GET /user/conversations?include_transcript=true
+
+        Only the current page is held in memory, so the sync engine can
+        start on the first page while later pages are still to come.
+        start_date and end_date narrow the fetch to a time window.
         """
-        all_conversations = []
         offset = 0
+        window = {}
+        if start_date is not None:
+            window["start_date"] = start_date.isoformat()
+        if end_date is not None:
+            window["end_date"] = end_date.isoformat()
 
         while True:
-            response = self._request(
-                "GET",
-                "/user/conversations",
-                params={
-                    "include_transcript": "true",
-                    "limit": self.page_size,
-                    "offset": offset,
-                },
-            )
-
-            page = response.json()
+            with self.timer.stage("fetch.request"):
+                response = self._request(
+                    "GET",
+                    "/user/conversations",
+                    params={
+                        "include_transcript": "true",
+                        "limit": self.page_size,
+                        "offset": offset,
+                        **window,
+                    },
+                )
+
+            with self.timer.stage("fetch.decode"):
+                page = response.json()
             if not page:
                 break
 
-            all_conversations.extend(page)
+            yield from page
             offset += self.page_size
 
-        return all_conversations
+    def fetch_all_conversations(self) -> List[Dict[str, Any]]:
+        """Fetch all conversations with pagination."""
+        return list(self.iter_conversations())
 
     def close(self):
         """Close the HTTP client."""
@@ -0,0 +1,202 @@
+"""Per-day conversation buckets for the streaming sync pipeline."""
+import json
+import tempfile
+from datetime import date as Date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from omi_sync.models import Conversation
+
+# Days this far behind the newest day seen are considered complete. One day
+# absorbs conversations that start before midnight and finish after it.
+FLUSH_WINDOW_DAYS = 1
+
+# Rough per-object overhead used by estimate_size, in bytes.
+_CONVERSATION_OVERHEAD = 2048
+_SEGMENT_OVERHEAD = 400
+
+# (raw API dict, parsed conversation or None when read back from disk)
+BucketItem = Tuple[Dict[str, Any], Optional[Conversation]]
+
+
+def estimate_size(data: Dict[str, Any]) -> int:
+    """Estimate the in-memory footprint of one raw conversation and its parse."""
+    size = _CONVERSATION_OVERHEAD
+    structured = data.get("structured") or {}
+    size += len(structured.get("title") or "") + len(structured.get("overview") or "")
+    for seg in data.get("transcript_segments") or []:
+        size += _SEGMENT_OVERHEAD + len(seg.get("text") or "")
+    return size
+
+
+class DayBuckets:
+    """
+    Open days of conversations, flushed once the stream has moved past them.
+
+    Conversations arrive in time order (either direction), so a day is
+    complete once a conversation more than flush_window_days beyond it, in
+    the direction of travel, has been seen. Completed days are returned by
+    ready() and retired by pop(); adding to a retired day returns False so
+    the caller can re-render it.
+
+    When max_memory (bytes) is set and open buckets exceed it, the largest
+    bucket is spilled to a JSON-lines file in a temporary directory and read
+    back when its day is popped. With retain_retired, popped days are kept on
+    disk too, so a retired day can be reloaded with load_retired().
+    """
+
+    def __init__(
+        self,
+        flush_window_days: int = FLUSH_WINDOW_DAYS,
+        max_memory: Optional[int] = None,
+        retain_retired: bool = False,
+    ):
+        self.flush_window_days = flush_window_days
+        self.max_memory = max_memory
+        self.retain_retired = retain_retired
+        self.spill_count = 0
+
+        self._open: Dict[str, Dict[str, Tuple[Dict[str, Any], Conversation, int]]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._memory = 0
+        self._on_disk: Set[str] = set()
+        self._retired: Set[str] = set()
+        self._ordinals: Dict[str, int] = {}
+        self._first: Optional[int] = None
+        self._lo = 0
+        self._hi = 0
+        self._direction = 0
+        self._tempdir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Remove spill files."""
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    @property
+    def memory(self) -> int:
+        """Estimated bytes held by open buckets."""
+        return self._memory
+
+    def is_retired(self, date: str) -> bool:
+        """True if the day has already been popped."""
+        return date in self._retired
+
+    def add(self, date: str, data: Dict[str, Any], conv: Conversation) -> bool:
+        """
+        Add a conversation to its day.
+
+        Returns False if the day was already retired; the conversation is
+        then only kept (on disk) when retain_retired is set.
+        """
+        if date in self._retired:
+            if self.retain_retired:
+                self._append(date, [data])
+            return False
+
+        self.discard(date, conv.id)
+        size = estimate_size(data)
+        self._open.setdefault(date, {})[conv.id] = (data, conv, size)
+        self._sizes[date] = self._sizes.get(date, 0) + size
+        self._memory += size
+        self._advance(date)
+
+        if self.max_memory is not None:
+            while self._memory > self.max_memory and self._spill_largest():
+                pass
+        return True
+
+    def discard(self, date: str, omi_id: str):
+        """Drop a conversation from an open day's in-memory bucket."""
+        bucket = self._open.get(date)
+        if bucket and omi_id in bucket:
+            size = bucket.pop(omi_id)[2]
+            self._sizes[date] -= size
+            self._memory -= size
+
+    def ready(self) -> List[str]:
+        """Open days the stream has moved past, oldest first."""
+        if self._direction > 0:
+            cutoff = self._hi - self.flush_window_days
+            return sorted(d for d in self._open if self._ordinals[d] < cutoff)
+        if self._direction < 0:
+            cutoff = self._lo + self.flush_window_days
+            return sorted((d for d in self._open if self._ordinals[d] > cutoff), reverse=True)
+        return []
+
+    def pop(self, date: str) -> List[BucketItem]:
+        """Retire a day and return everything collected for it."""
+        items: List[BucketItem] = []
+        if date in self._on_disk:
+            items.extend((data, None) for data in self._read(date))
+        bucket = self._open.pop(date, {})
+        items.extend((data, conv) for data, conv, _ in bucket.values())
+        self._memory -= self._sizes.pop(date, 0)
+        self._retired.add(date)
+
+        if self.retain_retired:
+            self._append(date, [data for data, _, _ in bucket.values()])
+        elif date in self._on_disk:
+            self._path(date).unlink()
+            self._on_disk.discard(date)
+        return items
+
+    def pop_remaining(self):
+        """Retire and yield every day still open, oldest first."""
+        for date in sorted(self._open):
+            yield date, self.pop(date)
+
+    def load_retired(self, date: str) -> List[BucketItem]:
+        """Read back a retired day kept on disk by retain_retired."""
+        if date not in self._on_disk:
+            return []
+        return [(data, None) for data in self._read(date)]
+
+    def _advance(self, date: str):
+        """Move the watermark and settle the direction of travel."""
+        ordinal = self._ordinals.get(date)
+        if ordinal is None:
+            ordinal = self._ordinals[date] = Date.fromisoformat(date).toordinal()
+        if self._first is None:
+            self._first = self._lo = self._hi = ordinal
+            return
+        self._lo = min(self._lo, ordinal)
+        self._hi = max(self._hi, ordinal)
+        if self._direction == 0 and ordinal != self._first:
+            self._direction = 1 if ordinal > self._first else -1
+
+    def _spill_largest(self) -> bool:
+        """Move the largest in-memory bucket to disk. Returns False if none left."""
+        date = max((d for d in self._open if self._open[d]), key=self._sizes.__getitem__, default=None)
+        if date is None:
+            return False
+        bucket = self._open[date]
+        self._append(date, [data for data, _, _ in bucket.values()])
+        bucket.clear()
+        self._memory -= self._sizes[date]
+        self._sizes[date] = 0
+        self.spill_count += 1
+        return True
+
+    def _path(self, date: str) -> Path:
+        if self._tempdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="omi-sync-spill-")
+        return Path(self._tempdir.name) / f"{date}.jsonl"
+
+    def _append(self, date: str, records: List[Dict[str, Any]]):
+        with open(self._path(date), "a", encoding="utf-8") as f:
+            for data in records:
+                f.write(json.dumps(data, ensure_ascii=False))
+                f.write("\n")
+        self._on_disk.add(date)
+
+    def _read(self, date: str) -> List[Dict[str, Any]]:
+        with open(self._path(date), encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
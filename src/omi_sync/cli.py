@@ -1,9 +1,5 @@
 """Omi to Obsidian sync CLI."""
 import click
-from dotenv import load_dotenv
-
-# Load .env file if present (looks in current directory and parents)
-load_dotenv()
 
 
 @click.group()
@@ -12,35 +8,108 @@ def main():
     pass
 
 
+def _load_config():
+    """
+    Load configuration, reading a .env file first if present.
+
+    dotenv searches the current directory and its parents, so it runs only
+    in commands that need configuration rather than at import time.
+    """
+    from dotenv import load_dotenv
+    from omi_sync.config import load_config
+
+    load_dotenv()
+    return load_config()
+
+
 @main.command()
-def run():
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Render days on this many workers.")
+@click.option("--pending", is_flag=True, help="Only re-sync days of pending conversations that are now final.")
+@click.option("--profile", is_flag=True, help="Profile the run into Omi/.omi-sync/profiles/.")
+@click.option("--wait", is_flag=True, help="If another sync holds the vault, wait for it, then sync only if there is new data.")
+def run(workers, pending, profile, wait):
     """Run one-shot sync."""
-    from omi_sync.config import load_config, ConfigError
+    import cProfile
+    import time
+    from datetime import datetime, timezone
+    from omi_sync.config import ConfigError
     from omi_sync.api_client import OmiClient, OmiAPIError
+    from omi_sync.lock import VaultLock
+    from omi_sync.metrics import build_metrics, record_run
+    from omi_sync.pending import has_new_data, sync_pending
+    from omi_sync.prefetch import prefetch
+    from omi_sync.profiling import StageTimer, write_profile
     from omi_sync.sync_engine import SyncEngine
 
     try:
-        config = load_config()
+        config = _load_config()
     except ConfigError as e:
         click.echo(f"Configuration Error: {e}", err=True)
         raise SystemExit(1)
+    if workers is not None:
+        config.render_workers = workers
 
     click.echo(f"Syncing to vault: {config.vault_path}")
 
-    try:
-        with OmiClient(config.api_key, config.api_base_url) as client:
-            api_data = client.fetch_all_conversations()
-
-        click.echo(f"Fetched {len(api_data)} conversations from API")
+    lock = VaultLock.for_vault(config.vault_path)
+    waited = False
+    if not lock.acquire(blocking=False):
+        holder = lock.holder()
+        click.echo(f"Another sync is running on this vault (pid {holder})" if holder else "Another sync is running on this vault")
+        if not wait:
+            click.echo("COALESCED")
+            return
+        click.echo("Waiting for it to finish")
+        lock.acquire()
+        waited = True
 
+    timer = StageTimer()
+    profiler = cProfile.Profile() if profile else None
+    started = time.perf_counter()
+    engine = None
+    client = None
+    result = None
+    status = "FAILED"
+    try:
+        # Loaded under the lock, so it includes the previous run's index
         engine = SyncEngine(config)
-        result = engine.sync(api_data)
+        with OmiClient(config.api_key, config.api_base_url, timer=timer) as client:
+            if waited and not has_new_data(engine.state, client, datetime.now(timezone.utc)):
+                status = "COALESCED"
+                click.echo("Nothing new since the previous sync")
+                click.echo(status)
+                return
+            if profiler:
+                profiler.enable()
+            try:
+                if pending:
+                    result = sync_pending(engine, client, datetime.now(timezone.utc), timer=timer)
+                else:
+                    # Pages stream into the engine, the next one fetched while this one renders
+                    result = engine.sync(prefetch(client.iter_conversations()), timer=timer)
+            finally:
+                if profiler:
+                    profiler.disable()
+        status = "DONE"
+
+        if profiler:
+            path = write_profile(profiler, engine.state.sync_dir / "profiles")
+            click.echo(f"Profile written to {path}")
+        if result is None:
+            click.echo("No pending conversations due")
+            click.echo("DONE")
+            return
 
         stats = result["stats"]
+        click.echo(f"Fetched {stats['conversations']} conversations from API")
         click.echo(f"Processed {stats['dates']} date(s)")
         click.echo(f"  Raw files: {stats['raw_files']}")
         click.echo(f"  Event files: {stats['event_files']}")
         click.echo(f"  Highlights files: {stats['highlights_files']}")
+        if profile:
+            click.echo("Stage timings:")
+            for stage, seconds in result["timings"].items():
+                click.echo(f"  {stage}: {seconds:.3f}s")
         click.echo("DONE")
 
     except OmiAPIError as e:
@@ -49,15 +118,94 @@ def run():
     except Exception as e:
         click.echo(f"Sync failed: {e}", err=True)
         raise SystemExit(1)
+    finally:
+        if engine is not None:
+            metrics = build_metrics(
+                status,
+                time.perf_counter() - started,
+                result,
+                api_retries=client.retries if client else 0,
+            )
+            record_run(metrics, engine.state.metrics_file, config.metrics_textfile)
+        lock.release()
+
+
+@main.command()
+@click.option("--interval", type=float, default=900, show_default=True, help="Seconds between idle syncs.")
+@click.option("--min-interval", type=float, default=60, show_default=True, help="Seconds between syncs while conversations arrive.")
+@click.option("--max-interval", type=float, default=3600, show_default=True, help="Longest back-off, also used in quiet hours.")
+@click.option("--quiet-hours", default="0-6", show_default=True, help="Local START-END hours to poll slowly; empty to disable.")
+@click.option("--overrides-poll", type=float, default=5, show_default=True, help="Seconds between checks for override edits; 0 to disable.")
+def daemon(interval, min_interval, max_interval, quiet_hours, overrides_poll):
+    """Run syncs continuously on an adaptive schedule."""
+    from omi_sync.config import ConfigError
+    from omi_sync.api_client import OmiClient
+    from omi_sync.daemon import SyncDaemon, parse_quiet_hours
+
+    try:
+        config = _load_config()
+        quiet = parse_quiet_hours(quiet_hours)
+    except (ConfigError, ValueError) as e:
+        click.echo(f"Configuration Error: {e}", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"Syncing to vault: {config.vault_path} (daemon)")
+    with OmiClient(config.api_key, config.api_base_url) as client:
+        sync_daemon = SyncDaemon(
+            config,
+            client,
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            quiet_hours=quiet,
+            log=click.echo,
+            overrides_poll=overrides_poll or None,
+        )
+        sync_daemon.install_signal_handlers()
+        sync_daemon.run_forever()
+
+
+@main.command("apply-overrides")
+def apply_overrides():
+    """Apply edits to the notable overrides file without a sync."""
+    from omi_sync.config import ConfigError
+    from omi_sync.lock import VaultLock
+    from omi_sync.sync_engine import SyncEngine
+
+    try:
+        config = _load_config()
+    except ConfigError as e:
+        click.echo(f"Configuration Error: {e}", err=True)
+        raise SystemExit(1)
+
+    lock = VaultLock.for_vault(config.vault_path)
+    if not lock.acquire(blocking=False):
+        click.echo("Waiting for the running sync to finish")
+        lock.acquire()
+    try:
+        result = SyncEngine(config).apply_override_changes()
+    finally:
+        lock.release()
+    if result is None:
+        click.echo("Overrides unchanged since they were last applied")
+        return
+    stats = result["stats"]
+    click.echo(
+        f"Reclassified {stats['reclassified']} conversations: "
+        f"{stats['event_files']} event notes written, {stats['events_deleted']} deleted, "
+        f"{stats['highlights_files']} Highlights files updated"
+    )
+    if stats["unavailable"]:
+        click.echo(f"{stats['unavailable']} conversations not stored locally; run sync to apply them")
 
 
 @main.command()
 def doctor():
     """Validate configuration."""
-    from omi_sync.config import load_config, ConfigError
+    from omi_sync.config import ConfigError
 
     try:
-        config = load_config()
+        config = _load_config()
         click.echo(f"API Key: {'*' * 8}...{config.api_key[-4:] if len(config.api_key) > 4 else '****'}")
         click.echo(f"Vault Path: {config.vault_path}")
         click.echo(f"API URL: {config.api_base_url}")
@@ -72,21 +220,55 @@ def doctor():
 
 
 @main.command("rebuild-index")
-def rebuild_index():
+@click.option("--workers", type=int, default=None, help="Scanner processes (default: one per CPU).")
+@click.option("--full", is_flag=True, help="Ignore the scan manifest and rescan every file.")
+def rebuild_index(workers, full):
     """Rebuild index from vault frontmatter."""
-    from omi_sync.config import load_config, ConfigError
+    from omi_sync.config import ConfigError
+    from omi_sync.lock import VaultLock
     from omi_sync.rebuild import rebuild_index_from_vault
 
     try:
-        config = load_config()
+        config = _load_config()
     except ConfigError as e:
         click.echo(f"Configuration Error: {e}", err=True)
         raise SystemExit(1)
 
     click.echo(f"Scanning vault: {config.vault_path}")
-    count = rebuild_index_from_vault(config)
+    lock = VaultLock.for_vault(config.vault_path)
+    if not lock.acquire(blocking=False):
+        click.echo("Waiting for the running sync to finish")
+        lock.acquire()
+    try:
+        count = rebuild_index_from_vault(config, workers=workers, full=full)
+    finally:
+        lock.release()
     click.echo(f"Rebuilt index with {count} entries")
 
 
+@main.command()
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Days checked in parallel.")
+def verify(workers):
+    """Check vault files against the index without re-rendering."""
+    from omi_sync.config import ConfigError
+    from omi_sync.verify import verify_vault
+
+    try:
+        config = _load_config()
+    except ConfigError as e:
+        click.echo(f"Configuration Error: {e}", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"Verifying vault: {config.vault_path}")
+    discrepancies = verify_vault(config, workers=workers)
+    for discrepancy in discrepancies:
+        click.echo(str(discrepancy))
+
+    if discrepancies:
+        click.echo(f"{len(discrepancies)} discrepancies found")
+        raise SystemExit(1)
+    click.echo("Vault matches index")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,75 @@
+"""Columnar conversation metadata, for checks run over a whole batch at once."""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Sequence
+
+from omi_sync.models import Conversation
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# finished_us of a conversation still recording: later than any cutoff
+STILL_RECORDING = 2 ** 63 - 1
+
+
+def epoch_us(dt: datetime) -> int:
+    """Exact microseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+@dataclass
+class ConversationColumns:
+    """
+    The fields the finalization and duration/action-item rules read, one list per field.
+
+    Times are integer microseconds rather than floats, so comparisons and
+    durations come out exactly as they do on the datetimes.
+    """
+    started_us: List[int]
+    finished_us: List[int]
+    action_items: List[int]
+
+    @classmethod
+    def of(cls, conversations: Sequence[Conversation]) -> "ConversationColumns":
+        return cls(
+            started_us=[epoch_us(c.started_at) for c in conversations],
+            finished_us=[
+                STILL_RECORDING if c.finished_at is None else epoch_us(c.finished_at)
+                for c in conversations
+            ],
+            action_items=[len(c.action_items) for c in conversations],
+        )
+
+    def __len__(self) -> int:
+        return len(self.finished_us)
+
+    def duration_minutes(self) -> List[int]:
+        """Conversation.duration_minutes for each row."""
+        np = optional_numpy()
+        if np is None:
+            return [
+                0 if f == STILL_RECORDING else int((f - s) / 1e6 / 60)
+                for s, f in zip(self.started_us, self.finished_us)
+            ]
+        started = np.asarray(self.started_us, dtype=np.int64)
+        finished = np.asarray(self.finished_us, dtype=np.int64)
+        minutes = np.trunc((finished - started) / 1e6 / 60).astype(np.int64)
+        return np.where(finished == STILL_RECORDING, 0, minutes).tolist()
+
+
+_NUMPY_MISSING = object()
+_np = None
+
+
+def optional_numpy():
+    """NumPy if installed, imported on first use (it is optional and slow to import)."""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = _NUMPY_MISSING
+    return None if _np is _NUMPY_MISSING else _np
@@ -2,7 +2,14 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 import os
-from typing import List
+from typing import List, Optional
+
+
+# Pool types DayRenderer can render days on
+EXECUTORS = ("process", "thread")
+
+# When vault writes are flushed to disk: never, once per run, or per file
+FSYNC_POLICIES = ("none", "batched", "strict")
 
 
 class ConfigError(Exception):
@@ -25,6 +32,21 @@ class Config:
         "1:1", "one-on-one", "standup", "retro", "planning", "interview",
         "doctor", "appointment"
     ])
+    # Keywords match whole words only, rather than anywhere in the text
+    notable_whole_words: bool = False
+    # Also look for the keywords in transcripts (cached per transcript hash)
+    notable_scan_transcript: bool = False
+    # Spill open day buckets to disk beyond this estimate (None = unbounded)
+    max_memory_mb: Optional[int] = None
+    # Render days on a pool of this many workers ("process" or "thread")
+    render_workers: int = 1
+    render_executor: str = "process"
+    # Prometheus textfile-collector file refreshed after every run
+    metrics_textfile: Optional[Path] = None
+    # One of FSYNC_POLICIES
+    fsync_policy: str = "batched"
+    # Writer threads staging files behind the renderer (0 = write inline)
+    write_workers: int = 2
 
 
 def load_config() -> Config:
@@ -41,6 +63,16 @@ def load_config() -> Config:
     if not vault_path.exists():
         raise ConfigError(f"OMI_VAULT_PATH does not exist: {vault_path}")
 
+    render_executor = os.environ.get("OMI_RENDER_EXECUTOR", "process")
+    if render_executor not in EXECUTORS:
+        raise ConfigError(
+            f"OMI_RENDER_EXECUTOR must be one of {', '.join(EXECUTORS)}: {render_executor}"
+        )
+
+    fsync_policy = os.environ.get("OMI_FSYNC", "batched")
+    if fsync_policy not in FSYNC_POLICIES:
+        raise ConfigError(f"OMI_FSYNC must be one of {', '.join(FSYNC_POLICIES)}: {fsync_policy}")
+
     return Config(
         api_key=api_key,
         vault_path=vault_path,
@@ -49,4 +81,35 @@ def load_config() -> Config:
         timezone=os.environ.get("OMI_TIMEZONE", "America/New_York"),
         notable_duration_minutes=int(os.environ.get("OMI_NOTABLE_DURATION_MINUTES", "25")),
         notable_action_items_min=int(os.environ.get("OMI_NOTABLE_ACTION_ITEMS_MIN", "2")),
+        **_notable_keywords(os.environ.get("OMI_NOTABLE_KEYWORDS")),
+        notable_whole_words=_flag(os.environ.get("OMI_NOTABLE_WHOLE_WORDS")),
+        notable_scan_transcript=_flag(os.environ.get("OMI_NOTABLE_SCAN_TRANSCRIPT")),
+        max_memory_mb=_optional_int(os.environ.get("OMI_MAX_MEMORY_MB")),
+        render_workers=int(os.environ.get("OMI_RENDER_WORKERS", "1")),
+        render_executor=render_executor,
+        metrics_textfile=_optional_path(os.environ.get("OMI_METRICS_TEXTFILE")),
+        fsync_policy=fsync_policy,
+        write_workers=int(os.environ.get("OMI_WRITE_WORKERS", "2")),
     )
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    """Parse an optional integer setting; empty means unset."""
+    return int(value) if value else None
+
+
+def _optional_path(value: Optional[str]) -> Optional[Path]:
+    """Parse an optional path setting; empty means unset."""
+    return Path(value).expanduser() if value else None
+
+
+def _notable_keywords(value: Optional[str]) -> dict:
+    """Comma-separated keywords replacing the defaults; unset or empty keeps them."""
+    if not value:
+        return {}
+    return {"notable_keywords": [k.strip() for k in value.split(",") if k.strip()]}
+
+
+def _flag(value: Optional[str]) -> bool:
+    """Parse a boolean setting: 1, true or yes (any case) is on."""
+    return (value or "").strip().lower() in ("1", "true", "yes")
@@ -0,0 +1,35 @@
+"""Synced conversations as fetched, kept for work done without the API."""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+
+class ConversationStore:
+    """
+    The API data of every synced conversation, one JSON file per local date.
+
+    Stored in conversations/ in Omi/.omi-sync/. SyncEngine writes a day's
+    file through the run journal together with its Raw file, so it holds
+    exactly the versions the vault was rendered from; notes can then be
+    rendered again (see SyncEngine.apply_override_changes) without a fetch.
+    """
+
+    def __init__(self, path: Path):
+        self.dir = path
+
+    def path(self, date: str) -> Path:
+        """File holding the conversations of a local date."""
+        return self.dir / f"{date}.json"
+
+    @staticmethod
+    def dumps(conversations: Iterable[Dict[str, Any]]) -> str:
+        """A day's file content: omi_id -> API data, in the order the day was rendered."""
+        return json.dumps({data["id"]: data for data in conversations}, separators=(",", ":"))
+
+    def load(self, date: str) -> Dict[str, Dict[str, Any]]:
+        """omi_id -> API data for a date; empty if the day was never stored or is unreadable."""
+        try:
+            with open(self.path(date), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            return {}
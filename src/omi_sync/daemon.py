@@ -0,0 +1,238 @@
+"""Long-running sync daemon with an adaptive scheduler."""
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pytz
+
+from omi_sync.config import Config
+from omi_sync.lock import VaultLock
+from omi_sync.metrics import build_metrics, record_run
+from omi_sync.pending import next_eligible_at, sync_pending
+from omi_sync.prefetch import prefetch
+from omi_sync.sync_engine import SyncEngine
+
+# Slack after a pending conversation's eligible_at before re-checking it
+PENDING_MARGIN = timedelta(seconds=30)
+
+
+class SyncDaemon:
+    """
+    Run syncs repeatedly in one process.
+
+    The API client, the engine (and with it the StateManager index and the
+    parsed overrides) stay resident between cycles, so each cycle costs one
+    fetch over a warm connection instead of a cold start.
+
+    The delay between cycles adapts to activity: min_interval while
+    conversations are arriving or waiting to finalize, then interval,
+    doubling on each idle cycle up to max_interval. During quiet_hours
+    (local start and end hour, in the configured timezone) the daemon
+    polls at max_interval.
+
+    The engine runs with skip_unchanged, so a cycle only rewrites the days
+    whose conversations changed since they were last written; a fast cycle
+    with nothing new costs the fetch and nothing else. wait(delay) sleeps
+    between cycles and returns early on stop().
+
+    Between full cycles, the daemon wakes when a pending conversation
+    becomes eligible and re-syncs just its days from a narrow fetch, so a
+    note appears about finalization_lag_minutes after the conversation ends.
+
+    With overrides_poll, the daemon also checks the overrides file every
+    overrides_poll seconds while it waits, and applies edits to it at once
+    (see SyncEngine.apply_override_changes) instead of at the next cycle.
+
+    The vault lock is held from run_forever() until the daemon stops, so
+    one-shot runs against the same vault coalesce instead of clobbering
+    the resident index.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        client: Any,
+        interval: float = 900,
+        min_interval: float = 60,
+        max_interval: float = 3600,
+        quiet_hours: Optional[Tuple[int, int]] = (0, 6),
+        log: Callable[[str], None] = lambda message: None,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        wait: Optional[Callable[[float], Any]] = None,
+        overrides_poll: Optional[float] = None,
+    ):
+        self.config = config
+        self.client = client
+        self.engine = SyncEngine(config, skip_unchanged=True)
+        self.lock = VaultLock(self.engine.state.sync_dir)
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.quiet_hours = quiet_hours
+        self.overrides_poll = overrides_poll
+        self.log = log
+        self.now = now
+        self.cycles = 0
+        self._idle_streak = 0
+        self._stop = threading.Event()
+        self.wait = wait or self._stop.wait
+
+    def stop(self, *args):
+        """Ask the daemon to exit after the current cycle. Usable as a signal handler."""
+        self._stop.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def install_signal_handlers(self):
+        """Stop gracefully on SIGTERM and SIGINT."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def run_forever(self, max_cycles: Optional[int] = None):
+        """Run cycles until stopped (or max_cycles is reached), then flush state."""
+        if not self.lock.acquire(blocking=False):
+            self.log("Another sync is running on this vault; waiting for it to finish")
+            self.lock.acquire()
+            # Pick up the index that run saved
+            self.engine = SyncEngine(self.config, skip_unchanged=True)
+        try:
+            while not self.stopping:
+                delay = self.run_cycle()
+                if max_cycles is not None and self.cycles >= max_cycles:
+                    break
+                self._wait_for_next_cycle(delay)
+        finally:
+            self.engine.state.save()
+            self.lock.release()
+            self.log("Daemon stopped")
+
+    def _wait_for_next_cycle(self, delay: float):
+        """Sleep until the next full cycle, running pending checks that fall due first."""
+        next_full = self.now() + timedelta(seconds=delay)
+        self.log(f"Next sync in {delay:.0f}s")
+        checked_until = None
+        while not self.stopping:
+            eligible = next_eligible_at(self.engine.state, after=checked_until)
+            if eligible is None or eligible + PENDING_MARGIN >= next_full:
+                self._sleep_until(next_full)
+                return
+            self._sleep_until(eligible + PENDING_MARGIN)
+            if self.stopping:
+                return
+            # Entries checked once and still pending wait for the full cycle
+            checked_until = max(eligible, self.now())
+            self.run_pending_cycle()
+
+    def _sleep_until(self, deadline: datetime):
+        """Wait until deadline, applying override edits every overrides_poll seconds."""
+        while not self.stopping:
+            remaining = max(0.0, (deadline - self.now()).total_seconds())
+            if self.overrides_poll is None or remaining <= self.overrides_poll:
+                self.wait(remaining)
+                return
+            self.wait(self.overrides_poll)
+            if not self.stopping:
+                self.apply_overrides()
+
+    def apply_overrides(self):
+        """Apply edits to the overrides file since it was last applied."""
+        try:
+            result = self.engine.apply_override_changes()
+        except Exception as e:
+            self.log(f"Applying overrides failed: {e}")
+            return
+        if result is not None:
+            stats = result["stats"]
+            self.log(
+                f"Applied overrides: {stats['reclassified']} reclassified, "
+                f"{stats['event_files']} event notes written, {stats['events_deleted']} deleted"
+            )
+
+    def run_pending_cycle(self):
+        """Re-sync the days of pending conversations that are now eligible."""
+        try:
+            result = self._recorded(lambda: sync_pending(self.engine, self.client, self.now()))
+        except Exception as e:
+            self.log(f"Pending sync failed: {e}")
+            return
+        if result is not None:
+            stats = result["stats"]
+            self.log(
+                f"Synced pending conversations: "
+                f"{stats['changed_conversations']} changed, {stats['not_finalized']} still pending"
+            )
+
+    def run_cycle(self) -> float:
+        """Fetch and sync once; return the delay before the next cycle."""
+        self.cycles += 1
+        try:
+            result = self._recorded(lambda: self.engine.sync(prefetch(self.client.iter_conversations())))
+        except Exception as e:
+            self.log(f"Sync failed: {e}")
+            return self.max_interval if self.in_quiet_hours() else self.interval
+
+        stats = result["stats"]
+        self.log(
+            f"Synced {stats['conversations']} conversations: "
+            f"{stats['changed_conversations']} changed, {stats['not_finalized']} pending"
+        )
+        return self.next_delay(stats)
+
+    def _recorded(self, sync: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Run a sync and add it to the metrics history, failed or not."""
+        started = time.perf_counter()
+        retries = getattr(self.client, "retries", 0)
+        result = None
+        status = "FAILED"
+        try:
+            result = sync()
+            status = "DONE"
+            return result
+        finally:
+            if status != "DONE" or result is not None:
+                metrics = build_metrics(
+                    status,
+                    time.perf_counter() - started,
+                    result,
+                    api_retries=getattr(self.client, "retries", 0) - retries,
+                )
+                record_run(metrics, self.engine.state.metrics_file, self.config.metrics_textfile)
+
+    def next_delay(self, stats: Dict[str, int]) -> float:
+        """Pick the delay before the next cycle from the last cycle's stats."""
+        active = stats.get("changed_conversations", 0) > 0 or stats.get("not_finalized", 0) > 0
+        if active:
+            self._idle_streak = 0
+        else:
+            self._idle_streak += 1
+
+        if self.in_quiet_hours():
+            return self.max_interval
+        if active:
+            return self.min_interval
+        return min(self.max_interval, self.interval * 2 ** (self._idle_streak - 1))
+
+    def in_quiet_hours(self) -> bool:
+        """True if the local time falls inside quiet_hours."""
+        if not self.quiet_hours:
+            return False
+        start, end = self.quiet_hours
+        hour = self.now().astimezone(pytz.timezone(self.config.timezone)).hour
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+
+
+def parse_quiet_hours(value: str) -> Optional[Tuple[int, int]]:
+    """Parse 'START-END' local hours; empty disables quiet hours."""
+    if not value:
+        return None
+    start, _, end = value.partition("-")
+    hours = (int(start), int(end))
+    if not all(0 <= h <= 23 for h in hours):
+        raise ValueError(f"Quiet hours must be between 0 and 23: {value}")
+    return hours
@@ -4,11 +4,15 @@ import os
 from pathlib import Path
 
 
-def write_file_atomic(path: Path, content: str):
+def write_file_atomic(path: Path, content: str, fsync: bool = False) -> int:
     """
     Write file atomically using temp file + rename.
 
     PRD: For deterministic file writes: write to temp then atomic rename.
+
+    With fsync, the data is flushed to disk before the rename and the
+    directory after it, so the new content survives a power loss.
+    Returns the number of bytes written.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -19,11 +23,34 @@ def write_file_atomic(path: Path, content: str):
         suffix=".md",
     )
 
+    data = content.encode("utf-8")
     try:
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(temp_path, path)
     except:
         if os.path.exists(temp_path):
             os.unlink(temp_path)
         raise
+    if fsync:
+        fsync_dir(path.parent)
+    return len(data)
+
+
+def fsync_file(path: Path):
+    """Flush a file's data to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_dir(path: Path):
+    """Flush a directory's entries (e.g. a rename into it) to disk, where supported."""
+    if os.name == "nt":
+        return  # Directories cannot be opened for fsync on Windows
+    fsync_file(path)
@@ -1,5 +1,7 @@
 """Finalization logic for avoiding mid-conversation partials."""
 from datetime import datetime, timezone, timedelta
+from typing import List, Optional
+from omi_sync.columns import ConversationColumns, epoch_us, optional_numpy
 from omi_sync.models import Conversation
 
 
@@ -23,3 +25,22 @@ def is_finalized(conv: Conversation, lag_minutes: int = 10) -> bool:
         finished = finished.replace(tzinfo=timezone.utc)
 
     return finished <= cutoff
+
+
+def finalized_mask(
+    columns: ConversationColumns,
+    lag_minutes: int = 10,
+    now: Optional[datetime] = None,
+) -> List[bool]:
+    """
+    is_finalized() for a batch, as one comparison against a single cutoff.
+
+    Vectorized with NumPy when it is installed. now defaults to the
+    current time, read once for the whole batch.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = epoch_us(now - timedelta(minutes=lag_minutes))
+    np = optional_numpy()
+    if np is None:
+        return [finished <= cutoff for finished in columns.finished_us]
+    return (np.asarray(columns.finished_us, dtype=np.int64) <= cutoff).tolist()
@@ -1,6 +1,49 @@
 """Frontmatter writer with stable key ordering."""
-import yaml
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Optional
+
+# PyYAML's emitter breaks a long scalar at a single space once past this
+# column, continuing it on the next line at _INDENT
+_WIDTH = 80
+_INDENT = 2
+
+_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# PyYAML's implicit resolvers (yaml/resolver.py): a string matching one of
+# these would read back as another type, so the emitter quotes it.
+_IMPLICIT = [
+    re.compile(r'''^(?:yes|Yes|YES|no|No|NO
+                    |true|True|TRUE|false|False|FALSE
+                    |on|On|ON|off|Off|OFF)$''', re.X),
+    re.compile(r'''^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?
+                    |\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?
+                    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*
+                    |[-+]?\.(?:inf|Inf|INF)
+                    |\.(?:nan|NaN|NAN))$''', re.X),
+    re.compile(r'''^(?:[-+]?0b[0-1_]+
+                    |[-+]?0[0-7_]+
+                    |[-+]?(?:0|[1-9][0-9_]*)
+                    |[-+]?0x[0-9a-fA-F_]+
+                    |[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+)$''', re.X),
+    re.compile(r'^(?:<<)$'),
+    re.compile(r'''^(?: ~
+                    |null|Null|NULL
+                    | )$''', re.X),
+    re.compile(r'''^(?:[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+                    |[0-9][0-9][0-9][0-9] -[0-9][0-9]? -[0-9][0-9]?
+                     (?:[Tt]|[ \t]+)[0-9][0-9]?
+                     :[0-9][0-9] :[0-9][0-9] (?:\.[0-9]*)?
+                     (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?)$''', re.X),
+    re.compile(r'^(?:=)$'),
+]
+
+# Characters the emitter escapes inside double quotes: everything outside
+# what it writes as-is with allow_unicode, plus line breaks
+_SPECIAL = re.compile("[^\x20-\x7e\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010fffe]|[\u2028\u2029\ufeff]")
+
+# What rules out a plain scalar in block context: an indicator at the start,
+# ": " or " #" inside, a document marker, or leading/trailing space
+_NOT_PLAIN = re.compile(r"""^(?:[#,\[\]{}&*!|>'"%@`]|[?-](?: |$)|---|\.\.\.| )|:(?: |$)| \#| $""")
 
 
 def write_frontmatter(data: Dict[str, Any]) -> str:
@@ -8,11 +51,110 @@ def write_frontmatter(data: Dict[str, Any]) -> str:
     Write YAML frontmatter with stable key ordering.
 
     PRD: Use a YAML frontmatter writer that preserves stable ordering of keys.
+
+    Our frontmatter is a flat mapping of strings, ints, bools and lists of
+    strings, which is emitted directly, byte-for-byte as yaml.dump would.
+    Anything else (other types, strings that need double quotes) goes
+    through yaml.dump.
     """
-    yaml_str = yaml.dump(
+    lines = _emit(data)
+    if lines is None:
+        return f"---\n{_yaml_dump(data)}---\n"
+    lines.append("---\n")
+    return "---\n" + "".join(lines)
+
+
+def _yaml_dump(data: Dict[str, Any]) -> str:
+    import yaml
+
+    return yaml.dump(
         data,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=True,
     )
-    return f"---\n{yaml_str}---\n"
+
+
+def _emit(data: Dict[str, Any]) -> Optional[List[str]]:
+    """The frontmatter lines, or None if yaml.dump is needed."""
+    if not data or not all(isinstance(key, str) for key in data):
+        return None
+    lines = []
+    for key in sorted(data):
+        if not _KEY.fullmatch(key) or _resolves(key):
+            return None
+        value = data[key]
+        if isinstance(value, list):
+            if not value:
+                lines.append(f"{key}: []\n")
+                continue
+            lines.append(f"{key}:\n")
+            for item in value:
+                scalar = _scalar(item)
+                if scalar is None:
+                    return None
+                lines.append(f"- {_fold(scalar, 2)}\n")
+        else:
+            scalar = _scalar(value)
+            if scalar is None:
+                return None
+            lines.append(f"{key}: {_fold(scalar, len(key) + 2)}\n")
+    return lines
+
+
+def _fold(scalar: str, column: int) -> str:
+    """
+    Break scalar, starting at column, where the emitter would.
+
+    That is at each lone space reached past _WIDTH, the space itself
+    replaced by the line break; in a quoted scalar, not at a space just
+    inside either quote.
+    """
+    if column + len(scalar) <= _WIDTH:
+        return scalar
+    quoted = scalar[0] == "'"
+    last = len(scalar) - 1
+    out = []
+    start = 0
+    for index, ch in enumerate(scalar):
+        if ch != " ":
+            continue
+        if (
+            column + index - start > _WIDTH
+            and scalar[index - 1] != " " and (index == last or scalar[index + 1] != " ")
+            and not (quoted and (index == 1 or index == last - 1))
+        ):
+            out.append(scalar[start:index])
+            out.append("\n" + " " * _INDENT)
+            column = _INDENT
+            start = index + 1
+    out.append(scalar[start:])
+    return "".join(out)
+
+
+def _scalar(value: Any) -> Optional[str]:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        return _string(value)
+    return None
+
+
+def _string(text: str) -> Optional[str]:
+    """text as a plain or single-quoted scalar, or None if it needs double quotes."""
+    if not text:
+        return "''"
+    if _SPECIAL.search(text):
+        return None
+    if _NOT_PLAIN.search(text) or _resolves(text):
+        return "'" + text.replace("'", "''") + "'"
+    return text
+
+
+def _resolves(text: str) -> bool:
+    """Whether text would be read back as something other than a string."""
+    return any(pattern.match(text) for pattern in _IMPLICIT)
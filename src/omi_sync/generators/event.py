@@ -1,35 +1,43 @@
 """Event note generator."""
 from datetime import datetime, timezone as tz
+from typing import Optional
 from omi_sync.models import Conversation
 from omi_sync.config import Config
 from omi_sync.frontmatter_writer import write_frontmatter
-from omi_sync.timezone_utils import get_local_date, format_time_local, format_datetime_local
-from omi_sync.slugify import slugify
+from omi_sync.local_times import LocalTimes
+from omi_sync.timezone_utils import epoch_seconds, format_datetime_local, zone_table
+from omi_sync.transcript_scan import TranscriptMatch
 from omi_sync.people import extract_people
 
 
-def get_event_filename(conv: Conversation, config: Config) -> str:
+def get_event_filename(conv: Conversation, config: Config, times: Optional[LocalTimes] = None) -> str:
     """
     Generate deterministic event filename.
 
     PRD: Omi/Events/YYYY-MM-DDTHHMMSS - <slug(title)> - <omi_id>.md
     """
-    local_date = get_local_date(conv.finished_at, config.timezone)
-    time_str = format_time_local(conv.finished_at, config.timezone).replace(":", "")
-    title_slug = slugify(conv.title)
+    return (times or LocalTimes.of(conv, config.timezone)).event_filename
 
-    return f"{local_date}T{time_str}00 - {title_slug} - {conv.id}.md"
 
-
-def generate_event_note(conv: Conversation, config: Config) -> str:
+def generate_event_note(
+    conv: Conversation,
+    config: Config,
+    generated_at: Optional[str] = None,
+    times: Optional[LocalTimes] = None,
+    transcript_match: Optional[TranscriptMatch] = None,
+) -> str:
     """
     Generate event note markdown content.
 
     PRD: Event note format (Section B).
+
+    times is the conversation's LocalTimes, if the caller already has it.
+    With transcript_match, the note says where in the transcript the
+    keyword that made the conversation notable was spoken.
     """
-    local_date = get_local_date(conv.finished_at, config.timezone)
-    time_str = format_time_local(conv.started_at, config.timezone)
-    raw_heading = f"{time_str} — {conv.title} (omi:{conv.id})"
+    times = times or LocalTimes.of(conv, config.timezone)
+    local_date = times.date
+    raw_heading = times.raw_heading
 
     # Build frontmatter
     frontmatter = write_frontmatter({
@@ -37,7 +45,7 @@ def generate_event_note(conv: Conversation, config: Config) -> str:
         "date": local_date,
         "duration_minutes": conv.duration_minutes,
         "finished_at": conv.finished_at.isoformat() if conv.finished_at else "",
-        "generated_at": format_datetime_local(datetime.now(tz.utc), config.timezone),
+        "generated_at": generated_at or format_datetime_local(datetime.now(tz.utc), config.timezone),
         "language": conv.language or "",
         "omi_id": conv.id,
         "omi_sync": True,
@@ -68,6 +76,14 @@ def generate_event_note(conv: Conversation, config: Config) -> str:
     else:
         lines.append("*No action items.*")
 
+    if transcript_match is not None:
+        lines.extend([
+            "",
+            "## Transcript Match",
+            "",
+            _transcript_match_line(conv, config, transcript_match, f"[[{local_date}#{raw_heading}]]"),
+        ])
+
     lines.extend([
         "",
         "## Link to Raw",
@@ -77,3 +93,13 @@ def generate_event_note(conv: Conversation, config: Config) -> str:
     ])
 
     return "\n".join(lines)
+
+
+def _transcript_match_line(conv: Conversation, config: Config, match: TranscriptMatch, raw_link: str) -> str:
+    """'"keyword" spoken by SPEAKER at HH:MM (M:SS in) → raw link'."""
+    segment = conv.transcript_segments[match.segment]
+    clock = zone_table(config.timezone).local_time(epoch_seconds(conv.started_at) + match.start)
+    minutes, seconds = divmod(int(match.start), 60)
+    hours, minutes = divmod(minutes, 60)
+    offset = f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+    return f'"{match.keyword}" spoken by {segment.speaker} at {clock} ({offset} in) → {raw_link}'
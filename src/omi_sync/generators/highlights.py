@@ -1,11 +1,11 @@
 """Highlights daily file generator."""
 from datetime import datetime, timezone as tz
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 from omi_sync.models import Conversation
 from omi_sync.config import Config
 from omi_sync.frontmatter_writer import write_frontmatter
-from omi_sync.timezone_utils import format_time_local, format_datetime_local
-from omi_sync.generators.event import get_event_filename
+from omi_sync.local_times import LocalTimes, local_times_for
+from omi_sync.timezone_utils import format_datetime_local
 from omi_sync.people import extract_people
 
 
@@ -14,14 +14,19 @@ def generate_highlights(
     date: str,
     notable_ids: Set[str],
     config: Config,
+    generated_at: Optional[str] = None,
+    times: Optional[Dict[str, LocalTimes]] = None,
 ) -> str:
     """
     Generate highlights daily markdown file content.
 
     PRD: Daily Highlights format (Section C).
+
+    times maps omi_id to LocalTimes already computed by the caller.
     """
     # Sort by started_at ascending
     sorted_convs = sorted(conversations, key=lambda c: c.started_at)
+    times = local_times_for(sorted_convs, config.timezone, times)
 
     # Extract all people
     all_people = set()
@@ -31,7 +36,7 @@ def generate_highlights(
     # Build frontmatter
     frontmatter = write_frontmatter({
         "date": date,
-        "generated_at": format_datetime_local(datetime.now(tz.utc), config.timezone),
+        "generated_at": generated_at or format_datetime_local(datetime.now(tz.utc), config.timezone),
         "omi_sync": True,
         "people": sorted(all_people),
         "source": "omi",
@@ -50,9 +55,9 @@ def generate_highlights(
     notable_convs = [c for c in sorted_convs if c.id in notable_ids]
     if notable_convs:
         for conv in notable_convs:
-            time_str = format_time_local(conv.started_at, config.timezone)
-            event_filename = get_event_filename(conv, config).replace(".md", "")
-            lines.append(f"- {time_str} — [[{event_filename}]]")
+            conv_times = times[conv.id]
+            event_filename = conv_times.event_filename.replace(".md", "")
+            lines.append(f"- {conv_times.start_time} — [[{event_filename}]]")
     else:
         lines.append("*No notable events.*")
 
@@ -64,12 +69,11 @@ def generate_highlights(
 
     # All conversations section
     for conv in sorted_convs:
-        time_str = format_time_local(conv.started_at, config.timezone)
-        heading = f"{time_str} — {conv.title} (omi:{conv.id})"
-        line = f"- {time_str} — {conv.title} → [[{date}#{heading}]]"
+        conv_times = times[conv.id]
+        line = f"- {conv_times.start_time} — {conv.title} → [[{date}#{conv_times.raw_heading}]]"
 
         if conv.id in notable_ids:
-            event_filename = get_event_filename(conv, config).replace(".md", "")
+            event_filename = conv_times.event_filename.replace(".md", "")
             line += f" | [[{event_filename}]]"
 
         lines.append(line)
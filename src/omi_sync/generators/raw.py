@@ -1,10 +1,11 @@
 """Raw daily file generator."""
 from datetime import datetime, timezone as tz
-from typing import List
+from typing import Dict, List, Optional
 from omi_sync.models import Conversation
 from omi_sync.config import Config
 from omi_sync.frontmatter_writer import write_frontmatter
-from omi_sync.timezone_utils import format_time_local, format_datetime_local
+from omi_sync.local_times import LocalTimes, local_times_for
+from omi_sync.timezone_utils import format_datetime_local
 from omi_sync.people import extract_people
 
 
@@ -12,14 +13,19 @@ def generate_raw_daily(
     conversations: List[Conversation],
     date: str,
     config: Config,
+    generated_at: Optional[str] = None,
+    times: Optional[Dict[str, LocalTimes]] = None,
 ) -> str:
     """
     Generate raw daily markdown file content.
 
     PRD: Daily Raw file format (Section A).
+
+    times maps omi_id to LocalTimes already computed by the caller.
     """
     # Sort by started_at ascending
     sorted_convs = sorted(conversations, key=lambda c: c.started_at)
+    times = local_times_for(sorted_convs, config.timezone, times)
 
     # Extract all people from all conversations
     all_people = set()
@@ -29,7 +35,7 @@ def generate_raw_daily(
     # Build frontmatter
     frontmatter = write_frontmatter({
         "date": date,
-        "generated_at": format_datetime_local(datetime.now(tz.utc), config.timezone),
+        "generated_at": generated_at or format_datetime_local(datetime.now(tz.utc), config.timezone),
         "omi_sync": True,
         "people": sorted(all_people),
         "source": "omi",
@@ -44,9 +50,7 @@ def generate_raw_daily(
     ]
 
     for conv in sorted_convs:
-        time_str = format_time_local(conv.started_at, config.timezone)
-        heading = f"## {time_str} — {conv.title} (omi:{conv.id})"
-        lines.append(heading)
+        lines.append(f"## {times[conv.id].raw_heading}")
         lines.append("")
 
         # Metadata bullets
@@ -0,0 +1,58 @@
+"""Content hashes recorded in the index and checked by verify."""
+import hashlib
+import io
+import re
+from typing import BinaryIO, Dict, Iterable, Tuple
+
+RAW_HEADING_LINE = re.compile(r"## ((\d{2}:\d{2}) — (.+?) \(omi:([^)]+)\))")
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 hex digest of UTF-8 text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_stream(f: BinaryIO, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a binary stream, read in chunks."""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def raw_section_hashes(lines: Iterable[bytes]) -> Dict[str, Tuple[str, str]]:
+    """
+    Hash each conversation section of a Raw daily file in one pass.
+
+    A section runs from its '## HH:MM — Title (omi:<id>)' line up to the
+    next '## ' line or the end of the file. Lines are the file's exact
+    bytes split on '\n' only, endings kept, as iterating a file opened in
+    binary mode yields them; a '\r' inside a transcript is hashed as-is.
+    Returns omi_id -> (heading, SHA-256 of the section).
+    """
+    sections: Dict[str, Tuple[str, str]] = {}
+    current = None
+    digest = None
+    heading = None
+
+    for line in lines:
+        if line.startswith(b"## "):
+            if current is not None:
+                sections[current] = (heading, digest.hexdigest())
+            match = RAW_HEADING_LINE.match(line.decode("utf-8"))
+            if match:
+                heading, current = match.group(1), match.group(4)
+                digest = hashlib.sha256()
+            else:
+                current = None
+        if current is not None:
+            digest.update(line)
+
+    if current is not None:
+        sections[current] = (heading, digest.hexdigest())
+    return sections
+
+
+def raw_text_section_hashes(text: str) -> Dict[str, Tuple[str, str]]:
+    """raw_section_hashes for rendered text, hashed as the UTF-8 bytes written."""
+    return raw_section_hashes(io.BytesIO(text.encode("utf-8")))
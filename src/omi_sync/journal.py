@@ -0,0 +1,190 @@
+"""Run journal: stage a sync's vault changes and apply them together."""
+import json
+import os
+import shutil
+import threading
+from itertools import count
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from omi_sync.config import FSYNC_POLICIES
+from omi_sync.file_writer import fsync_dir, fsync_file
+from omi_sync.state import IndexEntry
+
+# Staged files and the journal itself live in this directory under sync_dir
+JOURNAL_DIR = "journal"
+JOURNAL_FILE = "journal.jsonl"
+
+
+class RunJournal:
+    """
+    Stage a run's file writes and deletions, then apply them in one step.
+
+    During a run, rendered files are written to the journal directory
+    (same filesystem as the vault, so applying is a rename) and every
+    intended change is appended to journal.jsonl as it is decided: a write
+    ({"write": target, "staged": name}), a deletion ({"delete": target}) or
+    a day's index entries ({"entries": [...]}). Targets are relative to the
+    vault. At the end the changes are applied, the index is saved, and the
+    journal is cleared.
+
+    After a crash, roll_forward() applies whatever the journal recorded,
+    from the staged files, and returns the index entries for the caller
+    to merge, so completed days are not rendered again. Applying keeps
+    only the last change per target, which makes it safe to repeat.
+
+    fsync sets durability: with "strict" every staged file, journal record
+    and rename is flushed to disk as it happens; with "batched" apply()
+    flushes the staged files and the journal once before renaming, and
+    each directory renamed into once afterwards, so a power loss at any
+    point leaves either the old files or a journal that rolls forward to
+    the new ones; with "none" nothing is flushed.
+
+    stage(), reserve() and write_staged() may be called from writer
+    threads; everything else runs on the sync's main thread.
+    """
+
+    def __init__(self, sync_dir: Path, vault_path: Path, fsync: str = "none"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.dir = sync_dir / JOURNAL_DIR
+        self.path = self.dir / JOURNAL_FILE
+        self.vault_path = vault_path
+        self.fsync = fsync
+        self._records: List[Dict] = []
+        self._file = None
+        self._names = count()
+        self._names_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the journal file; what was recorded stays on disk until clear()."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stage(self, target: Path, content: str) -> Tuple[str, int]:
+        """Write content for target into the journal; return the staged name and byte count."""
+        staged = self.reserve()
+        return staged, self.write_staged(staged, content)
+
+    def reserve(self) -> str:
+        """A new staged file name, for write_staged() to fill later."""
+        with self._names_lock:
+            return f"staged_{next(self._names):06d}.md"
+
+    def write_staged(self, staged: str, content: str) -> int:
+        """
+        Write a reserved staged file; return the byte count.
+
+        The file only appears under its name once complete, so roll_forward()
+        never applies a partial one.
+        """
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / staged
+        partial = path.with_suffix(".part")
+        data = content.encode("utf-8")
+        with open(partial, "wb") as f:
+            f.write(data)
+            if self.fsync == "strict":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(partial, path)
+        return len(data)
+
+    def record_write(self, target: Path, staged: str):
+        """Record that a staged file replaces target."""
+        self._append({"write": self._relative(target), "staged": staged})
+
+    def record_delete(self, target: Path):
+        """Record that target is to be removed."""
+        self._append({"delete": self._relative(target)})
+
+    def record_entries(self, entries: List[IndexEntry]):
+        """Record index entries written by this run."""
+        if entries:
+            self._append({"entries": [asdict(e) for e in entries]})
+
+    def apply(self) -> int:
+        """Apply the recorded changes to the vault; return how many targets changed."""
+        self.close()
+        if self.fsync == "batched" and self._records:
+            for record in self._records:
+                if "write" in record:
+                    fsync_file(self.dir / record["staged"])
+            fsync_file(self.path)
+            fsync_dir(self.dir)
+        return self._apply(self._records)
+
+    def roll_forward(self) -> Optional[List[IndexEntry]]:
+        """
+        Finish the changes of a run that did not complete.
+
+        Returns its index entries, in the order recorded, or None if there
+        was no journal. A truncated last line (a crash mid-append) is ignored.
+        """
+        if not self.path.exists():
+            if self.dir.exists():
+                self.clear()  # Staged files of a run that recorded nothing
+            return None
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        self._apply(records)
+        return [IndexEntry(**data) for r in records for data in r.get("entries", [])]
+
+    def clear(self):
+        """Remove the journal and any staged files left over."""
+        self.close()
+        self._records = []
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _append(self, record: Dict):
+        if self._file is None:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, sort_keys=True) + "\n")
+        self._file.flush()
+        if self.fsync == "strict":
+            os.fsync(self._file.fileno())
+        self._records.append(record)
+
+    def _apply(self, records: List[Dict]) -> int:
+        # Only the last change to each target counts
+        final: Dict[str, Optional[str]] = {}
+        for record in records:
+            if "write" in record:
+                final[record["write"]] = record["staged"]
+            elif "delete" in record:
+                final[record["delete"]] = None
+        touched = set()
+        for target, staged in final.items():
+            path = self.vault_path / target
+            if staged is None:
+                path.unlink(missing_ok=True)
+            else:
+                source = self.dir / staged
+                if not source.exists():  # Applied before a crash
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, path)
+            if self.fsync == "strict":
+                fsync_dir(path.parent)
+            touched.add(path.parent)
+        if self.fsync == "batched":
+            for directory in sorted(touched):
+                fsync_dir(directory)
+        return len(final)
+
+    def _relative(self, target: Path) -> str:
+        return Path(target).relative_to(self.vault_path).as_posix()
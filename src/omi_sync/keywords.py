@@ -0,0 +1,80 @@
+"""Keyword matching compiled into a single regular expression."""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    Find any of a list of keywords in text, case-insensitively, in one pass.
+
+    The keywords are compiled into one alternation regex shaped as a trie
+    ("therapy" and "therapist" become "therap(?:ist|y)"), so at each
+    position of the text the regex follows one path of shared prefixes
+    instead of trying every keyword in turn. Hundreds of keywords (people,
+    projects, clients) cost about as much as a handful.
+
+    Matching follows `keyword.lower() in text.lower()`: a keyword matches
+    anywhere, inside words too, unless whole_words is set, in which case it
+    must not be preceded or followed by a letter, digit or underscore.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        self.whole_words = whole_words
+        # Lowercased form -> keyword as configured (the first, if several fold together)
+        self._keywords: Dict[str, str] = {}
+        for keyword in keywords:
+            self._keywords.setdefault(keyword.lower(), keyword)
+        self._pattern: Optional[re.Pattern] = None
+        if self._keywords:
+            pattern = _trie_pattern(self._keywords)
+            if whole_words:
+                pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+            self._pattern = re.compile(pattern)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    @property
+    def keywords(self) -> List[str]:
+        """The keywords as configured, one per case-insensitive duplicate."""
+        return list(self._keywords.values())
+
+    def search(self, text: str) -> Optional[str]:
+        """The first keyword found in text (as configured), or None."""
+        return self.search_lower(text.lower())
+
+    def search_lower(self, text: str) -> Optional[str]:
+        """search() for text that is already lowercased."""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return None if match is None else self._keywords[match.group()]
+
+    def find_lower(self, text: str) -> Optional[Tuple[str, int]]:
+        """search_lower(), also returning where in text the keyword starts."""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return None if match is None else (self._keywords[match.group()], match.start())
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """An alternation matching exactly the given words, with common prefixes factored out."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # End of a word
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # A word ends here: the longer ones are optional (tried first, being greedy)
+            return f"(?:{group})?"
+        return group
+
+    return build(trie)
@@ -0,0 +1,70 @@
+"""A conversation's local-time strings, computed once and shared by the generators."""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, Optional
+
+from omi_sync.models import Conversation
+from omi_sync.slugify import slugify
+from omi_sync.timezone_utils import epoch_seconds, zone_table
+
+
+@dataclass
+class LocalTimes:
+    """
+    Everything the generators and the index derive from a conversation's times.
+
+    Built once per conversation per run (see of()), then passed to the Raw,
+    event and Highlights generators so the timezone conversion and
+    formatting are not repeated in each of them.
+    """
+    omi_id: str
+    title: str
+    # Local date of finished_at (YYYY-MM-DD): the day the conversation is filed under
+    date: str
+    # Local HH:MM of started_at, as shown in headings and lists
+    start_time: str
+    # Heading of the conversation's section in the Raw file
+    raw_heading: str
+    # Local HHMM of finished_at, for the event filename
+    finished_hhmm: str
+
+    @classmethod
+    def of(cls, conv: Conversation, timezone_name: str) -> "LocalTimes":
+        table = zone_table(timezone_name)
+        finished = epoch_seconds(conv.finished_at)
+        start_time = table.local_time(epoch_seconds(conv.started_at))
+        return cls(
+            omi_id=conv.id,
+            title=conv.title,
+            date=table.local_date(finished),
+            start_time=start_time,
+            raw_heading=f"{start_time} — {conv.title} (omi:{conv.id})",
+            finished_hhmm=table.local_time(finished).replace(":", ""),
+        )
+
+    @cached_property
+    def event_filename(self) -> str:
+        """
+        Deterministic event filename.
+
+        PRD: Omi/Events/YYYY-MM-DDTHHMMSS - <slug(title)> - <omi_id>.md
+
+        Computed on first use, since only notable conversations need it.
+        """
+        return f"{self.date}T{self.finished_hhmm}00 - {slugify(self.title)} - {self.omi_id}.md"
+
+
+def local_times_for(
+    conversations: Iterable[Conversation],
+    timezone_name: str,
+    times: Optional[Dict[str, LocalTimes]] = None,
+) -> Dict[str, LocalTimes]:
+    """LocalTimes per omi_id: those given in times, computed for the rest."""
+    missing = [conv for conv in conversations if not times or conv.id not in times]
+    if times and not missing:
+        return times
+    result = dict(times) if times else {}
+    for conv in missing:
+        result[conv.id] = LocalTimes.of(conv, timezone_name)
+    return result
+
@@ -0,0 +1,70 @@
+"""Vault-scoped run lock, so overlapping syncs coalesce instead of racing."""
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class VaultLock:
+    """
+    Exclusive flock on Omi/.omi-sync/run.lock.
+
+    Held for the whole of a run (and for the lifetime of a daemon), so two
+    processes never fetch, render and save the index of one vault at the
+    same time. The holder's pid is written into the file for diagnostics.
+    The operating system drops the lock when the holder exits, so a crashed
+    run never leaves the vault locked. Where fcntl is unavailable, locking
+    always succeeds.
+    """
+
+    def __init__(self, sync_dir: Path):
+        self.path = sync_dir / "run.lock"
+        self._fd: Optional[int] = None
+
+    @classmethod
+    def for_vault(cls, vault_path: Path) -> "VaultLock":
+        """The lock for a vault, usable before its StateManager is loaded."""
+        return cls(vault_path / "Omi" / ".omi-sync")
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock, waiting for the current holder if blocking; False if it is taken."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                os.close(fd)
+                return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        """Drop the lock; closing the descriptor releases the flock."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def holder(self) -> Optional[int]:
+        """Pid recorded by the current (or last) holder, if readable."""
+        try:
+            return int(self.path.read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
@@ -0,0 +1,88 @@
+"""Scan manifest for incremental rebuild-index."""
+import json
+import os
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class ManifestEntry:
+    """Last scan of one vault file, keyed by its vault-relative path."""
+    size: int
+    mtime_ns: int
+    content_hash: str
+    result: Any = None
+
+
+class ScanManifest:
+    """
+    Record of (path, size, mtime_ns, content hash) for scanned vault files.
+
+    Stored as manifest.json in Omi/.omi-sync/ next to the index. Each entry
+    also caches what the scan extracted from the file, so unchanged files
+    can be reused without being parsed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._load()
+
+    def _load(self):
+        """Load manifest from file, ignoring unreadable or outdated data."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        if data.get("version") != self.VERSION:
+            return
+        for rel_path, entry_data in data.get("files", {}).items():
+            self._entries[rel_path] = ManifestEntry(**entry_data)
+
+    def save(self):
+        """Save manifest to disk."""
+        data = {
+            "version": self.VERSION,
+            "files": {k: asdict(v) for k, v in self._entries.items()},
+        }
+        with open(self.path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    def get(self, rel_path: str) -> Optional[ManifestEntry]:
+        """Get the recorded entry for a path."""
+        return self._entries.get(rel_path)
+
+    def is_unchanged(self, rel_path: str, st: os.stat_result) -> bool:
+        """True if the file's size and mtime match the recorded scan."""
+        entry = self._entries.get(rel_path)
+        return (
+            entry is not None
+            and entry.size == st.st_size
+            and entry.mtime_ns == st.st_mtime_ns
+        )
+
+    def record(self, rel_path: str, st: os.stat_result, content_hash: str, result: Any):
+        """Record a fresh scan of a file."""
+        self._entries[rel_path] = ManifestEntry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            content_hash=content_hash,
+            result=result,
+        )
+
+    def clear(self):
+        """Forget every recorded file."""
+        self._entries.clear()
+
+    def retain(self, rel_paths):
+        """Drop entries for files that are no longer present."""
+        keep = set(rel_paths)
+        for rel_path in list(self._entries):
+            if rel_path not in keep:
+                del self._entries[rel_path]
@@ -0,0 +1,126 @@
+"""Machine-readable run metrics: JSON-lines history and Prometheus textfile."""
+import json
+import sys
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from omi_sync.file_writer import write_file_atomic
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Prefix of every Prometheus metric name
+PROMETHEUS_PREFIX = "omi_sync"
+
+# Run statuses counted as success; a coalesced run deferred to another one
+SUCCESS_STATUSES = ("DONE", "COALESCED")
+
+
+@dataclass
+class RunMetrics:
+    """One sync run, as recorded in the metrics history."""
+    finished_at: str
+    status: str
+    duration_seconds: float
+    conversations_fetched: int = 0
+    conversations_not_final: int = 0
+    days_rendered: int = 0
+    days_skipped: int = 0
+    files_written: int = 0
+    bytes_written: int = 0
+    writes_skipped: int = 0
+    api_retries: int = 0
+    peak_rss_bytes: Optional[int] = None
+    # Seconds per stage, as in the engine result's "timings"
+    stages: Dict[str, float] = field(default_factory=dict)
+
+
+def build_metrics(
+    status: str,
+    duration_seconds: float,
+    result: Optional[Dict[str, Any]] = None,
+    api_retries: int = 0,
+) -> RunMetrics:
+    """Assemble a run's metrics from an engine result (None if the run failed early)."""
+    stats = (result or {}).get("stats", {})
+    return RunMetrics(
+        finished_at=datetime.now(timezone.utc).isoformat(),
+        status=status,
+        duration_seconds=duration_seconds,
+        conversations_fetched=stats.get("conversations", 0),
+        conversations_not_final=stats.get("not_finalized", 0),
+        days_rendered=stats.get("dates", 0),
+        days_skipped=stats.get("skipped_dates", 0),
+        files_written=stats.get("files_written", 0),
+        bytes_written=stats.get("bytes_written", 0),
+        writes_skipped=stats.get("writes_skipped", 0),
+        api_retries=api_retries,
+        peak_rss_bytes=peak_rss_bytes(),
+        stages=dict((result or {}).get("timings", {})),
+    )
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def append_history(metrics: RunMetrics, path: Path):
+    """Append one JSON line to the metrics history."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(asdict(metrics), sort_keys=True))
+        f.write("\n")
+
+
+def format_prometheus(metrics: RunMetrics) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    p = PROMETHEUS_PREFIX
+    finished = datetime.fromisoformat(metrics.finished_at).timestamp()
+    gauges = [
+        ("last_run_timestamp_seconds", "Unix time the last run finished.", finished),
+        ("last_run_success", "1 if the last run succeeded or coalesced, else 0.", int(metrics.status in SUCCESS_STATUSES)),
+        ("last_run_duration_seconds", "Wall time of the last run.", metrics.duration_seconds),
+        ("last_run_conversations_fetched", "Conversations fetched by the last run.", metrics.conversations_fetched),
+        ("last_run_conversations_not_final", "Conversations still inside the finalization lag.", metrics.conversations_not_final),
+        ("last_run_days_rendered", "Days rendered by the last run.", metrics.days_rendered),
+        ("last_run_days_skipped", "Days skipped as unchanged by the last run.", metrics.days_skipped),
+        ("last_run_files_written", "Files written by the last run.", metrics.files_written),
+        ("last_run_bytes_written", "Bytes written by the last run.", metrics.bytes_written),
+        ("last_run_writes_skipped", "File writes avoided by the last run.", metrics.writes_skipped),
+        ("last_run_api_retries", "API request retries in the last run.", metrics.api_retries),
+    ]
+    if metrics.peak_rss_bytes is not None:
+        gauges.append(("last_run_peak_rss_bytes", "Peak resident memory of the last run.", metrics.peak_rss_bytes))
+
+    lines = []
+    for name, help_text, value in gauges:
+        lines.append(f"# HELP {p}_{name} {help_text}")
+        lines.append(f"# TYPE {p}_{name} gauge")
+        lines.append(f"{p}_{name} {value}")
+    if metrics.stages:
+        lines.append(f"# HELP {p}_last_run_stage_seconds Seconds spent per pipeline stage in the last run.")
+        lines.append(f"# TYPE {p}_last_run_stage_seconds gauge")
+        for stage, seconds in sorted(metrics.stages.items()):
+            lines.append(f'{p}_last_run_stage_seconds{{stage="{stage}"}} {seconds}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(metrics: RunMetrics, path: Path):
+    """Replace a node_exporter textfile-collector file atomically."""
+    write_file_atomic(path, format_prometheus(metrics))
+
+
+def record_run(metrics: RunMetrics, history_path: Path, textfile_path: Optional[Path] = None):
+    """Append to the history and, if configured, refresh the Prometheus textfile."""
+    append_history(metrics, history_path)
+    if textfile_path is not None:
+        write_prometheus_textfile(metrics, textfile_path)
@@ -2,7 +2,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
-from dateutil import parser as date_parser
 
 
 @dataclass
@@ -54,6 +53,13 @@ class Conversation:
         return int(delta.total_seconds() / 60)
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API."""
+    # Imported on first use so commands that never parse conversations skip it
+    from dateutil import parser as date_parser
+    return date_parser.isoparse(value)
+
+
 def parse_conversation(data: dict) -> Conversation:
     """Parse a conversation from API response."""
     structured = data.get("structured") or {}
@@ -86,11 +92,11 @@ def parse_conversation(data: dict) -> Conversation:
 
     finished_at = None
     if data.get("finished_at"):
-        finished_at = date_parser.isoparse(data["finished_at"])
+        finished_at = _parse_timestamp(data["finished_at"])
 
     return Conversation(
         id=data["id"],
-        started_at=date_parser.isoparse(data["started_at"]),
+        started_at=_parse_timestamp(data["started_at"]),
         finished_at=finished_at,
         language=data.get("language", ""),
         source=data.get("source", ""),
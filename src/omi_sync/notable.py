@@ -1,9 +1,14 @@
 """Notable conversation classification."""
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from omi_sync.columns import ConversationColumns, optional_numpy
+from omi_sync.keywords import KeywordMatcher
 from omi_sync.models import Conversation
 from omi_sync.config import Config
+from omi_sync.rules import RuleSet
+from omi_sync.transcript_scan import TranscriptMatch, TranscriptScanner
 
 
 def load_overrides(path: Path) -> Dict[str, bool]:
@@ -17,10 +22,21 @@ def load_overrides(path: Path) -> Dict[str, bool]:
         return {}
 
 
+def overrides_mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of the overrides file, or None if there is none."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def is_notable(
     conv: Conversation,
     config: Config,
     overrides: Optional[Dict[str, bool]] = None,
+    keywords: Optional[KeywordMatcher] = None,
+    transcripts: Optional[TranscriptScanner] = None,
+    rules: Optional[RuleSet] = None,
 ) -> bool:
     """
     Determine if a conversation is notable.
@@ -29,12 +45,49 @@ def is_notable(
     1. Duration >= NOTABLE_DURATION_MINUTES
     2. Action items count >= NOTABLE_ACTION_ITEMS_MIN
     3. Keyword match in title or overview
-    4. Manual overrides (applied last)
+    4. Keyword spoken in the transcript (only with a TranscriptScanner,
+       see Config.notable_scan_transcript)
+    5. Manual overrides (applied last)
+
+    rules, compiled from a rules file (see rules.py), replaces rules 1-3.
+    keywords is config's keyword list compiled by keyword_matcher(); callers
+    classifying many conversations pass it in to skip the cache lookup.
+    """
+    return notable_match(conv, config, overrides, keywords, transcripts, rules)[0]
+
+
+def notable_match(
+    conv: Conversation,
+    config: Config,
+    overrides: Optional[Dict[str, bool]] = None,
+    keywords: Optional[KeywordMatcher] = None,
+    transcripts: Optional[TranscriptScanner] = None,
+    rules: Optional[RuleSet] = None,
+) -> Tuple[bool, Optional[TranscriptMatch]]:
+    """
+    is_notable(), plus the transcript match when rule 4 is what decided it.
+
+    The transcript is only scanned once the cheaper rules have all failed.
     """
     # Check override first (applied last means it takes precedence)
     if overrides and conv.id in overrides:
-        return overrides[conv.id]
+        return overrides[conv.id], None
 
+    if rules is not None:
+        if rules.matches(conv):
+            return True, None
+    elif _builtin_rules(conv, config, keywords):
+        return True, None
+
+    # Rule 4: Keyword spoken in the transcript
+    if transcripts is not None:
+        match = transcripts.scan(conv)
+        return match is not None, match
+    return False, None
+
+
+def _builtin_rules(conv: Conversation, config: Config, keywords: Optional[KeywordMatcher]) -> bool:
+    """Rules 1-3, with thresholds and keywords from config."""
     # Rule 1: Duration
     if conv.duration_minutes >= config.notable_duration_minutes:
         return True
@@ -44,9 +97,77 @@ def is_notable(
         return True
 
     # Rule 3: Keyword match (case-insensitive)
-    text_to_search = f"{conv.title} {conv.overview}".lower()
-    for keyword in config.notable_keywords:
-        if keyword.lower() in text_to_search:
-            return True
+    return matches_keyword(conv, config, keywords)
+
 
-    return False
+def keyword_matcher(config: Config) -> KeywordMatcher:
+    """config's notable keywords, compiled (and cached while they stay the same)."""
+    return _compile(tuple(config.notable_keywords), config.notable_whole_words)
+
+
+@lru_cache(maxsize=16)
+def _compile(keywords: Tuple[str, ...], whole_words: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, whole_words)
+
+
+def matched_keyword(
+    conv: Conversation, config: Config, keywords: Optional[KeywordMatcher] = None
+) -> Optional[str]:
+    """Rule 3: the notable keyword found in the title or overview, if any."""
+    keywords = keywords or keyword_matcher(config)
+    return keywords.search(f"{conv.title} {conv.overview}")
+
+
+def matches_keyword(conv: Conversation, config: Config, keywords: Optional[KeywordMatcher] = None) -> bool:
+    """Rule 3: a notable keyword appears in the title or overview (case-insensitive)."""
+    return matched_keyword(conv, config, keywords) is not None
+
+
+def rule_mask(columns: ConversationColumns, config: Config) -> List[bool]:
+    """Rules 1 and 2 (duration, action items) for a batch, vectorized with NumPy when installed."""
+    minutes = columns.duration_minutes()
+    np = optional_numpy()
+    if np is None:
+        return [
+            m >= config.notable_duration_minutes or items >= config.notable_action_items_min
+            for m, items in zip(minutes, columns.action_items)
+        ]
+    return (
+        (np.asarray(minutes, dtype=np.int64) >= config.notable_duration_minutes)
+        | (np.asarray(columns.action_items, dtype=np.int64) >= config.notable_action_items_min)
+    ).tolist()
+
+
+def notable_mask(
+    conversations: Sequence[Conversation],
+    config: Config,
+    overrides: Optional[Dict[str, bool]] = None,
+    columns: Optional[ConversationColumns] = None,
+    keywords: Optional[KeywordMatcher] = None,
+    transcripts: Optional[TranscriptScanner] = None,
+    rules: Optional[RuleSet] = None,
+) -> List[bool]:
+    """
+    is_notable() for a batch.
+
+    The duration and action-item rules run over the whole batch at once;
+    the keyword rules then run only on conversations neither rule caught,
+    and overrides decide wherever they apply. With rules, those decide in
+    place of the built-in ones, one conversation at a time.
+    """
+    if rules is not None:
+        return [is_notable(c, config, overrides, transcripts=transcripts, rules=rules) for c in conversations]
+    if columns is None:
+        columns = ConversationColumns.of(conversations)
+    keywords = keywords or keyword_matcher(config)
+    result = []
+    for conv, hit in zip(conversations, rule_mask(columns, config)):
+        if overrides and conv.id in overrides:
+            result.append(overrides[conv.id])
+        else:
+            result.append(
+                hit
+                or matches_keyword(conv, config, keywords)
+                or (transcripts is not None and transcripts.scan(conv) is not None)
+            )
+    return result
@@ -0,0 +1,96 @@
+"""Targeted follow-up syncs for conversations waiting out the finalization lag."""
+from dataclasses import dataclass
+from itertools import islice
+from datetime import date as Date, datetime, time, timedelta
+from typing import Any, Dict, Optional, Set
+
+import pytz
+
+from omi_sync.models import parse_conversation
+from omi_sync.prefetch import prefetch
+from omi_sync.state import StateManager
+
+# Conversations can start the day before the one they finish on, so the
+# fetch window opens this many days before the earliest pending date.
+WINDOW_LEAD_DAYS = 1
+
+
+@dataclass
+class PendingCheck:
+    """The days to re-sync and the UTC window to fetch for them."""
+    dates: Set[str]
+    start: datetime
+    end: datetime
+
+
+def next_eligible_at(state: StateManager, after: Optional[datetime] = None) -> Optional[datetime]:
+    """Earliest eligible_at in the pending queue, optionally only those later than after."""
+    times = [datetime.fromisoformat(p["eligible_at"]) for p in state.get_pending().values()]
+    if after is not None:
+        times = [t for t in times if t > after]
+    return min(times, default=None)
+
+
+def due_check(state: StateManager, timezone_name: str, now: datetime) -> Optional[PendingCheck]:
+    """
+    The re-sync needed for pending conversations eligible by now, if any.
+
+    The window spans the whole local days involved (plus WINDOW_LEAD_DAYS
+    before), since each day's Raw and Highlights files are rendered from
+    all of its conversations.
+    """
+    dates = {
+        p["date"] for p in state.get_pending().values()
+        if datetime.fromisoformat(p["eligible_at"]) <= now
+    }
+    if not dates:
+        return None
+
+    tz = pytz.timezone(timezone_name)
+    first = Date.fromisoformat(min(dates)) - timedelta(days=WINDOW_LEAD_DAYS)
+    last = Date.fromisoformat(max(dates)) + timedelta(days=1)
+    return PendingCheck(
+        dates=dates,
+        start=tz.localize(datetime.combine(first, time())).astimezone(pytz.utc),
+        end=tz.localize(datetime.combine(last, time())).astimezone(pytz.utc),
+    )
+
+
+def sync_pending(engine: Any, client: Any, now: datetime, **sync_kwargs) -> Optional[Dict[str, Any]]:
+    """
+    Re-sync only the days of pending conversations that are now eligible.
+
+    Fetches just the window those days need instead of the whole history.
+    sync_kwargs are passed on to engine.sync. Returns the engine result,
+    or None if nothing is due.
+    """
+    check = due_check(engine.state, engine.config.timezone, now)
+    if check is None:
+        return None
+    api_data = prefetch(client.iter_conversations(start_date=check.start, end_date=check.end))
+    return engine.sync(api_data, dates=check.dates, **sync_kwargs)
+
+
+def has_new_data(state: StateManager, client: Any, now: datetime, peek: Optional[int] = None) -> bool:
+    """
+    True if a sync started now could change anything in the vault.
+
+    Used after waiting for another run: that run fetched everything up to
+    when it started, so only pending conversations that have since become
+    eligible, or conversations it could not have seen, need a new sync.
+    Those are the newest, so only the first page (or peek conversations)
+    is fetched and compared with the index and the pending queue.
+    """
+    pending = state.get_pending()
+    if any(datetime.fromisoformat(p["eligible_at"]) <= now for p in pending.values()):
+        return True
+
+    for data in islice(client.iter_conversations(), peek or client.page_size):
+        conv = parse_conversation(data)
+        if conv.finished_at is None or conv.id in pending:
+            # Still recording, or already queued and not yet eligible
+            continue
+        entry = state.get_index_entry(conv.id)
+        if entry is None or entry.last_seen_finished_at != conv.finished_at.isoformat():
+            return True
+    return False
@@ -0,0 +1,67 @@
+"""Fetch conversations on a background thread while the sync consumes them."""
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Queue markers for the end of the source and for an error raised by it
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable: Iterable[T], ahead: int = 50) -> Iterator[T]:
+    """
+    Yield from iterable while a background thread keeps up to ahead items in hand.
+
+    Wrapping OmiClient.iter_conversations() lets the request for page N+1
+    run while the sync engine parses and renders the days completed by
+    page N, so a run takes roughly the longer of network and CPU time
+    rather than their sum. ahead bounds the items fetched but not yet
+    consumed (two pages by default), so a slow consumer does not let the
+    fetch run ahead of it without limit.
+
+    An error raised by iterable is raised here, after the items fetched
+    before it. Closing the returned iterator early stops the thread once
+    its current page has arrived. Nothing starts until the first item is
+    requested.
+    """
+    items: "queue.Queue" = queue.Queue(maxsize=max(1, ahead))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+        else:
+            put(_DONE)
+
+    thread = threading.Thread(target=produce, name="omi-fetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,94 @@
+"""Per-stage timers and cProfile output for sync runs."""
+import io
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import cProfile
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """
+    Accumulate wall time per named stage.
+
+    Stages nest: while an inner stage runs, the outer one is paused, so
+    each second is counted once and the stages add up to the time spent
+    inside any of them. Nesting is tracked per thread, so a timer can be
+    shared with a thread running alongside (e.g. the fetch thread); its
+    stages then overlap the caller's and no longer add up to wall time.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block under name."""
+        stack = self._stack
+        now = self.clock()
+        if stack:
+            self._add(stack[-1], now - self._local.since)
+        stack.append(name)
+        self._local.since = now
+        try:
+            yield
+        finally:
+            now = self.clock()
+            self._add(stack.pop(), now - self._local.since)
+            self._local.since = now
+
+    def iterate(self, iterable: Iterable[T], name: str) -> Iterator[T]:
+        """Yield from iterable, timing each step of it under name."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def merge(self, timings: Dict[str, float]):
+        """Add timings recorded elsewhere, e.g. in a worker."""
+        for name, seconds in timings.items():
+            self._add(name, seconds)
+
+    def _add(self, name: str, seconds: float):
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+
+def write_profile(profiler: "cProfile.Profile", directory: Path, top: int = 30, label: Optional[str] = None) -> Path:
+    """
+    Dump a profiler's stats to <directory>/<label>.pstats with a top-N summary.
+
+    The summary, sorted by cumulative time, goes next to it as .txt.
+    Returns the .pstats path.
+    """
+    import pstats
+
+    directory.mkdir(parents=True, exist_ok=True)
+    label = label or datetime.now().strftime("run-%Y%m%dT%H%M%S")
+    pstats_path = directory / f"{label}.pstats"
+    profiler.dump_stats(str(pstats_path))
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+    (directory / f"{label}.txt").write_text(summary.getvalue())
+    return pstats_path
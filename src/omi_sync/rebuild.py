@@ -1,63 +1,249 @@
 """Rebuild index from vault frontmatter."""
+import hashlib
+import mmap
+import os
 import re
-import frontmatter
 from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+import yaml
+
 from omi_sync.config import Config
+from omi_sync.manifest import ScanManifest
 from omi_sync.state import StateManager, IndexEntry
 
+# Raw files are scanned as bytes via mmap, so the heading pattern is bytes too.
+RAW_HEADING_PATTERN = re.compile(r"## (\d{2}:\d{2}) — (.+?) \(omi:([^)]+)\)".encode("utf-8"))
+
+# Below this many files per worker, process start-up costs more than it saves.
+_FILES_PER_WORKER = 32
+
+EventHeader = Tuple[str, str, str, List[str]]
+RawHeading = Tuple[str, str, str]
+# (path, previously recorded hash) -> (content hash, changed, parsed result)
+ScanJob = Tuple[Path, Optional[str]]
+ScanResult = Tuple[Optional[str], bool, Any]
+T = TypeVar("T")
+
 
-def rebuild_index_from_vault(config: Config) -> int:
+def rebuild_index_from_vault(
+    config: Config,
+    workers: Optional[int] = None,
+    full: bool = False,
+) -> int:
     """
     Rebuild index by scanning vault for omi_id frontmatter.
 
     PRD: omi-sync rebuild-index scans vault to rebuild index from frontmatter.
+
+    Event notes are read only up to the closing frontmatter delimiter and
+    Raw files are searched through mmap. Files are spread across a process
+    pool; workers defaults to one per CPU, scaled down for small vaults.
+
+    Only files whose size, mtime or content hash changed since the last
+    scan are parsed again; the rest are served from the scan manifest.
+    Pass full=True to ignore the manifest and rescan everything.
     """
     state = StateManager(config.vault_path)
+    manifest = ScanManifest(state.manifest_file)
+    if full:
+        manifest.clear()
     count = 0
 
     # Scan event notes
     events_dir = config.vault_path / "Omi" / "Events"
-    if events_dir.exists():
-        for path in events_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(path)
-                omi_id = post.get("omi_id")
-                if omi_id:
-                    entry = IndexEntry(
-                        omi_id=omi_id,
-                        raw_date=post.get("date", ""),
-                        raw_heading=_extract_heading_from_link(post.get("raw_link", "")),
-                        event_path=str(path.relative_to(config.vault_path)),
-                    )
-                    state.set_index_entry(omi_id, entry)
-                    count += 1
-            except Exception:
-                continue
+    event_paths = sorted(events_dir.glob("*.md")) if events_dir.exists() else []
+    event_headers = _scan_files(_scan_event_job, event_paths, manifest, config.vault_path, workers)
+    for path, header in zip(event_paths, event_headers):
+        if header is None:
+            continue
+        omi_id, date, heading, people = header
+        entry = IndexEntry(
+            omi_id=omi_id,
+            raw_date=date,
+            raw_heading=heading,
+            event_path=str(path.relative_to(config.vault_path)),
+            people=list(people),
+        )
+        state.set_index_entry(omi_id, entry)
+        count += 1
 
     # Scan raw files for additional entries
     raw_dir = config.vault_path / "Omi" / "Raw"
-    if raw_dir.exists():
-        for path in raw_dir.glob("*.md"):
-            try:
-                content = path.read_text()
-                for match in re.finditer(r"## (\d{2}:\d{2}) — (.+?) \(omi:([^)]+)\)", content):
-                    time_str, title, omi_id = match.groups()
-                    if not state.get_index_entry(omi_id):
-                        date = path.stem
-                        entry = IndexEntry(
-                            omi_id=omi_id,
-                            raw_date=date,
-                            raw_heading=f"{time_str} — {title} (omi:{omi_id})",
-                        )
-                        state.set_index_entry(omi_id, entry)
-                        count += 1
-            except Exception:
-                continue
+    raw_paths = sorted(raw_dir.glob("*.md")) if raw_dir.exists() else []
+    raw_headings = _scan_files(_scan_raw_job, raw_paths, manifest, config.vault_path, workers)
+    for path, headings in zip(raw_paths, raw_headings):
+        date = path.stem
+        for time_str, title, omi_id in headings or []:
+            if not state.get_index_entry(omi_id):
+                entry = IndexEntry(
+                    omi_id=omi_id,
+                    raw_date=date,
+                    raw_heading=f"{time_str} — {title} (omi:{omi_id})",
+                )
+                state.set_index_entry(omi_id, entry)
+                count += 1
 
+    manifest.retain(str(p.relative_to(config.vault_path)) for p in event_paths + raw_paths)
     state.save()
+    manifest.save()
     return count
 
 
+def scan_event_header(path: Path) -> Optional[EventHeader]:
+    """
+    Extract (omi_id, date, raw heading, people) from an event note.
+
+    Returns None for unreadable files or notes without an omi_id.
+    """
+    try:
+        block = _read_frontmatter_block(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return _parse_event_header(block)
+
+
+def read_frontmatter(path: Path) -> Optional[dict]:
+    """
+    Parse the YAML frontmatter block of a note without reading its body.
+
+    Returns None when the file has no frontmatter block.
+    """
+    block = _read_frontmatter_block(path)
+    if block is None:
+        return None
+    data = yaml.safe_load(block)
+    return data if isinstance(data, dict) else None
+
+
+def _read_frontmatter_block(path: Path) -> Optional[str]:
+    """Return the raw text between the opening and closing '---' lines."""
+    lines = []
+    with open(path, encoding="utf-8-sig") as f:
+        if f.readline().rstrip() != "---":
+            return None
+        for line in f:
+            if line.rstrip() == "---":
+                break
+            lines.append(line)
+        else:
+            return None
+    return "".join(lines)
+
+
+def _parse_event_header(block: Optional[str]) -> Optional[EventHeader]:
+    """Turn a frontmatter block into an event header tuple."""
+    if block is None:
+        return None
+    try:
+        post = yaml.safe_load(block)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(post, dict) or not post.get("omi_id"):
+        return None
+    return (
+        post["omi_id"],
+        post.get("date", ""),
+        _extract_heading_from_link(post.get("raw_link", "")),
+        list(post.get("people") or []),
+    )
+
+
+def _scan_event_job(job: ScanJob) -> ScanResult:
+    """
+    Scan one event note for the manifest.
+
+    The content hash covers only the frontmatter block, since that is all
+    the index is derived from; edits to the note body never force a re-parse.
+    """
+    path, known_hash = job
+    try:
+        block = _read_frontmatter_block(path)
+    except (OSError, UnicodeDecodeError):
+        return None, True, None
+    digest = hashlib.sha256((block or "").encode("utf-8")).hexdigest()
+    if digest == known_hash:
+        return digest, False, None
+    return digest, True, _parse_event_header(block)
+
+
+def _scan_raw_job(job: ScanJob) -> ScanResult:
+    """Hash and search one Raw file through a single mmap."""
+    path, known_hash = job
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                digest = hashlib.sha256(b"").hexdigest()
+                return digest, digest != known_hash, []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.sha256(mm).hexdigest()
+                if digest == known_hash:
+                    return digest, False, None
+                headings = [
+                    tuple(group.decode("utf-8") for group in match.groups())
+                    for match in RAW_HEADING_PATTERN.finditer(mm)
+                ]
+                return digest, True, headings
+    except (OSError, ValueError):
+        return None, True, []
+
+
+def _scan_files(
+    job_fn: Callable[[ScanJob], ScanResult],
+    paths: Sequence[Path],
+    manifest: ScanManifest,
+    vault_path: Path,
+    workers: Optional[int],
+) -> List[Any]:
+    """
+    Return the scan result for each path, in order.
+
+    Files whose size and mtime match the manifest are not opened at all;
+    the rest are hashed and only parsed when the hash differs as well.
+    Files that vanish before they can be stat'ed get a None result.
+    """
+    results: List[Any] = [None] * len(paths)
+    jobs: List[ScanJob] = []
+    pending = []
+    for i, path in enumerate(paths):
+        rel_path = str(path.relative_to(vault_path))
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        previous = manifest.get(rel_path)
+        if manifest.is_unchanged(rel_path, st):
+            results[i] = previous.result
+            continue
+        jobs.append((path, previous.content_hash if previous else None))
+        pending.append((i, rel_path, st, previous))
+
+    for (i, rel_path, st, previous), (digest, changed, result) in zip(
+        pending, _map_files(job_fn, jobs, workers)
+    ):
+        if not changed:
+            result = previous.result
+        results[i] = result
+        if digest is not None:
+            manifest.record(rel_path, st, digest, result)
+    return results
+
+
+def _map_files(fn: Callable[[Any], T], items: Sequence[Any], workers: Optional[int]) -> List[T]:
+    """Apply fn to every item, in order, using a process pool when worthwhile."""
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(items) // _FILES_PER_WORKER)
+    workers = min(workers, len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
 def _extract_heading_from_link(raw_link: str) -> str:
     """Extract heading from Obsidian link format."""
     match = re.search(r"#(.+?)\]\]", raw_link)
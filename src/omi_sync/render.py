@@ -0,0 +1,205 @@
+"""Day rendering, serially or on a worker pool."""
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from omi_sync.config import Config, EXECUTORS
+from omi_sync.models import Conversation
+from omi_sync.file_writer import write_file_atomic
+from omi_sync.hashing import hash_text, raw_text_section_hashes
+from omi_sync.people import extract_people
+from omi_sync.profiling import StageTimer
+from omi_sync.state import IndexEntry
+from omi_sync.local_times import LocalTimes, local_times_for
+from omi_sync.transcript_scan import TranscriptMatch
+from omi_sync.generators.raw import generate_raw_daily
+from omi_sync.generators.event import generate_event_note
+from omi_sync.generators.highlights import generate_highlights
+
+# Days queued per worker before submit() waits for the oldest to finish.
+_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class RenderedDay:
+    """Everything one day produces: files to write and index entries."""
+    date: str
+    files: List[Tuple[Path, str]] = field(default_factory=list)
+    entries: List[IndexEntry] = field(default_factory=list)
+    event_ids: List[str] = field(default_factory=list)
+    written: bool = False
+    # Seconds per stage spent rendering and writing this day
+    timings: Dict[str, float] = field(default_factory=dict)
+    bytes_written: int = 0
+
+    def write(self):
+        """Write the day's files, in render order."""
+        timer = StageTimer()
+        with timer.stage("write"):
+            for path, content in self.files:
+                self.bytes_written += write_file_atomic(path, content)
+        self.timings["write"] = self.timings.get("write", 0.0) + timer.timings["write"]
+        self.written = True
+
+
+def render_day(
+    date: str,
+    conversations: List[Conversation],
+    notable_ids: Set[str],
+    config: Config,
+    generated_at: str,
+    times: Optional[Dict[str, LocalTimes]] = None,
+    transcript_matches: Optional[Dict[str, TranscriptMatch]] = None,
+) -> RenderedDay:
+    """
+    Render the Raw file, event notes and Highlights file for one day.
+
+    Pure function of its arguments, so it can run in a worker process;
+    generated_at is pinned per run to keep output independent of timing.
+    times maps omi_id to the LocalTimes the caller computed while bucketing;
+    any missing are computed here, once, and shared by every generator.
+    transcript_matches maps omi_id to where a notable keyword was spoken,
+    for event notes to link to.
+    """
+    day = RenderedDay(date=date)
+    timer = StageTimer()
+    omi_dir = config.vault_path / "Omi"
+    times = local_times_for(conversations, config.timezone, times)
+
+    # Raw daily file
+    with timer.stage("render.raw"):
+        raw_content = generate_raw_daily(conversations, date, config, generated_at, times)
+        day.files.append((omi_dir / "Raw" / f"{date}.md", raw_content))
+        sections = raw_text_section_hashes(raw_content)
+
+    # Event notes for notable conversations, and index entries
+    for conv in conversations:
+        event_path = None
+        event_hash = None
+        if conv.id in notable_ids:
+            with timer.stage("render.event"):
+                event_filename = times[conv.id].event_filename
+                event_content = generate_event_note(
+                    conv, config, generated_at, times[conv.id],
+                    (transcript_matches or {}).get(conv.id),
+                )
+                day.files.append((omi_dir / "Events" / event_filename, event_content))
+                day.event_ids.append(conv.id)
+                event_path = f"Omi/Events/{event_filename}"
+                event_hash = hash_text(event_content)
+
+        with timer.stage("render.entries"):
+            day.entries.append(IndexEntry(
+                omi_id=conv.id,
+                raw_date=date,
+                raw_heading=times[conv.id].raw_heading,
+                event_path=event_path,
+                last_seen_finished_at=conv.finished_at.isoformat(),
+                last_content_hash=sections[conv.id][1] if conv.id in sections else None,
+                event_content_hash=event_hash,
+                people=extract_people(conv),
+            ))
+
+    # Highlights file
+    with timer.stage("render.highlights"):
+        highlights_content = generate_highlights(conversations, date, notable_ids, config, generated_at, times)
+        day.files.append((omi_dir / "Highlights" / f"{date} Highlights.md", highlights_content))
+    day.timings = timer.timings
+    return day
+
+
+def render_and_write_day(*args) -> RenderedDay:
+    """render_day followed by writing its files, for thread workers."""
+    day = render_day(*args)
+    day.write()
+    return day
+
+
+class DayRenderer:
+    """
+    Render and write days, handing results back in submission order.
+
+    With workers <= 1 each day is rendered and written on the spot. With a
+    "process" executor, days render in worker processes and are written by
+    the caller's thread as results come back; with "thread", workers render
+    and write. Either way results are returned in the order days were
+    submitted, so index updates and stats are merged deterministically, and
+    at most a few days per worker are in flight at once. With write=False
+    days are only rendered, and writing their files is left to the caller.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        generated_at: str,
+        workers: int = 1,
+        executor: str = "process",
+        write: bool = True,
+    ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown render executor: {executor}")
+        self.config = config
+        self.generated_at = generated_at
+        self.workers = workers
+        self.write = write
+        self._in_flight: Deque[Future] = deque()
+        self._pool: Optional[Executor] = None
+        if workers > 1:
+            # Imported here: the process pool pulls in multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+            self._pool = pool_cls(max_workers=workers)
+            self._task = render_and_write_day if write and executor == "thread" else render_day
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def parallel(self) -> bool:
+        """True if days render on a worker pool."""
+        return self._pool is not None
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def submit(
+        self,
+        date: str,
+        conversations: List[Conversation],
+        notable_ids: Set[str],
+        times: Optional[Dict[str, LocalTimes]] = None,
+        transcript_matches: Optional[Dict[str, TranscriptMatch]] = None,
+    ) -> List[RenderedDay]:
+        """Queue a day; return whichever days at the head of the queue are done."""
+        args = (date, conversations, notable_ids, self.config, self.generated_at, times, transcript_matches)
+        if self._pool is None:
+            return [render_and_write_day(*args) if self.write else render_day(*args)]
+
+        self._in_flight.append(self._pool.submit(self._task, *args))
+        done = []
+        while self._in_flight and (
+            self._in_flight[0].done() or len(self._in_flight) > self.workers * _IN_FLIGHT_PER_WORKER
+        ):
+            done.append(self._finish(self._in_flight.popleft()))
+        return done
+
+    def drain(self) -> List[RenderedDay]:
+        """Wait for every queued day."""
+        done = []
+        while self._in_flight:
+            done.append(self._finish(self._in_flight.popleft()))
+        return done
+
+    def _finish(self, future: Future) -> RenderedDay:
+        day = future.result()
+        if self.write and not day.written:
+            day.write()
+        return day
@@ -0,0 +1,377 @@
+"""User-defined notable rules, compiled into a short-circuiting predicate pipeline."""
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from omi_sync.config import ConfigError
+from omi_sync.keywords import KeywordMatcher
+from omi_sync.models import Conversation
+
+# Conversations whose predicates are timed before the pipeline is reordered
+CALIBRATION = 256
+
+# Seconds per evaluation assumed for each kind of condition until measured
+_COST = {
+    "duration_minutes": 2e-7,
+    "action_items": 1e-7,
+    "category": 1e-7,
+    "language": 1e-7,
+    "location": 5e-7,
+    "keywords": 1e-6,
+    "speakers": 2e-6,
+    "transcript": 1e-4,
+}
+
+_RANGES = ("duration_minutes", "action_items", "speakers")
+_SETS = ("category", "language")
+_FIELDS = ("title", "overview", "transcript")
+
+
+@dataclass
+class Predicate:
+    """One condition of a rule, with what has been measured about it this run."""
+    kind: str
+    test: Callable[[Conversation], bool]
+    cost: float
+    evaluations: int = 0
+    passes: int = 0
+    seconds: float = 0.0
+    # For keyword conditions, (fields, whole_words, keywords): rules made of
+    # nothing else share one matcher with others over the same fields
+    keywords: Optional[Tuple[Tuple[str, ...], bool, List[str]]] = None
+
+    @property
+    def pass_rate(self) -> float:
+        # Smoothed, so unmeasured predicates start at 0.5
+        return (self.passes + 1) / (self.evaluations + 2)
+
+    def measured_cost(self) -> float:
+        return self.seconds / self.evaluations if self.evaluations else self.cost
+
+
+@dataclass
+class Rule:
+    """Conditions that together make a conversation notable."""
+    name: str
+    predicates: List[Predicate]
+    evaluations: int = 0
+    hits: int = 0
+    # The predicates' test functions, in evaluation order
+    tests: List[Callable[[Conversation], bool]] = field(default_factory=list)
+
+    def order(self):
+        """Cheap, likely-to-fail conditions first."""
+        self.predicates.sort(key=lambda p: p.measured_cost() / max(1.0 - p.pass_rate, 1e-9))
+        self.tests = [p.test for p in self.predicates]
+
+    def expected_cost(self) -> float:
+        """Seconds per evaluation, given that it stops at the first failing condition."""
+        cost, reached = 0.0, 1.0
+        for p in self.predicates:
+            cost += reached * p.measured_cost()
+            reached *= p.pass_rate
+        return cost
+
+    def hit_rate(self) -> float:
+        rate = 1.0
+        for p in self.predicates:
+            rate *= p.pass_rate
+        return rate
+
+
+class RuleSet:
+    """
+    Notable rules from a rules file, compiled once per run.
+
+    A conversation is notable if any rule matches, and a rule matches if
+    all of its conditions hold, so both can stop early. Conditions within
+    a rule run cheapest-to-fail first, and rules run in order of expected
+    cost per hit. The order starts from per-condition estimates and is
+    recomputed from timings and pass rates measured over the first
+    CALIBRATION conversations; since every condition is a pure test, the
+    order changes only the cost, never the result.
+
+    Rules that are nothing but a keyword list over the same fields are
+    evaluated as one, with one matcher for all their keywords; a hit is
+    credited to the rule whose keyword was found.
+    """
+
+    def __init__(self, rules: List[Rule], calibration: int = CALIBRATION):
+        self.rules = rules
+        self._calibration = calibration
+        self._measured = 0
+        # Rule name -> the rule evaluated in its place (itself, or a merged keyword rule)
+        self._unit_of: Dict[str, Rule] = {}
+        self._units = self._merge_keyword_rules()
+        self._reorder()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def matches(self, conv: Conversation) -> bool:
+        """True if any rule matches conv."""
+        if self._measured < self._calibration:
+            return self._matches_measured(conv)
+        for rule in self._order:
+            rule.evaluations += 1
+            for test in rule.tests:
+                if not test(conv):
+                    break
+            else:
+                rule.hits += 1
+                return True
+        return False
+
+    def _matches_measured(self, conv: Conversation) -> bool:
+        """matches(), timing and counting each condition evaluated."""
+        clock = time.perf_counter
+        matched = False
+        for rule in self._order:
+            rule.evaluations += 1
+            for p in rule.predicates:
+                started = clock()
+                passed = p.test(conv)
+                p.seconds += clock() - started
+                p.evaluations += 1
+                if not passed:
+                    break
+                p.passes += 1
+            else:
+                rule.hits += 1
+                matched = True
+                break
+        self._measured += 1
+        if self._measured == self._calibration:
+            self._reorder()
+        return matched
+
+    def _merge_keyword_rules(self) -> List[Rule]:
+        """The rules to evaluate, with keyword-only rules over the same fields merged."""
+        units: List[List[Rule]] = []
+        groups: Dict[Tuple, List[Rule]] = {}
+        for rule in self.rules:
+            spec = rule.predicates[0].keywords if len(rule.predicates) == 1 else None
+            if spec is None:
+                units.append([rule])
+            elif spec[:2] in groups:
+                groups[spec[:2]].append(rule)
+            else:
+                groups[spec[:2]] = [rule]
+                units.append(groups[spec[:2]])
+
+        merged = []
+        for members in units:
+            unit = members[0] if len(members) == 1 else _merged(members)
+            for rule in members:
+                self._unit_of[rule.name] = unit
+            merged.append(unit)
+        return merged
+
+    def _reorder(self):
+        for rule in self._units:
+            rule.order()
+        self._order = sorted(self._units, key=lambda r: r.expected_cost() / max(r.hit_rate(), 1e-9))
+
+    def counters(self) -> Dict[str, Dict[str, int]]:
+        """Evaluations and hits per rule name, for the run stats."""
+        return {
+            r.name: {"evaluations": self._unit_of[r.name].evaluations, "hits": r.hits}
+            for r in self.rules
+        }
+
+
+def _merged(rules: List[Rule]) -> Rule:
+    """One rule standing for keyword-only rules over the same fields, crediting hits to theirs."""
+    fields, whole_words, _ = rules[0].predicates[0].keywords
+    owners: Dict[str, Rule] = {}
+    words = []
+    for rule in rules:
+        for word in rule.predicates[0].keywords[2]:
+            # The first rule listing a keyword owns it, as it would be tried first
+            owners.setdefault(word.lower(), rule)
+            words.append(word)
+    search = _keyword_search(words, fields, whole_words)
+
+    def test(c: Conversation) -> bool:
+        found = search(c)
+        if found is None:
+            return False
+        owners[found.lower()].hits += 1
+        return True
+
+    kind = rules[0].predicates[0].kind
+    return Rule(name=" | ".join(r.name for r in rules), predicates=[Predicate(kind, test, _COST[kind])])
+
+
+def load_rules(path: Path, calibration: int = CALIBRATION) -> Optional[RuleSet]:
+    """
+    Compile the rules file at path; None if there is none.
+
+    Raises ConfigError if the file is not valid JSON or a rule is malformed,
+    rather than silently classifying with a different rule set.
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ConfigError(f"{path}: invalid JSON: {e}")
+    except IOError as e:
+        raise ConfigError(f"{path}: {e}")
+    rules_data = data.get("rules") if isinstance(data, dict) else None
+    if not isinstance(rules_data, list):
+        raise ConfigError(f"{path}: expected an object with a \"rules\" list")
+
+    rules = []
+    for i, rule_data in enumerate(rules_data, 1):
+        try:
+            rule = compile_rule(rule_data, f"rule {i}")
+        except ConfigError as e:
+            raise ConfigError(f"{path}: {e}")
+        if any(r.name == rule.name for r in rules):
+            raise ConfigError(f"{path}: duplicate rule name {rule.name!r}")
+        rules.append(rule)
+    return RuleSet(rules, calibration)
+
+
+def compile_rule(data: Any, default_name: str) -> Rule:
+    """One rule of the rules file as a Rule; raises ConfigError if it is malformed."""
+    if not isinstance(data, dict):
+        raise ConfigError(f"{default_name}: expected an object")
+    name = str(data.get("name", default_name))
+    predicates = []
+    for kind, value in data.items():
+        if kind == "name":
+            continue
+        if kind in _RANGES:
+            predicates.append(_range(name, kind, value))
+        elif kind in _SETS:
+            predicates.append(_one_of(name, kind, value))
+        elif kind == "keywords":
+            predicates.append(_keywords(name, value))
+        elif kind == "location":
+            predicates.append(_location(name, value))
+        else:
+            raise ConfigError(f"rule {name!r}: unknown condition {kind!r}")
+    if not predicates:
+        raise ConfigError(f"rule {name!r}: no conditions")
+    return Rule(name=name, predicates=predicates)
+
+
+def _range(rule: str, kind: str, value: Any) -> Predicate:
+    """{"min": a, "max": b} (either bound optional) on a count."""
+    if not isinstance(value, dict) or not value or set(value) - {"min", "max"}:
+        raise ConfigError(f"rule {rule!r}: {kind} takes {{\"min\": ..., \"max\": ...}}")
+    for bound in value.values():
+        if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+            raise ConfigError(f"rule {rule!r}: {kind} bounds must be numbers")
+    low = value.get("min", float("-inf"))
+    high = value.get("max", float("inf"))
+    if kind == "duration_minutes":
+        test = lambda c: low <= c.duration_minutes <= high
+    elif kind == "action_items":
+        test = lambda c: low <= len(c.action_items) <= high
+    else:
+        test = lambda c: low <= _speaker_count(c) <= high
+    return Predicate(kind, test, _COST[kind])
+
+
+# (conversation, distinct speakers) of the last conversation counted
+_last_speakers: Tuple[Optional[Conversation], int] = (None, 0)
+
+
+def _speaker_count(c: Conversation) -> int:
+    """Distinct speakers in c's transcript; counted once however many rules ask."""
+    global _last_speakers
+    last, count = _last_speakers
+    if last is not c:
+        count = len({s.speaker for s in c.transcript_segments})
+        _last_speakers = (c, count)
+    return count
+
+
+def _one_of(rule: str, kind: str, value: Any) -> Predicate:
+    """A list of accepted values, compared case-insensitively."""
+    accepted = frozenset(v.lower() for v in _strings(rule, kind, value))
+    if kind == "category":
+        test = lambda c: (c.category or "").lower() in accepted
+    else:
+        test = lambda c: (c.language or "").lower() in accepted
+    return Predicate(kind, test, _COST[kind])
+
+
+def _keywords(rule: str, value: Any) -> Predicate:
+    """
+    A keyword list, or {"any": [...], "in": [fields], "whole_words": bool}.
+
+    Fields default to title and overview, as in the built-in keyword rule;
+    a keyword in any listed field satisfies the condition. Listing the
+    transcript makes it a costlier kind of condition, ordered accordingly.
+    """
+    if isinstance(value, dict):
+        unknown = set(value) - {"any", "in", "whole_words"}
+        if unknown:
+            raise ConfigError(f"rule {rule!r}: unknown keywords option {sorted(unknown)[0]!r}")
+        words = _strings(rule, "keywords.any", value.get("any"))
+        fields = _strings(rule, "keywords.in", value.get("in", ["title", "overview"]))
+        whole_words = bool(value.get("whole_words", False))
+    else:
+        words = _strings(rule, "keywords", value)
+        fields, whole_words = ["title", "overview"], False
+    for f in fields:
+        if f not in _FIELDS:
+            raise ConfigError(f"rule {rule!r}: keywords can search {', '.join(_FIELDS)}, not {f!r}")
+
+    fields = tuple(f for f in _FIELDS if f in fields)
+    return _keyword_predicate(_keyword_search(words, fields, whole_words), fields, whole_words, words)
+
+
+def _keyword_search(
+    words: List[str], fields: Tuple[str, ...], whole_words: bool
+) -> Callable[[Conversation], Optional[str]]:
+    """The first of words found in a conversation's fields (in _FIELDS order), as configured, or None."""
+    search = KeywordMatcher(words, whole_words).search
+    summary = tuple(f for f in fields if f != "transcript")
+    if summary == ("title", "overview"):
+        in_summary = lambda c: search(f"{c.title} {c.overview}")
+    elif summary == ("title",):
+        in_summary = lambda c: search(c.title)
+    else:
+        in_summary = lambda c: search(c.overview)
+    if "transcript" not in fields:
+        return in_summary
+
+    def in_transcript(c: Conversation) -> Optional[str]:
+        # Joined with newlines so no keyword matches across two segments
+        return search("\n".join(s.text for s in c.transcript_segments))
+
+    if not summary:
+        return in_transcript
+    return lambda c: in_summary(c) or in_transcript(c)
+
+
+def _keyword_predicate(
+    search: Callable[[Conversation], Optional[str]], fields: Tuple[str, ...], whole_words: bool, words: List[str]
+) -> Predicate:
+    """A keyword condition; searching the transcript makes it a costlier kind."""
+    kind = "transcript" if "transcript" in fields else "keywords"
+    return Predicate(kind, lambda c: search(c) is not None, _COST[kind], keywords=(fields, whole_words, words))
+
+
+def _location(rule: str, value: Any) -> Predicate:
+    """Keywords matched against the conversation's address."""
+    matcher = KeywordMatcher(_strings(rule, "location", value))
+
+    def test(c: Conversation) -> bool:
+        address = c.geolocation.address if c.geolocation else None
+        return bool(address) and matcher.search(address) is not None
+    return Predicate("location", test, _COST["location"])
+
+
+def _strings(rule: str, kind: str, value: Any) -> List[str]:
+    if not isinstance(value, list) or not value or not all(isinstance(v, str) for v in value):
+        raise ConfigError(f"rule {rule!r}: {kind} takes a non-empty list of strings")
+    return value
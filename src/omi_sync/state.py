@@ -1,8 +1,11 @@
 """State and index management."""
 import json
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+from omi_sync.file_writer import write_file_atomic
 
 
 @dataclass
@@ -14,6 +17,8 @@ class IndexEntry:
     event_path: Optional[str] = None
     last_seen_finished_at: Optional[str] = None
     last_content_hash: Optional[str] = None
+    event_content_hash: Optional[str] = None
+    people: List[str] = field(default_factory=list)
 
 
 class StateManager:
@@ -21,6 +26,11 @@ class StateManager:
     Manage sync state and index.
 
     PRD: Maintain state.json and index.json in Omi/.omi-sync/
+
+    Alongside the primary omi_id -> IndexEntry map, secondary indexes by
+    date, event path and person are kept in step by set_index_entry so
+    lookups touch only the matching entries. Entries must be replaced via
+    set_index_entry rather than mutated in place.
     """
 
     def __init__(self, vault_path: Path):
@@ -28,11 +38,17 @@ class StateManager:
         self.sync_dir = vault_path / "Omi" / ".omi-sync"
         self.state_file = self.sync_dir / "state.json"
         self.index_file = self.sync_dir / "index.json"
+        self.manifest_file = self.sync_dir / "manifest.json"
+        self.metrics_file = self.sync_dir / "metrics.jsonl"
+        self.transcript_scan_file = self.sync_dir / "transcript_scan.json"
         self.overrides_dir = self.sync_dir / "overrides"
+        self.rules_dir = self.sync_dir / "rules"
+        self.conversations_dir = self.sync_dir / "conversations"
 
         # Ensure directories exist
         self.sync_dir.mkdir(parents=True, exist_ok=True)
         self.overrides_dir.mkdir(exist_ok=True)
+        self.rules_dir.mkdir(exist_ok=True)
 
         # Load existing state
         self.state = self._load_json(self.state_file, {
@@ -40,6 +56,9 @@ class StateManager:
             "last_run_at": None,
         })
         self._index: Dict[str, IndexEntry] = {}
+        self._ids_by_date: Dict[str, Set[str]] = defaultdict(set)
+        self._id_by_event_path: Dict[str, str] = {}
+        self._ids_by_person: Dict[str, Set[str]] = defaultdict(set)
         self._load_index()
 
     def _load_json(self, path: Path, default: dict) -> dict:
@@ -56,16 +75,20 @@ class StateManager:
         """Load index from file."""
         data = self._load_json(self.index_file, {})
         for omi_id, entry_data in data.items():
-            self._index[omi_id] = IndexEntry(**entry_data)
+            self.set_index_entry(omi_id, IndexEntry(**entry_data))
 
-    def save(self):
-        """Save state and index to disk."""
-        with open(self.state_file, "w") as f:
-            json.dump(self.state, f, indent=2, sort_keys=True)
+    def save(self, fsync: bool = False):
+        """
+        Save state and index to disk.
+
+        Each file is replaced atomically, so a crash mid-save leaves the
+        previous version rather than a truncated one; with fsync, both are
+        flushed to disk before returning.
+        """
+        write_file_atomic(self.state_file, json.dumps(self.state, indent=2, sort_keys=True), fsync=fsync)
 
         index_data = {k: asdict(v) for k, v in self._index.items()}
-        with open(self.index_file, "w") as f:
-            json.dump(index_data, f, indent=2, sort_keys=True)
+        write_file_atomic(self.index_file, json.dumps(index_data, indent=2, sort_keys=True), fsync=fsync)
 
     def update_cursor(self, cursor: str):
         """Update the sync cursor."""
@@ -75,17 +98,83 @@ class StateManager:
         """Update last run timestamp."""
         self.state["last_run_at"] = timestamp
 
+    def get_pending(self) -> Dict[str, Dict[str, str]]:
+        """
+        Conversations waiting out the finalization lag.
+
+        Returns omi_id -> {"eligible_at": ISO8601 UTC, "date": local date}.
+        """
+        return self.state.get("pending", {})
+
+    def replace_pending(self, pending: Dict[str, Dict[str, str]], dates: Optional[Set[str]] = None):
+        """Replace the pending queue, or with dates only its entries for those dates."""
+        if dates is None:
+            kept = {}
+        else:
+            kept = {k: v for k, v in self.get_pending().items() if v["date"] not in dates}
+        kept.update(pending)
+        self.state["pending"] = kept
+
+    def get_applied_overrides(self) -> Tuple[Dict[str, bool], Optional[int]]:
+        """The notable overrides the vault was last rendered with, and their file's mtime_ns."""
+        return self.state.get("applied_overrides", {}), self.state.get("overrides_mtime_ns")
+
+    def set_applied_overrides(self, overrides: Dict[str, bool], mtime_ns: Optional[int]):
+        """Record the overrides the vault now reflects (mtime_ns None: no overrides file)."""
+        self.state["applied_overrides"] = dict(overrides)
+        self.state["overrides_mtime_ns"] = mtime_ns
+
     def get_index_entry(self, omi_id: str) -> Optional[IndexEntry]:
         """Get index entry by omi_id."""
         return self._index.get(omi_id)
 
     def set_index_entry(self, omi_id: str, entry: IndexEntry):
-        """Set index entry."""
+        """Set index entry, keeping secondary indexes in step."""
+        previous = self._index.get(omi_id)
+        if previous is not None:
+            self._unlink_secondary(omi_id, previous)
         self._index[omi_id] = entry
+        self._link_secondary(omi_id, entry)
+
+    def remove_index_entry(self, omi_id: str) -> Optional[IndexEntry]:
+        """Remove and return index entry, if present."""
+        entry = self._index.pop(omi_id, None)
+        if entry is not None:
+            self._unlink_secondary(omi_id, entry)
+        return entry
+
+    def _link_secondary(self, omi_id: str, entry: IndexEntry):
+        """Add entry to the date, event path and person indexes."""
+        self._ids_by_date[entry.raw_date].add(omi_id)
+        if entry.event_path:
+            self._id_by_event_path[entry.event_path] = omi_id
+        for person in entry.people:
+            self._ids_by_person[person].add(omi_id)
+
+    def _unlink_secondary(self, omi_id: str, entry: IndexEntry):
+        """Remove entry from the date, event path and person indexes."""
+        _discard(self._ids_by_date, entry.raw_date, omi_id)
+        if entry.event_path and self._id_by_event_path.get(entry.event_path) == omi_id:
+            del self._id_by_event_path[entry.event_path]
+        for person in entry.people:
+            _discard(self._ids_by_person, person, omi_id)
 
     def get_entries_for_date(self, date: str) -> List[IndexEntry]:
-        """Get all index entries for a specific date."""
-        return [e for e in self._index.values() if e.raw_date == date]
+        """Get all index entries for a specific date, ordered by omi_id."""
+        return [self._index[i] for i in sorted(self._ids_by_date.get(date, ()))]
+
+    def get_entry_by_event_path(self, event_path: str) -> Optional[IndexEntry]:
+        """Get the index entry owning a vault-relative event note path."""
+        omi_id = self._id_by_event_path.get(event_path)
+        return self._index.get(omi_id) if omi_id else None
+
+    def get_entries_for_person(self, person: str) -> List[IndexEntry]:
+        """Get all index entries a person took part in, ordered by omi_id."""
+        return [self._index[i] for i in sorted(self._ids_by_person.get(person, ()))]
+
+    def get_dates(self) -> List[str]:
+        """Get all dates that have index entries, sorted."""
+        return sorted(self._ids_by_date)
 
     def get_all_entries(self) -> List[IndexEntry]:
         """Get all index entries."""
@@ -94,3 +183,17 @@ class StateManager:
     def get_notable_overrides_path(self) -> Path:
         """Get path to notable overrides file."""
         return self.overrides_dir / "notable.json"
+
+    def get_notable_rules_path(self) -> Path:
+        """Get path to notable rules file."""
+        return self.rules_dir / "notable.json"
+
+
+def _discard(index: Dict[str, Set[str]], key: str, omi_id: str):
+    """Remove omi_id from a secondary index bucket, dropping empty buckets."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.discard(omi_id)
+    if not bucket:
+        del index[key]
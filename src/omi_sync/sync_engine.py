@@ -1,19 +1,71 @@
 """Main sync orchestration engine."""
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Set
-from collections import defaultdict
-from pathlib import Path
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, TypeVar
 
+from omi_sync.buckets import DayBuckets, BucketItem
 from omi_sync.config import Config
 from omi_sync.models import Conversation, parse_conversation
-from omi_sync.finalization import is_finalized
-from omi_sync.notable import is_notable, load_overrides
-from omi_sync.timezone_utils import get_local_date, format_time_local, format_datetime_local
-from omi_sync.state import StateManager, IndexEntry
-from omi_sync.file_writer import write_file_atomic
-from omi_sync.generators.raw import generate_raw_daily
-from omi_sync.generators.event import generate_event_note, get_event_filename
+from omi_sync.columns import ConversationColumns
+from omi_sync.finalization import finalized_mask
+from omi_sync.notable import keyword_matcher, load_overrides, notable_match, overrides_mtime_ns
+from omi_sync.local_times import LocalTimes, local_times_for
+from omi_sync.conversation_store import ConversationStore
+from omi_sync.rules import RuleSet, load_rules
+from omi_sync.transcript_scan import TranscriptMatch, TranscriptScanner
+from omi_sync.timezone_utils import get_local_date, format_datetime_local
+from omi_sync.state import IndexEntry, StateManager
+from omi_sync.journal import RunJournal
+from omi_sync.write_queue import WriteQueue
+from omi_sync.render import DayRenderer, RenderedDay
+from omi_sync.hashing import hash_text
+from omi_sync.generators.event import generate_event_note
 from omi_sync.generators.highlights import generate_highlights
+from omi_sync.profiling import StageTimer
+
+# Conversations the finalize stage checks at a time, as one batch: about a
+# page, so a batch rarely waits on a second fetch
+BATCH_SIZE = 25
+
+T = TypeVar("T")
+
+# (raw API dict, parsed conversation)
+Parsed = Tuple[Dict[str, Any], Conversation]
+# (raw API dict, parsed conversation, local date, local date of the version it replaces)
+Dated = Tuple[Dict[str, Any], Conversation, str, Optional[str]]
+
+
+@dataclass
+class _SyncRun:
+    """State shared by the pipeline stages of one sync."""
+    buckets: DayBuckets
+    renderer: DayRenderer
+    journal: RunJournal
+    writes: WriteQueue
+    stats: Dict[str, Any]
+    timer: StageTimer
+    # omi_id -> (finished_at, local date) of the newest version seen
+    latest: Dict[str, Tuple[datetime, str]] = field(default_factory=dict)
+    # omi_id -> LocalTimes of that version, until its day is handed to the renderer
+    times: Dict[str, LocalTimes] = field(default_factory=dict)
+    notable_ids: Set[str] = field(default_factory=set)
+    # omi_id -> where a keyword was spoken, for conversations notable only for that
+    transcript_matches: Dict[str, TranscriptMatch] = field(default_factory=dict)
+    # Days already written that must be rendered again at the end
+    dirty_dates: Set[str] = field(default_factory=set)
+    event_ids: Set[str] = field(default_factory=set)
+    # Days flushed so far -> True if written, False if skipped as unchanged
+    flushed: Dict[str, bool] = field(default_factory=dict)
+    # omi_id -> event note on disk for the version flushed last
+    event_paths: Dict[str, str] = field(default_factory=dict)
+    # Only these local dates are synced (None = all)
+    dates: Optional[Set[str]] = None
+    # Compiled from the rules file, if there is one, in place of the built-in rules
+    rules: Optional[RuleSet] = None
+    # Conversations still inside the lag window, for StateManager.replace_pending
+    pending: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
 
 class SyncEngine:
@@ -21,98 +73,554 @@ class SyncEngine:
     Main sync orchestration.
 
     PRD: Idempotent sync with deterministic outputs.
+
+    With skip_unchanged, a day is not written again when the index already
+    records exactly its conversations, at the same finished_at and with the
+    same notable classification, and its Raw file exists. Long-running
+    callers use this to avoid rewriting the vault on every cycle.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, skip_unchanged: bool = False):
         self.config = config
+        self.skip_unchanged = skip_unchanged
         self.state = StateManager(config.vault_path)
-        self.overrides = load_overrides(self.state.get_notable_overrides_path())
+        self.store = ConversationStore(self.state.conversations_dir)
+        self.overrides: Dict[str, bool] = {}
+        self.overrides_mtime_ns: Optional[int] = None
+        self.reload_overrides()
+        self.keywords = keyword_matcher(config)
+        self.transcripts = (
+            TranscriptScanner(self.keywords, self.state.transcript_scan_file)
+            if config.notable_scan_transcript else None
+        )
 
-    def sync(self, api_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def reload_overrides(self) -> bool:
+        """Re-read the overrides file if its mtime changed since it was read; True if so."""
+        path = self.state.get_notable_overrides_path()
+        mtime_ns = overrides_mtime_ns(path)
+        if mtime_ns == self.overrides_mtime_ns:
+            return False
+        self.overrides = load_overrides(path) if mtime_ns is not None else {}
+        self.overrides_mtime_ns = mtime_ns
+        return True
+
+    def sync(
+        self,
+        api_data: Iterable[Dict[str, Any]],
+        dates: Optional[Set[str]] = None,
+        timer: Optional[StageTimer] = None,
+    ) -> Dict[str, Any]:
         """
         Run sync with provided API data.
 
-        Returns dict with status and stats.
+        api_data may be a list or any iterable in time order, such as pages
+        streamed from the API. Conversations flow one at a time through
+        parse, finalize-filter, dedupe, classify and bucket stages, and each
+        day is rendered and written as soon as the stream has moved past it,
+        so peak memory follows the largest day rather than the whole history.
+        Config.max_memory_mb bounds the open buckets further by spilling
+        them to disk. With Config.render_workers > 1, days render on a
+        process or thread pool; index updates and stats are still merged
+        here, in submission order, and output is identical to a serial run.
+
+        Conversations skipped as not yet finalized are recorded in the
+        pending queue with the time they become eligible (see pending.py).
+        With dates, only conversations finishing on those local dates are
+        synced and only their part of the pending queue is replaced; api_data
+        must then cover those days completely.
+
+        Files are staged in a RunJournal and applied together at the end,
+        before the index is saved; a journal left by a run that did not
+        finish is rolled forward first, so its completed days are kept.
+        Staging happens on Config.write_workers writer threads behind a
+        bounded queue, so rendering continues while files are written; a
+        day is recorded in the journal only once its files are staged.
+
+        Each written day's API data is also kept in the ConversationStore,
+        through the same journal, for apply_override_changes().
+
+        A notable rules file (see rules.py) is compiled at the start of each
+        run, so edits apply from the next run; stats["rules"] then holds
+        evaluations and hits per rule.
+
+        Returns dict with status, stats and timings: seconds per stage
+        (fetch, parse, finalize, dedupe, classify, bucket, store, render.*,
+        write, write.wait, index, commit, save) plus total. Pass a timer shared with the OmiClient to
+        split fetch into request and decode time; when api_data is fetched
+        on another thread (see prefetch), fetch is only the time spent
+        waiting for it and fetch.request overlaps the other stages. Render
+        and write stages are summed over days, so on a pool they can exceed
+        the wall time.
         """
-        # Parse and filter conversations
-        conversations = []
-        for data in api_data:
-            conv = parse_conversation(data)
-            if is_finalized(conv, self.config.finalization_lag_minutes):
-                conversations.append(conv)
-
-        # Deduplicate by omi_id (keep latest finished_at)
-        conv_by_id: Dict[str, Conversation] = {}
-        for conv in conversations:
-            existing = conv_by_id.get(conv.id)
-            if existing is None or (conv.finished_at and existing.finished_at and conv.finished_at > existing.finished_at):
-                conv_by_id[conv.id] = conv
-
-        conversations = list(conv_by_id.values())
-
-        # Classify notable
-        notable_ids: Set[str] = set()
-        for conv in conversations:
-            if is_notable(conv, self.config, self.overrides):
-                notable_ids.add(conv.id)
-
-        # Group by local date (based on finished_at)
-        by_date: Dict[str, List[Conversation]] = defaultdict(list)
-        for conv in conversations:
-            if conv.finished_at:
-                local_date = get_local_date(conv.finished_at, self.config.timezone)
-                by_date[local_date].append(conv)
-
-        # Update index entries
-        for conv in conversations:
-            if not conv.finished_at:
-                continue
-            local_date = get_local_date(conv.finished_at, self.config.timezone)
-            time_str = format_time_local(conv.started_at, self.config.timezone)
-            raw_heading = f"{time_str} — {conv.title} (omi:{conv.id})"
-
-            event_path = None
-            if conv.id in notable_ids:
-                event_path = f"Omi/Events/{get_event_filename(conv, self.config)}"
-
-            entry = IndexEntry(
-                omi_id=conv.id,
-                raw_date=local_date,
-                raw_heading=raw_heading,
-                event_path=event_path,
-                last_seen_finished_at=conv.finished_at.isoformat(),
+        stats = {
+            "conversations": 0, "dates": 0, "raw_files": 0, "event_files": 0, "highlights_files": 0,
+            "changed_conversations": 0, "not_finalized": 0, "skipped_dates": 0,
+            "files_written": 0, "bytes_written": 0, "writes_skipped": 0,
+            "transcripts_scanned": 0, "transcripts_cached": 0,
+        }
+        timer = timer or StageTimer()
+        started = timer.clock()
+        self._recover()
+        self.reload_overrides()
+        if self.transcripts is not None:
+            # Counted per run; the daemon keeps one engine across cycles
+            self.transcripts.scanned = self.transcripts.cached = 0
+        journal = RunJournal(self.state.sync_dir, self.config.vault_path, self.config.fsync_policy)
+        max_memory = self.config.max_memory_mb * 1024 * 1024 if self.config.max_memory_mb else None
+        # A list can simply be re-read if a written day needs rendering again;
+        # a one-shot stream has to keep retired days on disk instead.
+        reiterable = isinstance(api_data, Sequence)
+
+        # One timestamp per run keeps parallel output identical to serial
+        generated_at = format_datetime_local(datetime.now(timezone.utc), self.config.timezone)
+        renderer = DayRenderer(
+            self.config, generated_at, self.config.render_workers, self.config.render_executor, write=False
+        )
+        writes = WriteQueue(self.config.write_workers)
+
+        with DayBuckets(max_memory=max_memory, retain_retired=not reiterable) as buckets, renderer, journal, writes:
+            run = _SyncRun(
+                buckets=buckets, renderer=renderer, journal=journal, writes=writes,
+                stats=stats, timer=timer, dates=dates,
+                rules=load_rules(self.state.get_notable_rules_path()),
             )
-            self.state.set_index_entry(conv.id, entry)
-
-        # Generate and write files for each affected date
-        stats = {"dates": 0, "raw_files": 0, "event_files": 0, "highlights_files": 0}
-
-        for date, date_convs in by_date.items():
-            stats["dates"] += 1
-
-            # Raw daily file
-            raw_content = generate_raw_daily(date_convs, date, self.config)
-            raw_path = self.config.vault_path / "Omi" / "Raw" / f"{date}.md"
-            write_file_atomic(raw_path, raw_content)
-            stats["raw_files"] += 1
-
-            # Event notes for notable conversations
-            date_notable_ids = {c.id for c in date_convs if c.id in notable_ids}
-            for conv in date_convs:
-                if conv.id in notable_ids:
-                    event_content = generate_event_note(conv, self.config)
-                    event_path = self.config.vault_path / "Omi" / "Events" / get_event_filename(conv, self.config)
-                    write_file_atomic(event_path, event_content)
-                    stats["event_files"] += 1
-
-            # Highlights file
-            highlights_content = generate_highlights(date_convs, date, date_notable_ids, self.config)
-            highlights_path = self.config.vault_path / "Omi" / "Highlights" / f"{date} Highlights.md"
-            write_file_atomic(highlights_path, highlights_content)
-            stats["highlights_files"] += 1
-
-        # Save state
-        self.state.update_last_run(format_datetime_local(datetime.now(timezone.utc), self.config.timezone))
-        self.state.save()
-
-        return {"status": "DONE", "stats": stats}
+
+            stream = self._parse(api_data, run)
+            stream = self._finalized(stream, run)
+            stream = self._dedupe(stream, run)
+            stream = self._classify(stream, run)
+            for date, items in self._bucket(stream, run):
+                self._flush_day(date, items, run)
+
+            for date, items in buckets.pop_remaining():
+                self._flush_day(date, items, run)
+
+            # Days that received conversations after being written
+            self._drain(run)
+            with timer.stage("bucket"):
+                reloaded = self._reload_days(run.dirty_dates, api_data, run)
+            for date in sorted(reloaded):
+                self._flush_day(date, reloaded.pop(date), run, rerender=True)
+            self._drain(run)
+            writes.barrier()
+            stats["bytes_written"] += writes.bytes_written
+            timer.merge({"write": writes.write_seconds, "write.wait": writes.wait_seconds})
+
+            # Move staged files into place, then commit the index
+            with timer.stage("commit"):
+                journal.apply()
+            with timer.stage("save"):
+                self.state.replace_pending(run.pending, dates)
+                self.state.update_last_run(generated_at)
+                if dates is None:
+                    # Every conversation was classified with these
+                    self.state.set_applied_overrides(self.overrides, self.overrides_mtime_ns)
+                self.state.save(fsync=self.config.fsync_policy != "none")
+                if self.transcripts is not None:
+                    self.transcripts.save()
+            journal.clear()
+
+        if self.transcripts is not None:
+            stats["transcripts_scanned"] = self.transcripts.scanned
+            stats["transcripts_cached"] = self.transcripts.cached
+        if run.rules is not None:
+            # Evaluations and hits per rule
+            stats["rules"] = run.rules.counters()
+
+        timings = dict(sorted(timer.timings.items()))
+        timings["total"] = timer.clock() - started
+        return {"status": "DONE", "stats": stats, "timings": timings}
+
+    def apply_override_changes(self) -> Optional[Dict[str, Any]]:
+        """
+        Apply edits to the overrides file without a sync.
+
+        The overrides are diffed against the set the last full sync (or the
+        last call) applied, and only conversations whose override changed are
+        classified again, from the conversation store. Where that flips a
+        conversation, its event note is written or deleted and its day's
+        Highlights file rendered again; Raw files are left alone. Changes go
+        through a RunJournal, like a sync's.
+
+        Returns None if the file has not changed since it was last applied;
+        otherwise a result like sync()'s, where stats["unavailable"] counts
+        conversations not in the store as the index records them, which are
+        left for the next full sync.
+        """
+        timer = StageTimer()
+        started = timer.clock()
+        self._recover()
+        self.reload_overrides()
+        applied, applied_mtime_ns = self.state.get_applied_overrides()
+        if self.overrides_mtime_ns == applied_mtime_ns:
+            return None
+        stats = {
+            "changed_overrides": 0, "reclassified": 0, "unavailable": 0,
+            "event_files": 0, "events_deleted": 0, "highlights_files": 0,
+        }
+
+        with timer.stage("diff"):
+            changed = {
+                omi_id for omi_id in set(applied) | set(self.overrides)
+                if applied.get(omi_id) != self.overrides.get(omi_id)
+            }
+            stats["changed_overrides"] = len(changed)
+            by_date: Dict[str, List[str]] = {}
+            for omi_id in sorted(changed):
+                entry = self.state.get_index_entry(omi_id)
+                if entry is not None:
+                    by_date.setdefault(entry.raw_date, []).append(omi_id)
+
+        generated_at = format_datetime_local(datetime.now(timezone.utc), self.config.timezone)
+        omi_dir = self.config.vault_path / "Omi"
+        rules = load_rules(self.state.get_notable_rules_path())
+        updated: List[IndexEntry] = []
+        with RunJournal(self.state.sync_dir, self.config.vault_path, self.config.fsync_policy) as journal:
+            for date in sorted(by_date):
+                with timer.stage("load"):
+                    stored = self.store.load(date)
+                    entries = {e.omi_id: e for e in self.state.get_entries_for_date(date)}
+                if set(stored) != set(entries):
+                    # Stored by a version before the store, or out of step with the index
+                    stats["unavailable"] += len(by_date[date])
+                    continue
+                with timer.stage("parse"):
+                    # In the order the day was rendered, so ties sort the same
+                    convs = [parse_conversation(data) for data in stored.values()]
+                    by_id = {c.id: c for c in convs}
+                notable_ids = {omi_id for omi_id, e in entries.items() if e.event_path}
+                flipped = []
+                for omi_id in by_date[date]:
+                    with timer.stage("classify"):
+                        notable, match = notable_match(
+                            by_id[omi_id], self.config, self.overrides, self.keywords, self.transcripts, rules
+                        )
+                    stats["reclassified"] += 1
+                    if notable != (omi_id in notable_ids):
+                        flipped.append((omi_id, notable, match))
+                if not flipped:
+                    continue
+
+                times = local_times_for(convs, self.config.timezone)
+                for omi_id, notable, match in flipped:
+                    entry = entries[omi_id]
+                    if notable:
+                        notable_ids.add(omi_id)
+                        with timer.stage("render.event"):
+                            event_path = f"Omi/Events/{times[omi_id].event_filename}"
+                            content = generate_event_note(
+                                by_id[omi_id], self.config, generated_at, times[omi_id], match
+                            )
+                        _journal_write(journal, self.config.vault_path / event_path, content)
+                        entry = replace(entry, event_path=event_path, event_content_hash=hash_text(content))
+                        stats["event_files"] += 1
+                    else:
+                        notable_ids.discard(omi_id)
+                        journal.record_delete(self.config.vault_path / entry.event_path)
+                        entry = replace(entry, event_path=None, event_content_hash=None)
+                        stats["events_deleted"] += 1
+                    updated.append(entry)
+
+                with timer.stage("render.highlights"):
+                    path = omi_dir / "Highlights" / f"{date} Highlights.md"
+                    content = generate_highlights(convs, date, notable_ids, self.config, generated_at, times)
+                _journal_write(journal, path, content)
+                stats["highlights_files"] += 1
+
+            journal.record_entries(updated)
+            with timer.stage("commit"):
+                journal.apply()
+            with timer.stage("save"):
+                for entry in updated:
+                    self.state.set_index_entry(entry.omi_id, entry)
+                self.state.set_applied_overrides(self.overrides, self.overrides_mtime_ns)
+                self.state.save(fsync=self.config.fsync_policy != "none")
+            journal.clear()
+
+        timings = dict(sorted(timer.timings.items()))
+        timings["total"] = timer.clock() - started
+        return {"status": "DONE", "stats": stats, "timings": timings}
+
+    def _recover(self):
+        """Roll forward the journal of a run that did not finish, then reload the index."""
+        journal = RunJournal(self.state.sync_dir, self.config.vault_path, self.config.fsync_policy)
+        entries = journal.roll_forward()
+        if entries is None:
+            return
+        # Start from the index as last saved, plus what that run completed
+        self.state = StateManager(self.config.vault_path)
+        for entry in entries:
+            self.state.set_index_entry(entry.omi_id, entry)
+        self.state.save(fsync=self.config.fsync_policy != "none")
+        journal.clear()
+
+    def _drain(self, run: _SyncRun):
+        """Wait for every day handed to the renderer."""
+        with run.timer.stage("render.wait"):
+            done = run.renderer.drain()
+        for rendered in done:
+            self._apply(rendered, run)
+
+    def _parse(self, api_data: Iterable[Dict[str, Any]], run: _SyncRun) -> Iterator[Parsed]:
+        """Parse stage."""
+        for data in run.timer.iterate(api_data, "fetch"):
+            run.stats["conversations"] += 1
+            with run.timer.stage("parse"):
+                conv = parse_conversation(data)
+            yield data, conv
+
+    def _finalized(self, stream: Iterable[Parsed], run: _SyncRun) -> Iterator[Parsed]:
+        """Finalize-filter stage: queue conversations still inside the lag window."""
+        for batch in _batches(stream):
+            with run.timer.stage("finalize"):
+                columns = ConversationColumns.of([conv for _, conv in batch])
+                mask = finalized_mask(columns, self.config.finalization_lag_minutes)
+                for (_, conv), finalized in zip(batch, mask):
+                    if not finalized:
+                        self._queue_pending(conv, run)
+            for item, finalized in zip(batch, mask):
+                if finalized:
+                    yield item
+
+    def _queue_pending(self, conv: Conversation, run: _SyncRun):
+        """Record when a conversation inside the lag window becomes eligible."""
+        run.stats["not_finalized"] += 1
+        if conv.finished_at is None:
+            # Still recording; picked up by the next full sync
+            return
+        date = get_local_date(conv.finished_at, self.config.timezone)
+        if run.dates is None or date in run.dates:
+            finished = conv.finished_at
+            if finished.tzinfo is None:
+                finished = finished.replace(tzinfo=timezone.utc)
+            eligible_at = finished.astimezone(timezone.utc) + timedelta(minutes=self.config.finalization_lag_minutes)
+            run.pending[conv.id] = {"eligible_at": eligible_at.isoformat(), "date": date}
+
+    def _dedupe(self, stream: Iterable[Parsed], run: _SyncRun) -> Iterator[Dated]:
+        """
+        Dedupe stage: keep the version with the latest finished_at per omi_id.
+
+        Later versions are passed on together with the day of the version
+        they replace, so the bucket stage can withdraw it.
+        """
+        for data, conv in stream:
+            with run.timer.stage("dedupe"):
+                # Group by local date (based on finished_at); the other local
+                # times are worked out here too, once, for the renderer
+                times = LocalTimes.of(conv, self.config.timezone)
+                date = times.date
+                if run.dates is not None and date not in run.dates:
+                    continue
+                previous = run.latest.get(conv.id)
+                if previous is not None and conv.finished_at <= previous[0]:
+                    continue
+                run.latest[conv.id] = (conv.finished_at, date)
+                run.times[conv.id] = times
+            yield data, conv, date, previous[1] if previous else None
+
+    def _classify(self, stream: Iterable[Dated], run: _SyncRun) -> Iterator[Dated]:
+        """Classify stage: track which conversations are notable."""
+        for item in stream:
+            conv = item[1]
+            with run.timer.stage("classify"):
+                notable, match = notable_match(
+                    conv, self.config, self.overrides, self.keywords, self.transcripts, run.rules
+                )
+                if notable:
+                    run.notable_ids.add(conv.id)
+                else:
+                    run.notable_ids.discard(conv.id)
+                if match is not None:
+                    run.transcript_matches[conv.id] = match
+                else:
+                    run.transcript_matches.pop(conv.id, None)
+            yield item
+
+    def _bucket(self, stream: Iterable[Dated], run: _SyncRun) -> Iterator[Tuple[str, List[BucketItem]]]:
+        """Bucket stage: collect conversations per day and yield completed days."""
+        buckets = run.buckets
+        for data, conv, date, replaced_date in stream:
+            with run.timer.stage("bucket"):
+                if replaced_date is not None:
+                    if buckets.is_retired(replaced_date):
+                        run.dirty_dates.add(replaced_date)
+                    else:
+                        buckets.discard(replaced_date, conv.id)
+                if not buckets.add(date, data, conv):
+                    run.dirty_dates.add(date)
+                completed = [(d, buckets.pop(d)) for d in buckets.ready()]
+            yield from completed
+
+    def _reload_days(
+        self, dates: Set[str], api_data: Iterable[Dict[str, Any]], run: _SyncRun
+    ) -> Dict[str, List[BucketItem]]:
+        """Collect everything seen for days that have already been written."""
+        if run.buckets.retain_retired:
+            return {date: run.buckets.load_retired(date) for date in dates}
+        # One pass over the input for all dirty days together
+        wanted = {omi_id: d for omi_id, (_, d) in run.latest.items() if d in dates}
+        days: Dict[str, List[BucketItem]] = {date: [] for date in dates}
+        for data in api_data:
+            date = wanted.get(data.get("id"))
+            if date is not None:
+                days[date].append((data, None))
+        return days
+
+    def _current_versions(self, date: str, items: List[BucketItem], run: _SyncRun) -> List[Parsed]:
+        """Parse items back where needed and keep only the newest version of each."""
+        current = []
+        seen: Set[str] = set()
+        for data, conv in items:
+            if conv is None:
+                conv = parse_conversation(data)
+            if conv.id not in seen and run.latest.get(conv.id) == (conv.finished_at, date):
+                seen.add(conv.id)
+                current.append((data, conv))
+        return current
+
+    def _flush_day(self, date: str, items: List[BucketItem], run: _SyncRun, rerender: bool = False):
+        """Render and write stage: hand one day to the renderer."""
+        with run.timer.stage("bucket"):
+            current = self._current_versions(date, items, run)
+            date_convs = [conv for _, conv in current]
+            if not date_convs:
+                if rerender:
+                    self._remove_day(date, run)
+                return
+            date_notable_ids = {c.id for c in date_convs if c.id in run.notable_ids}
+            # Days rendered again later recompute theirs
+            times = {c.id: run.times.pop(c.id) for c in date_convs if c.id in run.times}
+            matches = {c.id: run.transcript_matches[c.id] for c in date_convs if c.id in run.transcript_matches}
+            unchanged = not rerender and self.skip_unchanged and self._day_unchanged(date, date_convs, date_notable_ids)
+        store_path = self.store.path(date)
+        if not unchanged or not store_path.exists():
+            with run.timer.stage("store"):
+                self._stage(store_path, self.store.dumps(data for data, _ in current), run)
+        if unchanged:
+            run.stats["skipped_dates"] += 1
+            run.stats["writes_skipped"] += 2  # Raw and Highlights
+            run.flushed[date] = False
+            # What is on disk for this day is what the index recorded
+            for entry in self.state.get_entries_for_date(date):
+                if entry.event_path:
+                    run.event_paths[entry.omi_id] = entry.event_path
+                    run.stats["writes_skipped"] += 1
+            return
+        if not run.flushed.get(date):
+            if date in run.flushed:
+                run.stats["skipped_dates"] -= 1
+            run.flushed[date] = True
+            run.stats["dates"] += 1
+            run.stats["raw_files"] += 1
+            run.stats["highlights_files"] += 1
+
+        if run.renderer.parallel:
+            with run.timer.stage("render.wait"):
+                done = run.renderer.submit(date, date_convs, date_notable_ids, times, matches)
+        else:
+            # Rendered inline; the day reports its own render and write timings
+            done = run.renderer.submit(date, date_convs, date_notable_ids, times, matches)
+        for rendered in done:
+            self._apply(rendered, run)
+
+    def _remove_day(self, date: str, run: _SyncRun):
+        """
+        Delete the files of a day flushed this run that no longer has any conversations.
+
+        Happens when newer versions moved every conversation of the day
+        elsewhere; their old event notes are removed by _apply.
+        """
+        written = run.flushed.pop(date, None)
+        if written is None:
+            return
+        omi_dir = self.config.vault_path / "Omi"
+        for path in (omi_dir / "Raw" / f"{date}.md", omi_dir / "Highlights" / f"{date} Highlights.md"):
+            self._record_delete(path, run)
+        self._record_delete(self.store.path(date), run)
+        if written:
+            run.stats["dates"] -= 1
+            run.stats["raw_files"] -= 1
+            run.stats["highlights_files"] -= 1
+        else:
+            run.stats["skipped_dates"] -= 1
+
+    def _day_unchanged(self, date: str, conversations: List[Conversation], notable_ids: Set[str]) -> bool:
+        """True if the index already describes this day exactly as it would be written."""
+        entries = self.state.get_entries_for_date(date)
+        if sorted(e.omi_id for e in entries) != sorted(c.id for c in conversations):
+            return False
+        by_id = {c.id: c for c in conversations}
+        for entry in entries:
+            conv = by_id[entry.omi_id]
+            if entry.last_seen_finished_at != conv.finished_at.isoformat():
+                return False
+            if (entry.event_path is not None) != (conv.id in notable_ids):
+                return False
+        return (self.config.vault_path / "Omi" / "Raw" / f"{date}.md").exists()
+
+    def _apply(self, rendered: RenderedDay, run: _SyncRun):
+        """Queue a rendered day's files and merge its index entries, stats and timings."""
+        run.timer.merge(rendered.timings)
+        run.stats["files_written"] += len(rendered.files)
+        staged = [(path, run.journal.reserve()) for path, _ in rendered.files]
+
+        def record():
+            for path, name in staged:
+                run.journal.record_write(path, name)
+            run.journal.record_entries(rendered.entries)
+
+        run.writes.submit(
+            [(run.journal.write_staged, (name, content)) for (_, name), (_, content) in zip(staged, rendered.files)],
+            then=record,
+        )
+        with run.timer.stage("index"):
+            for entry in rendered.entries:
+                previous = self.state.get_index_entry(entry.omi_id)
+                if previous is None or previous.last_seen_finished_at != entry.last_seen_finished_at:
+                    run.stats["changed_conversations"] += 1
+                self.state.set_index_entry(entry.omi_id, entry)
+                self._replace_event_path(entry.omi_id, entry.event_path, run)
+            for omi_id in rendered.event_ids:
+                if omi_id not in run.event_ids:
+                    run.event_ids.add(omi_id)
+                    run.stats["event_files"] += 1
+
+    def _stage(self, path, content: str, run: _SyncRun):
+        """Journal a write of content to path, staged on a writer thread."""
+        name = run.journal.reserve()
+        run.writes.submit(
+            [(run.journal.write_staged, (name, content))],
+            then=lambda: run.journal.record_write(path, name),
+        )
+
+    def _record_delete(self, path, run: _SyncRun):
+        """Journal a deletion after the writes queued before it."""
+        run.writes.submit([], then=lambda: run.journal.record_delete(path))
+
+    def _replace_event_path(self, omi_id: str, event_path: Optional[str], run: _SyncRun):
+        """Delete the event note of a superseded version flushed earlier in this run."""
+        stale = run.event_paths.pop(omi_id, None)
+        if event_path:
+            run.event_paths[omi_id] = event_path
+        if stale is None or stale == event_path:
+            return
+        self._record_delete(self.config.vault_path / stale, run)
+        if not event_path and omi_id in run.event_ids:
+            run.event_ids.discard(omi_id)
+            run.stats["event_files"] -= 1
+
+
+def _journal_write(journal: RunJournal, path, content: str):
+    """Stage content for path and record the write."""
+    staged, _ = journal.stage(path, content)
+    journal.record_write(path, staged)
+
+
+def _batches(stream: Iterable[T]) -> Iterator[List[T]]:
+    """Group a stream into lists of BATCH_SIZE (the last may be shorter)."""
+    iterator = iter(stream)
+    while True:
+        batch = list(islice(iterator, BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
@@ -1,7 +1,22 @@
 """Timezone utilities for date grouping."""
-from datetime import datetime
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
 import pytz
 
+from omi_sync.columns import optional_numpy
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+@lru_cache(maxsize=None)
+def get_zone(timezone_name: str) -> pytz.BaseTzInfo:
+    """The pytz zone for a name, looked up once per process."""
+    return pytz.timezone(timezone_name)
+
 
 def get_local_date(dt: datetime, timezone_name: str) -> str:
     """
@@ -9,7 +24,7 @@ def get_local_date(dt: datetime, timezone_name: str) -> str:
 
     PRD: Group by finished_at in TIMEZONE.
     """
-    tz = pytz.timezone(timezone_name)
+    tz = get_zone(timezone_name)
 
     # Ensure datetime is timezone-aware
     if dt.tzinfo is None:
@@ -21,7 +36,7 @@ def get_local_date(dt: datetime, timezone_name: str) -> str:
 
 def format_time_local(dt: datetime, timezone_name: str) -> str:
     """Format datetime as HH:MM in local timezone."""
-    tz = pytz.timezone(timezone_name)
+    tz = get_zone(timezone_name)
 
     if dt.tzinfo is None:
         dt = pytz.utc.localize(dt)
@@ -32,10 +47,94 @@ def format_time_local(dt: datetime, timezone_name: str) -> str:
 
 def format_datetime_local(dt: datetime, timezone_name: str) -> str:
     """Format datetime as ISO8601 in local timezone."""
-    tz = pytz.timezone(timezone_name)
+    tz = get_zone(timezone_name)
 
     if dt.tzinfo is None:
         dt = pytz.utc.localize(dt)
 
     local_dt = dt.astimezone(tz)
     return local_dt.isoformat()
+
+
+def epoch_seconds(dt: datetime) -> float:
+    """Seconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class ZoneTable:
+    """
+    A zone's UTC offsets as a transition table, for converting many instants.
+
+    Built from the same pytz data astimezone() uses, and looked up the same
+    way (the last transition at or before the instant), so every result
+    matches get_local_date() and format_time_local(), DST changes included.
+    Instants are epoch seconds; a lookup is a bisect plus arithmetic, with
+    no datetime objects created. Use zone_table() for a cached instance.
+    """
+
+    def __init__(self, timezone_name: str):
+        tz = get_zone(timezone_name)
+        transitions = getattr(tz, "_utc_transition_times", None)
+        if transitions:
+            # The first transition is datetime.min: the offset before any recorded change
+            self.transitions = [float("-inf")] + [
+                (t - _EPOCH).total_seconds() for t in transitions[1:]
+            ]
+            self.offsets = [int(info[0].total_seconds()) for info in tz._transition_info]
+        else:
+            # Fixed offset (UTC, EST, Etc/GMT+5, ...)
+            self.transitions = [float("-inf")]
+            self.offsets = [int(tz.localize(datetime(2000, 1, 1)).utcoffset().total_seconds())]
+        self._dates: Dict[int, str] = {}
+
+    def utcoffset(self, epoch: float) -> int:
+        """Offset from UTC in seconds at an instant."""
+        return self.offsets[bisect_right(self.transitions, epoch) - 1]
+
+    def local_date(self, epoch: float) -> str:
+        """Local date (YYYY-MM-DD) at an instant."""
+        return self._date(int((epoch + self.utcoffset(epoch)) // 86400))
+
+    def local_time(self, epoch: float) -> str:
+        """Local HH:MM at an instant."""
+        minutes = int((epoch + self.utcoffset(epoch)) // 60) % 1440
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+    def local_dates(self, epochs: Sequence[float]) -> List[str]:
+        """
+        Local dates of a batch of instants, in order.
+
+        Vectorized with NumPy when it is installed; otherwise one bisect per
+        instant. Either way each distinct day is formatted once.
+        """
+        np = optional_numpy()
+        if np is None:
+            return [self.local_date(e) for e in epochs]
+        values = np.asarray(epochs, dtype=np.float64)
+        if not values.size:
+            return []
+        index = np.searchsorted(np.asarray(self.transitions), values, side="right") - 1
+        local = values + np.asarray(self.offsets, dtype=np.float64)[index]
+        days, inverse = np.unique(np.floor_divide(local, 86400).astype(np.int64), return_inverse=True)
+        names = [self._date(int(d)) for d in days]
+        return [names[i] for i in inverse.ravel()]
+
+    def _date(self, day: int) -> str:
+        name = self._dates.get(day)
+        if name is None:
+            name = self._dates[day] = (_EPOCH_DATE + timedelta(days=day)).isoformat()
+        return name
+
+
+@lru_cache(maxsize=None)
+def zone_table(timezone_name: str) -> ZoneTable:
+    """The ZoneTable for a name, built once per process."""
+    return ZoneTable(timezone_name)
+
+
+def local_dates(datetimes: Sequence[datetime], timezone_name: str) -> List[str]:
+    """get_local_date() for a batch of datetimes at once."""
+    return zone_table(timezone_name).local_dates([epoch_seconds(dt) for dt in datetimes])
+
@@ -0,0 +1,113 @@
+"""Notable keyword scan over transcripts, cached per content hash."""
+import hashlib
+import json
+from bisect import bisect_right
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from omi_sync.file_writer import write_file_atomic
+from omi_sync.keywords import KeywordMatcher
+from omi_sync.models import Conversation, TranscriptSegment
+
+
+@dataclass
+class TranscriptMatch:
+    """The first notable keyword spoken in a transcript, and where."""
+    keyword: str
+    # Index into transcript_segments of the segment it was found in
+    segment: int
+    # That segment's start, in seconds from the start of the conversation
+    start: float
+
+
+class TranscriptScanner:
+    """
+    Find the first notable keyword in each conversation's transcript.
+
+    The segments are joined into one text and searched once with the
+    compiled KeywordMatcher, which stops at the first match; the segment
+    it falls in is then found by bisecting the segment offsets. Results
+    are cached per conversation together with a hash of the transcript
+    text, so a conversation fetched again unchanged is not scanned again.
+
+    Stored as transcript_scan.json in Omi/.omi-sync/ with a fingerprint of
+    the keyword list; changing the keywords discards every cached result.
+    """
+
+    VERSION = 1
+
+    def __init__(self, keywords: KeywordMatcher, path: Optional[Path] = None):
+        self.keywords = keywords
+        self.path = path
+        self.fingerprint = hashlib.sha256(
+            json.dumps([keywords.whole_words, keywords.keywords]).encode("utf-8")
+        ).hexdigest()
+        # omi_id -> (transcript hash, match or None)
+        self._results: Dict[str, Tuple[str, Optional[TranscriptMatch]]] = {}
+        self.scanned = 0
+        self.cached = 0
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        """Load cached results, ignoring unreadable, outdated or other-keyword data."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        if data.get("version") != self.VERSION or data.get("keywords") != self.fingerprint:
+            return
+        for omi_id, (digest, match) in data.get("conversations", {}).items():
+            self._results[omi_id] = (digest, TranscriptMatch(**match) if match else None)
+
+    def save(self, fsync: bool = False):
+        """Save cached results to disk."""
+        if self.path is None:
+            return
+        data = {
+            "version": self.VERSION,
+            "keywords": self.fingerprint,
+            "conversations": {
+                omi_id: [digest, asdict(match) if match else None]
+                for omi_id, (digest, match) in self._results.items()
+            },
+        }
+        write_file_atomic(self.path, json.dumps(data, sort_keys=True), fsync=fsync)
+
+    def scan(self, conv: Conversation) -> Optional[TranscriptMatch]:
+        """The first keyword in conv's transcript, or None."""
+        segments = conv.transcript_segments
+        if not segments or not len(self.keywords):
+            return None
+        # Keywords never contain newlines, so none can match across two segments
+        text = "\n".join(seg.text for seg in segments)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cached = self._results.get(conv.id)
+        if cached is not None and cached[0] == digest:
+            self.cached += 1
+            return cached[1]
+
+        self.scanned += 1
+        match = None
+        found = self.keywords.find_lower(text.lower())
+        if found is not None:
+            keyword, position = found
+            index = bisect_right(_offsets(segments), position) - 1
+            match = TranscriptMatch(keyword=keyword, segment=index, start=float(segments[index].start))
+        self._results[conv.id] = (digest, match)
+        return match
+
+
+def _offsets(segments: List[TranscriptSegment]) -> List[int]:
+    """Where each segment's text starts in the lowercased, newline-joined transcript."""
+    offsets = []
+    position = 0
+    for seg in segments:
+        offsets.append(position)
+        # Lowercasing can change a string's length (e.g. dotted capital I)
+        position += len(seg.text.lower()) + 1
+    return offsets
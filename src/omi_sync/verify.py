@@ -0,0 +1,89 @@
+"""Check the vault against the index without re-rendering."""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from omi_sync.config import Config
+from omi_sync.hashing import hash_stream, raw_section_hashes
+from omi_sync.state import StateManager, IndexEntry
+
+# Discrepancy kinds, with the marker used when printing a compact diff.
+MISSING = "-"
+CHANGED = "~"
+UNREADABLE = "!"
+
+
+@dataclass(frozen=True)
+class Discrepancy:
+    """One way the vault differs from what the index recorded."""
+    marker: str
+    date: str
+    omi_id: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.marker} {self.date}  omi:{self.omi_id}  {self.message}"
+
+
+def verify_vault(config: Config, workers: Optional[int] = None) -> List[Discrepancy]:
+    """
+    Compare every index entry against the files in the vault.
+
+    Checks that each entry's Raw heading exists in Omi/Raw/<date>.md, that
+    each event_path exists, and that recorded content hashes still match.
+    Every Raw file and event note is read once, days are checked in
+    parallel, and results come back sorted by date and omi_id.
+    """
+    state = StateManager(config.vault_path)
+    days = [(date, state.get_entries_for_date(date)) for date in state.get_dates()]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda day: _verify_day(config.vault_path, *day), days)
+        return [d for day_result in results for d in day_result]
+
+
+def _verify_day(vault_path: Path, date: str, entries: List[IndexEntry]) -> List[Discrepancy]:
+    """Check one day's Raw file and the event notes of its entries."""
+    found: List[Discrepancy] = []
+    raw_rel = f"Omi/Raw/{date}.md"
+    raw_path = vault_path / raw_rel
+
+    error = None
+    try:
+        with open(raw_path, "rb") as f:
+            sections = raw_section_hashes(f)
+    except FileNotFoundError:
+        sections = None
+    except (OSError, UnicodeDecodeError) as e:
+        sections, error = None, e
+
+    for entry in entries:
+        if error is not None:
+            found.append(Discrepancy(UNREADABLE, date, entry.omi_id, f"{raw_rel} unreadable: {error}"))
+        elif sections is None:
+            found.append(Discrepancy(MISSING, date, entry.omi_id, f"{raw_rel} missing"))
+        elif entry.omi_id not in sections or sections[entry.omi_id][0] != entry.raw_heading:
+            found.append(Discrepancy(MISSING, date, entry.omi_id, f"heading not in {raw_rel}: {entry.raw_heading}"))
+        elif entry.last_content_hash and sections[entry.omi_id][1] != entry.last_content_hash:
+            found.append(Discrepancy(CHANGED, date, entry.omi_id, f"section changed in {raw_rel}"))
+
+        if entry.event_path:
+            found.extend(_verify_event(vault_path, date, entry))
+
+    return found
+
+
+def _verify_event(vault_path: Path, date: str, entry: IndexEntry) -> List[Discrepancy]:
+    """Check that an entry's event note exists and matches its recorded hash."""
+    try:
+        with open(vault_path / entry.event_path, "rb") as f:
+            digest = hash_stream(f) if entry.event_content_hash else None
+    except FileNotFoundError:
+        return [Discrepancy(MISSING, date, entry.omi_id, f"{entry.event_path} missing")]
+    except OSError as e:
+        return [Discrepancy(UNREADABLE, date, entry.omi_id, f"{entry.event_path} unreadable: {e}")]
+
+    if digest is not None and digest != entry.event_content_hash:
+        return [Discrepancy(CHANGED, date, entry.omi_id, f"{entry.event_path} changed")]
+    return []
@@ -0,0 +1,104 @@
+"""Write-behind file writes on a small pool of writer threads."""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, List, Tuple
+
+# A write: a function returning the number of bytes written, and its arguments
+Write = Tuple[Callable[..., int], tuple]
+
+
+class WriteQueue:
+    """
+    Run file writes on writer threads while the caller keeps rendering.
+
+    Writes are submitted in batches (one per day). submit() returns as
+    soon as the batch is queued, blocking only while max_pending writes
+    are already outstanding, so a fast renderer cannot run ahead of the
+    disk without bound. Each batch's then() callback runs on the caller's
+    thread once all its writes have succeeded, in submission order. A
+    failed write is raised from the next submit() or barrier().
+
+    barrier() waits for every write. With workers=0 writes run inline.
+    Seconds spent writing and bytes written are summed across threads;
+    wait_seconds is the time the caller spent blocked on the queue.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 64):
+        self.workers = workers
+        self.write_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.bytes_written = 0
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._batches: Deque[Tuple[List[Future], Callable[[], None]]] = deque()
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="omi-writer") if workers > 0 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def submit(self, writes: List[Write], then: Callable[[], None] = lambda: None):
+        """Queue a batch of writes; then() runs once they have all succeeded."""
+        if self._pool is None:
+            for fn, args in writes:
+                self._run(fn, args)
+            then()
+            return
+
+        futures = []
+        for fn, args in writes:
+            started = time.perf_counter()
+            self._slots.acquire()
+            self.wait_seconds += time.perf_counter() - started
+            future = self._pool.submit(self._run, fn, args)
+            future.add_done_callback(lambda _: self._slots.release())
+            futures.append(future)
+        self._batches.append((futures, then))
+        self._collect(block=False)
+
+    def barrier(self):
+        """Wait for every queued write, raising the first failure."""
+        started = time.perf_counter()
+        self._collect(block=True)
+        self.wait_seconds += time.perf_counter() - started
+
+    def close(self):
+        """
+        Finish the queued writes and stop the writer threads.
+
+        Batches that succeeded still get their then() callbacks, up to the
+        first one that failed, so an aborted run keeps what it wrote.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        while self._batches:
+            futures, then = self._batches[0]
+            if any(f.exception() is not None for f in futures):
+                break
+            self._batches.popleft()
+            then()
+        self._batches.clear()
+
+    def _collect(self, block: bool):
+        """Finish batches from the head of the queue: all of them, or only those already done."""
+        while self._batches:
+            futures, then = self._batches[0]
+            if not block and not all(f.done() for f in futures):
+                return
+            for future in futures:
+                future.result()
+            self._batches.popleft()
+            then()
+
+    def _run(self, fn: Callable[..., int], args: tuple):
+        started = time.perf_counter()
+        written = fn(*args)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.write_seconds += elapsed
+            self.bytes_written += written
@@ -15,3 +15,14 @@ def temp_vault():
 def fixtures_dir():
     """Return path to fixtures directory."""
     return Path(__file__).parent.parent / "fixtures"
+
+@pytest.fixture(params=["python", "numpy"])
+def vector_backend(request, monkeypatch):
+    """Run a batch test once on the pure-Python path and once with NumPy (if installed)."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        from omi_sync import columns, finalization, notable, timezone_utils
+        for module in (columns, finalization, notable, timezone_utils):
+            monkeypatch.setattr(module, "optional_numpy", lambda: None)
+    return request.param
@@ -93,3 +93,22 @@ class TestOmiClient:
             conversations = client.fetch_all_conversations()
 
         assert conversations == []
+
+    def test_iter_conversations_fetches_pages_lazily(self, httpx_mock):
+        """The next page is only requested once the current one is consumed."""
+        httpx_mock.add_response(
+            url="https://api.omi.me/v1/dev/user/conversations?include_transcript=true&limit=2&offset=0",
+            json=[{"id": "a"}, {"id": "b"}],
+        )
+        httpx_mock.add_response(
+            url="https://api.omi.me/v1/dev/user/conversations?include_transcript=true&limit=2&offset=2",
+            json=[],
+        )
+
+        client = OmiClient(api_key="test", base_url="https://api.omi.me/v1/dev", page_size=2)
+        conversations = client.iter_conversations()
+
+        assert next(conversations)["id"] == "a"
+        assert len(httpx_mock.get_requests()) == 1
+        assert [c["id"] for c in conversations] == ["b"]
+        assert len(httpx_mock.get_requests()) == 2
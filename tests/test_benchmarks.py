@@ -0,0 +1,60 @@
+"""Tests for the benchmark suite's workload generator and baseline comparison."""
+from benchmarks.importtime import parse_importtime
+from benchmarks.suite import CASES, Workload, compare, run_case
+from benchmarks.synthetic import TRANSCRIPT_SEGMENTS, generate_conversations
+
+
+def _results(**seconds):
+    return {"results": [{"key": key, "seconds": s} for key, s in seconds.items()]}
+
+
+class TestSyntheticConversations:
+    def test_deterministic(self):
+        assert generate_conversations(50, "short") == generate_conversations(50, "short")
+
+    def test_seed_changes_output(self):
+        assert generate_conversations(50, seed=1) != generate_conversations(50, seed=2)
+
+    def test_transcript_profile_sets_segment_count(self):
+        for name, segments in TRANSCRIPT_SEGMENTS.items():
+            conv = generate_conversations(1, name)[0]
+            assert len(conv["transcript_segments"]) == segments
+
+    def test_newest_first(self):
+        convs = generate_conversations(30)
+        finished = [c["finished_at"] for c in convs]
+        assert finished == sorted(finished, reverse=True)
+
+
+class TestCompare:
+    def test_flags_slowdown_beyond_threshold(self):
+        regressions = compare(_results(a=1.3, b=1.1), _results(a=1.0, b=1.0), threshold=0.2)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("a:")
+
+    def test_ignores_cases_missing_from_baseline(self):
+        assert compare(_results(new=5.0), _results(old=1.0)) == []
+
+
+class TestImportTime:
+    def test_sums_direct_package_imports_only(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       900 |       1200 | site",
+            "import time:       100 |        100 | omi_sync",
+            "import time:       300 |        300 |   omi_sync.models",
+            "import time:      2000 |       5000 | omi_sync.cli",
+        ])
+        assert parse_importtime(stderr) == 0.0051
+
+
+class TestCases:
+    def test_every_case_runs(self):
+        workload = Workload(24, "short")
+        try:
+            for name in CASES:
+                result = run_case(name, workload, repeat=1)
+                assert result.items > 0
+                assert result.seconds >= 0
+        finally:
+            workload.close()
@@ -0,0 +1,93 @@
+"""Tests for per-day conversation buckets."""
+from omi_sync.buckets import DayBuckets, estimate_size
+from omi_sync.models import parse_conversation
+
+
+def _data(omi_id, text="hello"):
+    return {
+        "id": omi_id,
+        "started_at": "2026-01-10T14:00:00Z",
+        "finished_at": "2026-01-10T14:20:00Z",
+        "structured": {"title": "Meeting"},
+        "transcript_segments": [{"speaker": "SPEAKER_00", "text": text}],
+    }
+
+
+def _add(buckets, date, omi_id, text="hello"):
+    data = _data(omi_id, text)
+    return buckets.add(date, data, parse_conversation(data))
+
+
+class TestFlushWindow:
+    def test_nothing_ready_until_direction_known(self):
+        """A single day is never flushed early."""
+        buckets = DayBuckets()
+        _add(buckets, "2026-01-10", "a")
+        _add(buckets, "2026-01-10", "b")
+
+        assert buckets.ready() == []
+
+    def test_descending_stream_flushes_days_behind_window(self):
+        """Newest-first streams flush days once two days older have been seen."""
+        buckets = DayBuckets()
+        _add(buckets, "2026-01-10", "a")
+        _add(buckets, "2026-01-09", "b")
+        assert buckets.ready() == []
+
+        _add(buckets, "2026-01-08", "c")
+
+        assert buckets.ready() == ["2026-01-10"]
+
+    def test_ascending_stream_flushes_days_behind_window(self):
+        """Oldest-first streams flush the oldest days."""
+        buckets = DayBuckets()
+        for date in ["2026-01-08", "2026-01-09", "2026-01-10", "2026-01-11"]:
+            _add(buckets, date, date)
+
+        assert buckets.ready() == ["2026-01-08", "2026-01-09"]
+
+    def test_adding_to_retired_day_returns_false(self):
+        """Late arrivals for a popped day are reported."""
+        buckets = DayBuckets()
+        _add(buckets, "2026-01-10", "a")
+        buckets.pop("2026-01-10")
+
+        assert buckets.is_retired("2026-01-10")
+        assert _add(buckets, "2026-01-10", "b") is False
+
+
+class TestSpill:
+    def test_spills_largest_bucket_over_budget(self):
+        """Exceeding max_memory moves the largest bucket to disk."""
+        with DayBuckets(max_memory=10_000) as buckets:
+            _add(buckets, "2026-01-10", "big", text="x" * 8000)
+            _add(buckets, "2026-01-11", "small")
+
+            assert buckets.spill_count == 1
+            assert buckets.memory < 10_000
+
+            items = buckets.pop("2026-01-10")
+
+        assert [(data["id"], conv) for data, conv in items] == [("big", None)]
+
+    def test_pop_merges_disk_and_memory(self):
+        """A spilled day keeps collecting in memory and pops both halves."""
+        with DayBuckets(max_memory=estimate_size(_data("a")) + 1) as buckets:
+            _add(buckets, "2026-01-10", "a")
+            _add(buckets, "2026-01-10", "b")
+            _add(buckets, "2026-01-10", "c")
+
+            ids = sorted(data["id"] for data, _ in buckets.pop("2026-01-10"))
+
+        assert ids == ["a", "b", "c"]
+
+    def test_retain_retired_keeps_popped_days(self):
+        """Retired days, including late arrivals, can be reloaded from disk."""
+        with DayBuckets(retain_retired=True) as buckets:
+            _add(buckets, "2026-01-10", "a")
+            buckets.pop("2026-01-10")
+            _add(buckets, "2026-01-10", "late")
+
+            ids = [data["id"] for data, _ in buckets.load_retired("2026-01-10")]
+
+        assert ids == ["a", "late"]
@@ -1,9 +1,28 @@
 """Tests for CLI commands."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
+import omi_sync
 from omi_sync.cli import main
 
 
+class TestStartup:
+    def test_import_defers_dotenv_and_heavy_dependencies(self):
+        """Importing the CLI loads no .env handling or sync dependencies."""
+        probe = (
+            "import sys; import omi_sync.cli; "
+            "print(','.join(m for m in ('dotenv', 'yaml', 'httpx', 'pytz', 'dateutil', 'multiprocessing') "
+            "if m in sys.modules))"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(omi_sync.__file__).parent.parent))
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env, check=True)
+        assert out.stdout.strip() == ""
+
+
 class TestDoctorCommand:
     def test_doctor_fails_without_api_key(self, temp_vault, monkeypatch):
         """Doctor fails fast without API key."""
@@ -42,6 +61,51 @@ class TestRunCommand:
         assert result.exit_code == 0
         assert "DONE" in result.output
 
+    def test_run_profile_writes_pstats(self, temp_vault, monkeypatch, httpx_mock):
+        """--profile dumps a profile and prints the stage timings."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+
+        httpx_mock.add_response(json=[])
+
+        result = CliRunner().invoke(main, ["run", "--profile"])
+
+        assert result.exit_code == 0
+        assert "Stage timings:" in result.output
+        assert "fetch.request" in result.output
+        profiles = temp_vault / "Omi" / ".omi-sync" / "profiles"
+        assert len(list(profiles.glob("*.pstats"))) == 1
+        assert len(list(profiles.glob("*.txt"))) == 1
+
+    def test_run_appends_metrics_history(self, temp_vault, monkeypatch, httpx_mock):
+        """Each run leaves a JSON line in the metrics history and the Prometheus file."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+        monkeypatch.setenv("OMI_METRICS_TEXTFILE", str(temp_vault / "omi_sync.prom"))
+
+        httpx_mock.add_response(json=[])
+
+        result = CliRunner().invoke(main, ["run"])
+
+        assert result.exit_code == 0
+        history = (temp_vault / "Omi" / ".omi-sync" / "metrics.jsonl").read_text().splitlines()
+        assert len(history) == 1
+        assert '"status": "DONE"' in history[0]
+        assert "omi_sync_last_run_success 1" in (temp_vault / "omi_sync.prom").read_text()
+
+    def test_run_coalesces_while_vault_locked(self, temp_vault, monkeypatch):
+        """A second run exits without fetching while another holds the vault lock."""
+        from omi_sync.lock import VaultLock
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+
+        with VaultLock.for_vault(temp_vault):
+            result = CliRunner().invoke(main, ["run"])
+
+        assert result.exit_code == 0
+        assert "COALESCED" in result.output
+        assert not (temp_vault / "Omi" / ".omi-sync" / "index.json").exists()
+
     def test_run_fails_without_config(self, monkeypatch):
         """Run fails without proper config."""
         monkeypatch.delenv("OMI_API_KEY", raising=False)
@@ -64,3 +128,44 @@ class TestRebuildIndexCommand:
 
         assert result.exit_code == 0
         assert "Rebuilt index with" in result.output
+
+
+class TestApplyOverridesCommand:
+    def test_reports_unchanged_then_applied(self, temp_vault, monkeypatch):
+        """An edit is applied once; running again finds nothing to do."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["apply-overrides"])
+        assert result.exit_code == 0
+        assert "Overrides unchanged" in result.output
+
+        overrides = temp_vault / "Omi" / ".omi-sync" / "overrides" / "notable.json"
+        overrides.write_text('{"conv_a": true}')
+        result = runner.invoke(main, ["apply-overrides"])
+        assert result.exit_code == 0
+        assert "Reclassified 0 conversations" in result.output
+        assert "Overrides unchanged" in runner.invoke(main, ["apply-overrides"]).output
+
+
+class TestVerifyCommand:
+    def test_verify_empty_vault(self, temp_vault, monkeypatch):
+        """Verify passes on a vault with an empty index."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["verify"])
+
+        assert result.exit_code == 0
+        assert "Vault matches index" in result.output
+
+    def test_verify_rejects_zero_workers(self, temp_vault, monkeypatch):
+        """--workers must be at least 1."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+
+        result = CliRunner().invoke(main, ["verify", "--workers", "0"])
+
+        assert result.exit_code == 2
@@ -56,3 +56,39 @@ class TestConfigValidation:
         assert config.timezone == "America/Los_Angeles"
         assert config.finalization_lag_minutes == 15
         assert config.notable_duration_minutes == 30
+
+    def test_unknown_render_executor_fails(self, temp_vault, monkeypatch):
+        """A mistyped OMI_RENDER_EXECUTOR is rejected when loading config."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+        monkeypatch.setenv("OMI_RENDER_EXECUTOR", "proces")
+
+        with pytest.raises(ConfigError, match="OMI_RENDER_EXECUTOR"):
+            load_config()
+
+    def test_unknown_fsync_policy_fails(self, temp_vault, monkeypatch):
+        """OMI_FSYNC must name a known durability policy."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+        monkeypatch.setenv("OMI_FSYNC", "always")
+
+        with pytest.raises(ConfigError, match="OMI_FSYNC"):
+            load_config()
+
+    def test_notable_keywords(self, temp_vault, monkeypatch):
+        """OMI_NOTABLE_KEYWORDS replaces the default list; the other notable settings are flags."""
+        monkeypatch.setenv("OMI_API_KEY", "test-key")
+        monkeypatch.setenv("OMI_VAULT_PATH", str(temp_vault))
+        defaults = load_config()
+        assert defaults.notable_keywords == Config(api_key="x", vault_path=temp_vault).notable_keywords
+        assert defaults.notable_whole_words is False
+        assert defaults.notable_scan_transcript is False
+
+        monkeypatch.setenv("OMI_NOTABLE_KEYWORDS", "Acme, Project Falcon,,Dr. Patel ")
+        monkeypatch.setenv("OMI_NOTABLE_WHOLE_WORDS", "True")
+        monkeypatch.setenv("OMI_NOTABLE_SCAN_TRANSCRIPT", "1")
+        config = load_config()
+
+        assert config.notable_keywords == ["Acme", "Project Falcon", "Dr. Patel"]
+        assert config.notable_whole_words is True
+        assert config.notable_scan_transcript is True
@@ -0,0 +1,28 @@
+"""Tests for the local conversation store."""
+import json
+
+from omi_sync.conversation_store import ConversationStore
+
+
+class TestConversationStore:
+    def test_round_trip_keeps_order(self, tmp_path):
+        store = ConversationStore(tmp_path)
+        data = [{"id": "b", "title": "B"}, {"id": "a", "title": "A"}]
+        store.path("2026-01-10").write_text(store.dumps(data))
+
+        loaded = store.load("2026-01-10")
+        assert list(loaded) == ["b", "a"]
+        assert loaded["a"] == {"id": "a", "title": "A"}
+
+    def test_missing_day(self, tmp_path):
+        assert ConversationStore(tmp_path).load("2026-01-10") == {}
+
+    def test_unreadable_day(self, tmp_path):
+        store = ConversationStore(tmp_path)
+        store.path("2026-01-10").write_text("{not json")
+        assert store.load("2026-01-10") == {}
+
+    def test_compact(self):
+        content = ConversationStore.dumps([{"id": "a", "tags": [1, 2]}])
+        assert content == '{"a":{"id":"a","tags":[1,2]}}'
+        assert json.loads(content) == {"a": {"id": "a", "tags": [1, 2]}}
@@ -0,0 +1,216 @@
+"""Tests for the sync daemon."""
+import pytest
+import signal
+from datetime import datetime, timedelta, timezone
+from omi_sync.config import Config
+from omi_sync.daemon import SyncDaemon, parse_quiet_hours
+
+NOON_EST = datetime(2026, 1, 10, 17, 0, tzinfo=timezone.utc)
+THREE_AM_EST = datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc)
+
+
+class FakeClient:
+    def __init__(self, pages=None, error=None):
+        self.pages = list(pages or [])
+        self.error = error
+        self.calls = 0
+
+    def iter_conversations(self, start_date=None, end_date=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return iter(self.pages.pop(0) if self.pages else [])
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(api_key="test", vault_path=tmp_path)
+
+
+def _daemon(config, client=None, now=NOON_EST, waits=None, **kwargs):
+    return SyncDaemon(
+        config,
+        client or FakeClient(),
+        interval=900,
+        min_interval=60,
+        max_interval=3600,
+        log=lambda message: None,
+        now=lambda: now,
+        wait=(waits if waits is not None else []).append,
+        **kwargs,
+    )
+
+
+class TestAdaptiveInterval:
+    def test_activity_polls_fast(self, config):
+        """Changed or pending conversations shorten the interval."""
+        daemon = _daemon(config)
+
+        assert daemon.next_delay({"changed_conversations": 2, "not_finalized": 0}) == 60
+        assert daemon.next_delay({"changed_conversations": 0, "not_finalized": 1}) == 60
+
+    def test_idle_backs_off_to_max(self, config):
+        """Idle cycles double the interval up to max_interval."""
+        daemon = _daemon(config)
+        idle = {"changed_conversations": 0, "not_finalized": 0}
+
+        delays = [daemon.next_delay(idle) for _ in range(5)]
+
+        assert delays == [900, 1800, 3600, 3600, 3600]
+        assert daemon.next_delay({"changed_conversations": 1}) == 60
+        assert daemon.next_delay(idle) == 900
+
+    def test_quiet_hours_use_max_interval(self, config):
+        """At night the daemon polls at max_interval even when active."""
+        daemon = _daemon(config, now=THREE_AM_EST)
+
+        assert daemon.next_delay({"changed_conversations": 3}) == 3600
+
+    def test_quiet_hours_wrap_midnight(self, config):
+        """Quiet hours such as 23-7 span midnight."""
+        daemon = _daemon(config, now=THREE_AM_EST, quiet_hours=(23, 7))
+        assert daemon.in_quiet_hours()
+
+        daemon = _daemon(config, now=NOON_EST, quiet_hours=(23, 7))
+        assert not daemon.in_quiet_hours()
+
+
+class TestCycles:
+    def test_engine_and_client_stay_resident(self, config):
+        """Every cycle reuses the same client and engine."""
+        client = FakeClient()
+        waits = []
+        daemon = _daemon(config, client, waits=waits)
+        engine = daemon.engine
+
+        daemon.run_forever(max_cycles=3)
+
+        assert client.calls == 3
+        assert waits == [900, 1800]
+        assert daemon.engine is engine
+        assert (config.vault_path / "Omi" / ".omi-sync" / "state.json").exists()
+
+    def test_unchanged_days_are_not_rewritten(self, config):
+        """A cycle with nothing new skips the days it already wrote."""
+        conversation = {
+            "id": "abc",
+            "started_at": "2026-01-10T14:00:00+00:00",
+            "finished_at": "2026-01-10T14:20:00+00:00",
+            "structured": {"title": "Chat", "overview": ""},
+            "transcript_segments": [],
+        }
+        daemon = _daemon(config, FakeClient(pages=[[conversation]]))
+        raw_path = config.vault_path / "Omi" / "Raw" / "2026-01-10.md"
+
+        daemon.run_cycle()
+        first = raw_path.stat().st_mtime_ns
+        result = daemon.engine.sync([conversation])
+
+        assert result["stats"]["skipped_dates"] == 1
+        assert result["stats"]["changed_conversations"] == 0
+        assert raw_path.stat().st_mtime_ns == first
+
+    def test_failed_cycle_keeps_running(self, config):
+        """A failing fetch is logged and retried after the base interval."""
+        messages = []
+        daemon = _daemon(config, FakeClient(error=RuntimeError("boom")))
+        daemon.log = messages.append
+
+        assert daemon.run_cycle() == 900
+        assert "Sync failed: boom" in messages
+
+    def test_stop_ends_loop(self, config):
+        """A stop request (e.g. SIGTERM) ends the loop after the current cycle."""
+        daemon = _daemon(config)
+        daemon.run_cycle = lambda: daemon.stop() or 3600
+
+        daemon.run_forever()
+
+        assert daemon.stopping
+
+    def test_holds_vault_lock_while_running(self, config):
+        """One-shot runs coalesce while the daemon runs; the lock is freed on stop."""
+        from omi_sync.lock import VaultLock
+        daemon = _daemon(config)
+        other = VaultLock.for_vault(config.vault_path)
+        held = []
+        daemon.run_cycle = lambda: held.append(other.acquire(blocking=False)) or daemon.stop() or 3600
+
+        daemon.run_forever()
+
+        assert held == [False]
+        assert other.acquire(blocking=False)
+        other.release()
+
+    def test_signal_handlers_installed(self, config):
+        """SIGTERM is routed to stop()."""
+        daemon = _daemon(config)
+        previous = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+        try:
+            daemon.install_signal_handlers()
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+        finally:
+            signal.signal(signal.SIGTERM, previous[0])
+            signal.signal(signal.SIGINT, previous[1])
+
+        assert daemon.stopping
+
+
+class TestParseQuietHours:
+    def test_parse(self):
+        assert parse_quiet_hours("23-7") == (23, 7)
+        assert parse_quiet_hours("") is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_quiet_hours("22-25")
+
+
+class TestPendingWakeups:
+    def test_wakes_for_pending_before_next_full_cycle(self, config):
+        """A conversation becoming eligible is re-checked before the next full cycle."""
+        waits = []
+        daemon = _daemon(config, waits=waits)
+        daemon.engine.state.replace_pending({
+            "a": {"eligible_at": "2026-01-10T17:05:00+00:00", "date": "2026-01-10"},
+        })
+        checks = []
+        daemon.run_pending_cycle = lambda: checks.append(daemon.now())
+
+        daemon._wait_for_next_cycle(900)
+
+        assert waits == [330, 900]
+        assert len(checks) == 1
+
+
+class TestOverridesPolling:
+    def test_applies_override_edits_while_waiting(self, config):
+        """Overrides are checked every overrides_poll seconds until the next cycle."""
+        waits = []
+        clock = [NOON_EST]
+        daemon = _daemon(config, waits=waits, overrides_poll=300)
+        daemon.now = lambda: clock[0]
+
+        def wait(seconds):
+            waits.append(seconds)
+            clock[0] += timedelta(seconds=seconds)
+
+        daemon.wait = wait
+        applied = []
+        daemon.apply_overrides = lambda: applied.append(daemon.now())
+
+        daemon._wait_for_next_cycle(900)
+
+        assert waits == [300, 300, 300]
+        assert len(applied) == 2
+
+    def test_apply_overrides_logs_changes(self, config):
+        messages = []
+        daemon = _daemon(config)
+        daemon.log = messages.append
+        daemon.apply_overrides()
+        assert messages == []
+
+        daemon.engine.state.get_notable_overrides_path().write_text('{"a": true}')
+        daemon.apply_overrides()
+        assert messages == ["Applied overrides: 0 reclassified, 0 event notes written, 0 deleted"]
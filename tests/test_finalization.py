@@ -1,8 +1,10 @@
 """Tests for finalization logic."""
+import random
 import pytest
 from datetime import datetime, timezone, timedelta
 from freezegun import freeze_time
-from omi_sync.finalization import is_finalized
+from omi_sync.columns import ConversationColumns
+from omi_sync.finalization import finalized_mask, is_finalized
 from omi_sync.models import Conversation
 
 
@@ -72,3 +74,38 @@ class TestFinalization:
         )
 
         assert is_finalized(conv, lag_minutes=10) is True
+
+
+def _random_conversations(count, seed=7):
+    """Conversations finishing around a fixed now, some naive, some still recording."""
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 10, 22, 10, tzinfo=timezone.utc)
+    convs = []
+    for i in range(count):
+        finished = now - timedelta(seconds=rng.choice([600, 599, 601, 0]) + rng.random() * rng.choice([0, 1, 3600]))
+        if rng.random() < 0.2:
+            finished = finished.replace(tzinfo=None)
+        convs.append(Conversation(
+            id=f"c{i}",
+            started_at=finished - timedelta(minutes=rng.randint(0, 90), microseconds=rng.randint(0, 999999)),
+            finished_at=None if rng.random() < 0.1 else finished,
+            language="en",
+            source="omi",
+        ))
+    return convs
+
+
+class TestFinalizedMask:
+    @freeze_time("2026-01-10T22:10:00Z")
+    def test_matches_is_finalized(self, vector_backend):
+        """Same answer as is_finalized for each conversation, right at the lag boundary too."""
+        convs = _random_conversations(500)
+        mask = finalized_mask(ConversationColumns.of(convs), lag_minutes=10)
+        assert mask == [is_finalized(c, lag_minutes=10) for c in convs]
+
+    def test_durations_match(self, vector_backend):
+        convs = _random_conversations(500)
+        assert ConversationColumns.of(convs).duration_minutes() == [c.duration_minutes for c in convs]
+
+    def test_empty_batch(self, vector_backend):
+        assert finalized_mask(ConversationColumns.of([])) == []
@@ -1,4 +1,7 @@
 """Tests for frontmatter writing."""
+import random
+
+from omi_sync import frontmatter_writer
 from omi_sync.frontmatter_writer import write_frontmatter
 
 
@@ -32,3 +35,70 @@ class TestFrontmatterWriter:
         data = {"omi_sync": True}
         result = write_frontmatter(data)
         assert "omi_sync: true" in result
+
+
+def yaml_frontmatter(data):
+    """What write_frontmatter produced when it always called yaml.dump."""
+    import yaml
+    return "---\n" + yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=True) + "---\n"
+
+
+# Characters and fragments that exercise the emitter's quoting rules:
+# indicators, implicit types (bools, nulls, numbers, dates, times),
+# document markers, non-ASCII, and characters that need double quotes
+ALPHABET = list("aZy nN0159-+.:#,[]{}&*!|>'\"%@`?~<=_/eExTt") + [
+    "\u00e9", "\u65e5", "\U0001F600", "\xa0", "\t", "\n", "\x85", "\x7f", "\ufeff",
+]
+TRICKY = [
+    "yes", "No", "true", "OFF", "null", "~", "2026-01-10", "2026-1-2 3:04:05", "10:30",
+    "1e3", "1.5", ".inf", "0x1F", "0o7", "---", "...", "<<", "=", "-", "- a", "?", "?x",
+    ":x", "a: b", "a:b", "a #b", "a#b", "[[2026-01-10]]", "it's", " lead", "trail ",
+]
+
+
+class TestEmitterMatchesYaml:
+    def test_note_frontmatter(self):
+        data = {
+            "category": "work", "date": "2026-01-10", "duration_minutes": 42,
+            "finished_at": "2026-01-10T15:42:00+00:00", "generated_at": "2026-01-10T10:00:00-05:00",
+            "language": "en", "omi_id": "conv-123", "omi_sync": True, "people": ["Alice", "Bob"],
+            "raw_daily": "[[2026-01-10]]", "raw_link": "[[2026-01-10#10:00 - Planning]]",
+            "source": "omi", "started_at": "2026-01-10T15:00:00+00:00", "tags": [],
+        }
+        assert write_frontmatter(data) == yaml_frontmatter(data)
+
+    def test_note_frontmatter_skips_yaml(self, monkeypatch):
+        def fail(data):
+            raise AssertionError("yaml.dump called")
+        monkeypatch.setattr(frontmatter_writer, "_yaml_dump", fail)
+        write_frontmatter({"date": "2026-01-10", "omi_sync": True, "people": ["Alice"], "source": "omi"})
+
+    def test_random_strings(self):
+        """Property: any string, in a value or a list, comes out exactly as yaml.dump writes it."""
+        rng = random.Random(20260110)
+        for _ in range(2000):
+            roll = rng.random()
+            if roll < 0.3:
+                text = rng.choice(TRICKY) + "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 2)))
+            elif roll < 0.5:
+                # Sentences long enough to be folded
+                text = rng.choice(["", " "]).join(
+                    rng.choice(TRICKY + ["word", "a", "  "]) for _ in range(rng.randint(10, 60))
+                )
+            else:
+                text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, rng.choice([4, 16, 90]))))
+            data = {
+                "value": text, "people": [text, "Alice"], "count": rng.randint(-5, 5000),
+                "flag": rng.random() < 0.5, "empty": [],
+            }
+            assert write_frontmatter(data) == yaml_frontmatter(data), repr(text)
+
+    def test_long_values_are_folded_like_yaml(self):
+        data = {"overview": "word " * 30, "people": ["name " * 20, "x" * 90 + " y"], "title": "it's " * 20}
+        assert write_frontmatter(data) == yaml_frontmatter(data)
+
+    def test_other_types_fall_back_to_yaml(self):
+        data = {"ratio": 0.5, "nested": {"a": 1}, 3: "int key", "on": "bool key", "tab": "a\tb"}
+        for key, value in data.items():
+            assert write_frontmatter({key: value}) == yaml_frontmatter({key: value})
+        assert write_frontmatter({}) == yaml_frontmatter({})
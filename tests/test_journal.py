@@ -0,0 +1,129 @@
+"""Tests for the run journal."""
+import pytest
+from omi_sync.journal import RunJournal
+from omi_sync.state import IndexEntry
+
+
+@pytest.fixture
+def vault(tmp_path):
+    return tmp_path
+
+
+def _journal(vault):
+    return RunJournal(vault / "Omi" / ".omi-sync", vault)
+
+
+def _stage_write(journal, target, content):
+    staged, _ = journal.stage(target, content)
+    journal.record_write(target, staged)
+
+
+class TestApply:
+    def test_staged_files_reach_vault_only_on_apply(self, vault):
+        journal = _journal(vault)
+        target = vault / "Omi" / "Raw" / "2026-01-10.md"
+        _stage_write(journal, target, "day")
+
+        assert not target.exists()
+        journal.apply()
+        assert target.read_text() == "day"
+
+    def test_last_change_per_target_wins(self, vault):
+        journal = _journal(vault)
+        kept = vault / "Omi" / "Raw" / "kept.md"
+        removed = vault / "Omi" / "Events" / "removed.md"
+        _stage_write(journal, kept, "first")
+        _stage_write(journal, removed, "event")
+        journal.record_delete(removed)
+        _stage_write(journal, kept, "second")
+
+        journal.apply()
+
+        assert kept.read_text() == "second"
+        assert not removed.exists()
+
+
+class TestRollForward:
+    def test_no_journal(self, vault):
+        assert _journal(vault).roll_forward() is None
+
+    def test_recorded_changes_applied_after_crash(self, vault):
+        crashed = _journal(vault)
+        target = vault / "Omi" / "Raw" / "2026-01-10.md"
+        _stage_write(crashed, target, "day")
+        crashed.record_entries([IndexEntry(omi_id="a", raw_date="2026-01-10", raw_heading="09:00 — A (omi:a)")])
+        crashed.close()
+
+        entries = _journal(vault).roll_forward()
+
+        assert target.read_text() == "day"
+        assert [e.omi_id for e in entries] == ["a"]
+
+    def test_repeatable(self, vault):
+        crashed = _journal(vault)
+        target = vault / "Omi" / "Raw" / "2026-01-10.md"
+        _stage_write(crashed, target, "day")
+        crashed.apply()  # Crash after applying, before clearing
+
+        _journal(vault).roll_forward()
+
+        assert target.read_text() == "day"
+
+    def test_truncated_last_record_ignored(self, vault):
+        crashed = _journal(vault)
+        target = vault / "Omi" / "Raw" / "2026-01-10.md"
+        _stage_write(crashed, target, "day")
+        crashed.close()
+        with open(crashed.path, "a") as f:
+            f.write('{"write": "Omi/Raw/2026-01-11.md", "sta')
+
+        _journal(vault).roll_forward()
+
+        assert target.exists()
+        assert not (vault / "Omi" / "Raw" / "2026-01-11.md").exists()
+
+    def test_staged_files_without_records_discarded(self, vault):
+        crashed = _journal(vault)
+        crashed.stage(vault / "Omi" / "Raw" / "x.md", "x")
+
+        assert _journal(vault).roll_forward() is None
+        assert not crashed.dir.exists()
+
+
+class TestFsyncPolicy:
+    @pytest.fixture
+    def synced(self, monkeypatch):
+        """Record every fsync: ("file"|"dir", path) from the journal, "fd" for open files."""
+        calls = []
+        monkeypatch.setattr("omi_sync.journal.fsync_file", lambda p: calls.append(("file", p)))
+        monkeypatch.setattr("omi_sync.journal.fsync_dir", lambda p: calls.append(("dir", p)))
+        monkeypatch.setattr("omi_sync.journal.os.fsync", lambda fd: calls.append(("fd", None)))
+        return calls
+
+    def _commit(self, vault, policy, count=3):
+        journal = RunJournal(vault / "Omi" / ".omi-sync", vault, fsync=policy)
+        for i in range(count):
+            _stage_write(journal, vault / "Omi" / "Raw" / f"2026-01-1{i}.md", "day")
+        journal.apply()
+        return journal
+
+    def test_none_never_syncs(self, vault, synced):
+        self._commit(vault, "none")
+        assert synced == []
+
+    def test_batched_syncs_each_directory_once(self, vault, synced):
+        journal = self._commit(vault, "batched")
+
+        assert [kind for kind, _ in synced].count("file") == 4  # three staged files and the journal
+        assert [p for kind, p in synced if kind == "dir"] == [journal.dir, vault / "Omi" / "Raw"]
+        assert ("fd", None) not in synced
+
+    def test_strict_syncs_every_file_and_rename(self, vault, synced):
+        self._commit(vault, "strict")
+
+        assert [kind for kind, _ in synced].count("fd") == 6  # three staged files, three records
+        assert [kind for kind, _ in synced].count("dir") == 3
+
+    def test_unknown_policy(self, vault):
+        with pytest.raises(ValueError):
+            RunJournal(vault, vault, fsync="always")
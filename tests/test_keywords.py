@@ -0,0 +1,59 @@
+"""Tests for the compiled keyword matcher."""
+import random
+
+from omi_sync.keywords import KeywordMatcher
+
+
+def naive_search(keywords, text):
+    """The per-keyword loop the matcher replaces."""
+    lowered = text.lower()
+    return any(k.lower() in lowered for k in keywords)
+
+
+class TestKeywordMatcher:
+    def test_reports_matched_keyword_as_configured(self):
+        matcher = KeywordMatcher(["Therapy", "1:1", "Dr. Patel"])
+        assert matcher.search("Weekly THERAPY check-in") == "Therapy"
+        assert matcher.search("1:1 with Sam") == "1:1"
+        assert matcher.search("Call with dr. patel") == "Dr. Patel"
+        assert matcher.search("Lunch") is None
+
+    def test_shared_prefixes(self):
+        matcher = KeywordMatcher(["therap", "therapy", "therapist", "the"])
+        assert matcher.search("my therapist") in {"therapist", "therap", "the"}
+        assert matcher.search("thermal") == "the"
+        assert KeywordMatcher(["therapy", "therapist"]).search("therapeutic") is None
+
+    def test_matches_inside_words_by_default(self):
+        assert KeywordMatcher(["retro"]).search("retrospective") == "retro"
+
+    def test_whole_words(self):
+        matcher = KeywordMatcher(["retro", "1:1"], whole_words=True)
+        assert matcher.search("retrospective") is None
+        assert matcher.search("sprint retro, then lunch") == "retro"
+        assert matcher.search("(1:1)") == "1:1"
+        assert matcher.search("21:15") is None
+
+    def test_regex_characters_are_literal(self):
+        matcher = KeywordMatcher(["c++", "a.b", "(x)"])
+        assert matcher.search("learning C++") == "c++"
+        assert matcher.search("axb") is None
+        assert matcher.search("see (x)") == "(x)"
+
+    def test_no_keywords(self):
+        matcher = KeywordMatcher([])
+        assert len(matcher) == 0
+        assert matcher.search("anything") is None
+
+    def test_agrees_with_naive_search(self):
+        """Property: found exactly when some keyword is a substring, for hundreds of keywords."""
+        rng = random.Random(5)
+        alphabet = "abcdeAB :1-."
+        for _ in range(300):
+            keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(rng.randint(1, 300))]
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            matcher = KeywordMatcher(keywords)
+            found = matcher.search(text)
+            assert (found is not None) == naive_search(keywords, text), (keywords, text)
+            if found is not None:
+                assert found.lower() in text.lower()
@@ -0,0 +1,80 @@
+"""Tests for per-conversation local times."""
+from datetime import datetime, timezone
+
+from omi_sync.config import Config
+from omi_sync.local_times import LocalTimes, local_times_for
+from omi_sync.models import Conversation
+from omi_sync.render import render_day
+from omi_sync.slugify import slugify
+from omi_sync.timezone_utils import format_time_local, get_local_date
+
+
+def _conv(omi_id, started, finished, title="Planning"):
+    return Conversation(
+        id=omi_id, started_at=started, finished_at=finished, language="en", source="omi", title=title,
+    )
+
+
+class TestLocalTimes:
+    def test_matches_timezone_utils(self):
+        """Same strings as the per-call helpers, across a DST change and for naive times."""
+        tz = "America/New_York"
+        cases = [
+            (datetime(2026, 1, 10, 16, 0, tzinfo=timezone.utc), datetime(2026, 1, 10, 16, 55, tzinfo=timezone.utc)),
+            (datetime(2026, 3, 8, 6, 30, tzinfo=timezone.utc), datetime(2026, 3, 8, 7, 15, tzinfo=timezone.utc)),
+            (datetime(2026, 11, 1, 5, 59), datetime(2026, 11, 1, 6, 1)),
+            (datetime(2026, 1, 11, 3, 0, tzinfo=timezone.utc), datetime(2026, 1, 11, 4, 59, tzinfo=timezone.utc)),
+        ]
+        for started, finished in cases:
+            conv = _conv("c1", started, finished, title="Café sync: Q1")
+            times = LocalTimes.of(conv, tz)
+            start_time = format_time_local(started, tz)
+            assert times.date == get_local_date(finished, tz)
+            assert times.start_time == start_time
+            assert times.raw_heading == f"{start_time} — Café sync: Q1 (omi:c1)"
+            finished_hhmm = format_time_local(finished, tz).replace(":", "")
+            assert times.event_filename == f"{times.date}T{finished_hhmm}00 - {slugify(conv.title)} - c1.md"
+
+    def test_local_times_for_keeps_given(self):
+        started = datetime(2026, 1, 10, 16, 0, tzinfo=timezone.utc)
+        a = _conv("a", started, started)
+        b = _conv("b", started, started)
+        given = {"a": LocalTimes.of(a, "UTC")}
+
+        times = local_times_for([a, b], "UTC", given)
+
+        assert times["a"] is given["a"]
+        assert times["b"].date == "2026-01-10"
+        assert local_times_for([a], "UTC", given) is given
+        assert local_times_for([], "UTC") == {}
+
+
+class TestRenderDayUsesLocalTimes:
+    def test_computed_once_per_conversation(self, tmp_path, monkeypatch):
+        """Raw, event, Highlights and the index entry share one LocalTimes per conversation."""
+        config = Config(api_key="test", vault_path=tmp_path)
+        started = datetime(2026, 1, 10, 16, 0, tzinfo=timezone.utc)
+        convs = [_conv("a", started, started), _conv("b", started, started)]
+        calls = []
+        original = LocalTimes.of.__func__
+
+        def counting(cls, conv, timezone_name):
+            calls.append(conv.id)
+            return original(cls, conv, timezone_name)
+
+        monkeypatch.setattr(LocalTimes, "of", classmethod(counting))
+        render_day("2026-01-10", convs, {"a", "b"}, config, "2026-01-10T12:00:00-05:00")
+
+        assert sorted(calls) == ["a", "b"]
+
+    def test_given_times_are_used(self, tmp_path):
+        config = Config(api_key="test", vault_path=tmp_path)
+        started = datetime(2026, 1, 10, 16, 0, tzinfo=timezone.utc)
+        conv = _conv("a", started, started)
+        times = LocalTimes.of(conv, config.timezone)
+        times.raw_heading = "precomputed heading"
+
+        day = render_day("2026-01-10", [conv], {"a"}, config, "2026-01-10T12:00:00-05:00", {"a": times})
+
+        assert day.entries[0].raw_heading == "precomputed heading"
+        assert all("precomputed heading" in content for _, content in day.files)
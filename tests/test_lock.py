@@ -0,0 +1,28 @@
+"""Tests for the vault run lock."""
+import os
+from omi_sync.lock import VaultLock
+
+
+class TestVaultLock:
+    def test_second_holder_is_refused(self, tmp_path):
+        first, second = VaultLock(tmp_path), VaultLock(tmp_path)
+        assert first.acquire(blocking=False)
+        try:
+            assert not second.acquire(blocking=False)
+            assert not second.held
+        finally:
+            first.release()
+
+    def test_released_lock_can_be_taken(self, tmp_path):
+        with VaultLock(tmp_path):
+            pass
+        other = VaultLock(tmp_path)
+        assert other.acquire(blocking=False)
+        other.release()
+
+    def test_records_holder_pid(self, tmp_path):
+        with VaultLock(tmp_path) as lock:
+            assert lock.holder() == os.getpid()
+
+    def test_for_vault_uses_sync_dir(self, tmp_path):
+        assert VaultLock.for_vault(tmp_path).path == tmp_path / "Omi" / ".omi-sync" / "run.lock"
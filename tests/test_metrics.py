@@ -0,0 +1,62 @@
+"""Tests for run metrics output."""
+import json
+from omi_sync.metrics import RunMetrics, build_metrics, format_prometheus, record_run
+
+
+def _result():
+    return {
+        "status": "DONE",
+        "stats": {
+            "conversations": 12, "not_finalized": 1, "dates": 3, "skipped_dates": 2,
+            "files_written": 7, "bytes_written": 4096, "writes_skipped": 5,
+        },
+        "timings": {"fetch": 0.5, "render.raw": 0.25},
+    }
+
+
+class TestBuildMetrics:
+    def test_from_engine_result(self):
+        metrics = build_metrics("DONE", 1.5, _result(), api_retries=2)
+
+        assert metrics.conversations_fetched == 12
+        assert metrics.conversations_not_final == 1
+        assert metrics.days_rendered == 3
+        assert metrics.days_skipped == 2
+        assert metrics.bytes_written == 4096
+        assert metrics.writes_skipped == 5
+        assert metrics.api_retries == 2
+        assert metrics.stages == {"fetch": 0.5, "render.raw": 0.25}
+
+    def test_failed_run_without_result(self):
+        metrics = build_metrics("FAILED", 0.1)
+
+        assert metrics.status == "FAILED"
+        assert metrics.conversations_fetched == 0
+
+
+class TestOutputs:
+    def test_history_is_append_only_json_lines(self, tmp_path):
+        history = tmp_path / "metrics.jsonl"
+        record_run(build_metrics("DONE", 1.0, _result()), history)
+        record_run(build_metrics("FAILED", 2.0), history)
+
+        records = [json.loads(line) for line in history.read_text().splitlines()]
+
+        assert [r["status"] for r in records] == ["DONE", "FAILED"]
+        assert records[0]["stages"]["fetch"] == 0.5
+
+    def test_prometheus_textfile(self, tmp_path):
+        textfile = tmp_path / "omi_sync.prom"
+        record_run(build_metrics("DONE", 1.5, _result()), tmp_path / "metrics.jsonl", textfile)
+
+        text = textfile.read_text()
+
+        assert "# TYPE omi_sync_last_run_duration_seconds gauge" in text
+        assert "omi_sync_last_run_success 1" in text
+        assert "omi_sync_last_run_bytes_written 4096" in text
+        assert 'omi_sync_last_run_stage_seconds{stage="render.raw"} 0.25' in text
+
+    def test_prometheus_omits_unknown_rss(self):
+        metrics = RunMetrics(finished_at="2026-01-10T00:00:00+00:00", status="DONE", duration_seconds=1.0)
+
+        assert "peak_rss" not in format_prometheus(metrics)
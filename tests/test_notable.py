@@ -1,9 +1,12 @@
 """Tests for notable conversation classification."""
+import random
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from omi_sync.notable import is_notable, load_overrides
-from omi_sync.models import Conversation, ActionItem
+from omi_sync import notable
+from omi_sync.notable import is_notable, keyword_matcher, load_overrides, notable_mask, notable_match
+from omi_sync.models import Conversation, ActionItem, TranscriptSegment
+from omi_sync.transcript_scan import TranscriptMatch, TranscriptScanner
 from omi_sync.config import Config
 
 
@@ -106,6 +109,42 @@ class TestNotableClassification:
         assert is_notable(conv, config) is True
 
 
+class TestTranscriptRule:
+    def _conversation(self, minutes=5, text="we talked to the doctor"):
+        return Conversation(
+            id="test",
+            started_at=datetime(2026, 1, 10, 14, 0, tzinfo=timezone.utc),
+            finished_at=datetime(2026, 1, 10, 14, minutes, tzinfo=timezone.utc),
+            language="en",
+            source="omi",
+            title="Catch up",
+            transcript_segments=[
+                TranscriptSegment(speaker="SPEAKER_00", start=0.0, end=5.0, text="hi"),
+                TranscriptSegment(speaker="SPEAKER_01", start=5.0, end=9.0, text=text),
+            ],
+        )
+
+    def test_off_without_scanner(self, config):
+        assert not is_notable(self._conversation(), config)
+
+    def test_spoken_keyword_makes_notable(self, config):
+        scanner = TranscriptScanner(keyword_matcher(config))
+        assert notable_match(self._conversation(), config, transcripts=scanner) == (
+            True, TranscriptMatch(keyword="doctor", segment=1, start=5.0),
+        )
+        assert not is_notable(self._conversation(text="lunch"), config, transcripts=scanner)
+
+    def test_transcript_scanned_only_when_other_rules_fail(self, config):
+        scanner = TranscriptScanner(keyword_matcher(config))
+        assert notable_match(self._conversation(minutes=30), config, transcripts=scanner) == (True, None)
+        assert notable_match(self._conversation(), config, {"test": False}, transcripts=scanner) == (False, None)
+        assert scanner.scanned == 0
+
+    def test_mask_uses_transcripts(self, config):
+        scanner = TranscriptScanner(keyword_matcher(config))
+        assert notable_mask([self._conversation()], config, transcripts=scanner) == [True]
+
+
 class TestOverrides:
     """PRD Test 12: Override file forces true/false."""
 
@@ -155,3 +194,49 @@ class TestOverrides:
 
         overrides = load_overrides(overrides_file)
         assert overrides == {}
+
+
+class TestNotableMask:
+    def _conversations(self, count):
+        rng = random.Random(11)
+        words = ["standup", "therapy", "lunch", "Interview", "1:1", "doctor's", "notes", ""]
+        start = datetime(2026, 1, 10, 9, 0, tzinfo=timezone.utc)
+        convs = []
+        for i in range(count):
+            started = start + timedelta(minutes=7 * i)
+            convs.append(Conversation(
+                id=f"c{i}",
+                started_at=started,
+                finished_at=None if rng.random() < 0.05 else started + timedelta(
+                    minutes=rng.choice([5, 24, 25, 26, 60]), seconds=rng.choice([0, 59])
+                ),
+                language="en",
+                source="omi",
+                title=" ".join(rng.choice(words) for _ in range(2)),
+                overview=rng.choice(words),
+                action_items=[ActionItem(description="x")] * rng.randint(0, 3),
+            ))
+        return convs
+
+    def test_matches_is_notable(self, config, vector_backend):
+        """Same answer as is_notable for each conversation, with and without overrides."""
+        convs = self._conversations(400)
+        overrides = {"c3": False, "c4": True, "c10": False}
+        for given in (None, overrides):
+            assert notable_mask(convs, config, given) == [is_notable(c, config, given) for c in convs]
+
+    def test_keywords_only_checked_for_remaining(self, config, monkeypatch):
+        long = Conversation(
+            id="long", started_at=datetime(2026, 1, 10, 9, 0, tzinfo=timezone.utc),
+            finished_at=datetime(2026, 1, 10, 10, 0, tzinfo=timezone.utc), language="en", source="omi",
+        )
+        short = Conversation(
+            id="short", started_at=datetime(2026, 1, 10, 9, 0, tzinfo=timezone.utc),
+            finished_at=datetime(2026, 1, 10, 9, 5, tzinfo=timezone.utc), language="en", source="omi",
+        )
+        checked = []
+        original = notable.matches_keyword
+        monkeypatch.setattr(notable, "matches_keyword", lambda conv, cfg, kw=None: checked.append(conv.id) or original(conv, cfg, kw))
+
+        assert notable_mask([long, short], config) == [True, False]
+        assert checked == ["short"]
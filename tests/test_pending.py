@@ -0,0 +1,119 @@
+"""Tests for targeted re-syncs of pending conversations."""
+import pytest
+from datetime import datetime, timezone
+from freezegun import freeze_time
+from omi_sync.config import Config
+from omi_sync.pending import due_check, has_new_data, next_eligible_at, sync_pending
+from omi_sync.state import StateManager
+from omi_sync.sync_engine import SyncEngine
+
+
+def _conversation(omi_id, finished_at):
+    return {
+        "id": omi_id,
+        "started_at": "2026-01-10T21:30:00Z",
+        "finished_at": finished_at,
+        "structured": {"title": f"Chat {omi_id}", "overview": ""},
+        "transcript_segments": [],
+    }
+
+
+class FakeClient:
+    page_size = 25
+
+    def __init__(self, conversations):
+        self.conversations = conversations
+        self.windows = []
+
+    def iter_conversations(self, start_date=None, end_date=None):
+        self.windows.append((start_date, end_date))
+        return iter(self.conversations)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(api_key="test", vault_path=tmp_path)
+
+
+@pytest.fixture
+def state(config):
+    state = StateManager(config.vault_path)
+    state.replace_pending({
+        "a": {"eligible_at": "2026-01-10T22:10:00+00:00", "date": "2026-01-10"},
+        "b": {"eligible_at": "2026-01-11T03:00:00+00:00", "date": "2026-01-10"},
+    })
+    return state
+
+
+class TestDueCheck:
+    def test_nothing_due(self, state):
+        assert due_check(state, "America/New_York", datetime(2026, 1, 10, 22, tzinfo=timezone.utc)) is None
+
+    def test_window_covers_whole_local_days(self, state):
+        """The fetch window runs from local midnight the day before to the end of the day."""
+        check = due_check(state, "America/New_York", datetime(2026, 1, 10, 22, 30, tzinfo=timezone.utc))
+
+        assert check.dates == {"2026-01-10"}
+        assert check.start == datetime(2026, 1, 9, 5, tzinfo=timezone.utc)
+        assert check.end == datetime(2026, 1, 11, 5, tzinfo=timezone.utc)
+
+    def test_next_eligible(self, state):
+        assert next_eligible_at(state) == datetime(2026, 1, 10, 22, 10, tzinfo=timezone.utc)
+        after = datetime(2026, 1, 10, 22, 10, tzinfo=timezone.utc)
+        assert next_eligible_at(state, after=after) == datetime(2026, 1, 11, 3, tzinfo=timezone.utc)
+
+
+class TestSyncPending:
+    def test_resyncs_due_days_from_narrow_fetch(self, config):
+        """A pending conversation is written once eligible, fetching only its window."""
+        conversation = _conversation("conv_a", "2026-01-10T22:00:00Z")
+        with freeze_time("2026-01-10T22:05:00Z"):
+            SyncEngine(config).sync([conversation])
+
+        engine = SyncEngine(config)
+        client = FakeClient([conversation])
+        with freeze_time("2026-01-10T22:11:00Z"):
+            result = sync_pending(engine, client, datetime.now(timezone.utc))
+
+        assert result["stats"]["dates"] == 1
+        assert client.windows == [(
+            datetime(2026, 1, 9, 5, tzinfo=timezone.utc),
+            datetime(2026, 1, 11, 5, tzinfo=timezone.utc),
+        )]
+        assert (config.vault_path / "Omi" / "Raw" / "2026-01-10.md").exists()
+        assert StateManager(config.vault_path).get_pending() == {}
+
+    def test_no_fetch_when_nothing_due(self, config):
+        client = FakeClient([])
+
+        assert sync_pending(SyncEngine(config), client, datetime.now(timezone.utc)) is None
+        assert client.windows == []
+
+
+class TestHasNewData:
+    NOW = datetime(2026, 1, 10, 22, 0, tzinfo=timezone.utc)
+
+    def test_nothing_new_after_previous_run(self, config):
+        """Conversations already indexed or queued are not new."""
+        engine = SyncEngine(config)
+        with freeze_time("2026-01-10T22:00:00Z"):
+            engine.sync([_conversation("done", "2026-01-10T21:00:00Z"), _conversation("a", "2026-01-10T21:55:00Z")])
+        client = FakeClient([_conversation("a", "2026-01-10T21:55:00Z"), _conversation("done", "2026-01-10T21:00:00Z")])
+
+        assert not has_new_data(engine.state, client, self.NOW)
+
+    def test_unknown_conversation_is_new(self, state):
+        client = FakeClient([_conversation("c", "2026-01-10T21:50:00Z")])
+        assert has_new_data(state, client, self.NOW)
+
+    def test_due_pending_is_new_without_fetching(self, state):
+        client = FakeClient([])
+        assert has_new_data(state, client, datetime(2026, 1, 10, 22, 30, tzinfo=timezone.utc))
+        assert client.windows == []
+
+    def test_only_first_page_is_read(self, config):
+        state = StateManager(config.vault_path)
+        client = FakeClient([_conversation(f"c{i}", "2026-01-10T21:00:00Z") for i in range(3)])
+        client.conversations = iter(client.conversations)
+        has_new_data(state, client, self.NOW, peek=1)
+        assert len(list(client.conversations)) == 2
@@ -0,0 +1,78 @@
+"""Tests for fetching on a background thread."""
+import threading
+
+import pytest
+
+from omi_sync.prefetch import prefetch
+
+
+class TestPrefetch:
+    def test_yields_all_items_in_order(self):
+        assert list(prefetch(iter(range(200)), ahead=7)) == list(range(200))
+
+    def test_fetches_ahead_of_consumer(self):
+        """The source runs ahead while the consumer is still on the first item."""
+        fetched = []
+        two_ahead = threading.Event()
+
+        def source():
+            for i in range(5):
+                fetched.append(i)
+                if len(fetched) == 3:
+                    two_ahead.set()
+                yield i
+
+        items = prefetch(source(), ahead=2)
+        assert next(items) == 0
+        assert two_ahead.wait(timeout=5)
+        assert list(items) == [1, 2, 3, 4]
+
+    def test_bounded_lookahead(self):
+        fetched = []
+
+        def source():
+            for i in range(100):
+                fetched.append(i)
+                yield i
+
+        items = prefetch(source(), ahead=3)
+        next(items)
+        threading.Event().wait(0.2)
+        # One consumed, three queued, one waiting for a free slot
+        assert len(fetched) <= 5
+        items.close()
+
+    def test_error_raised_after_earlier_items(self):
+        def source():
+            yield 1
+            yield 2
+            raise RuntimeError("page 3 failed")
+
+        items = prefetch(source())
+        assert next(items) == 1
+        assert next(items) == 2
+        with pytest.raises(RuntimeError, match="page 3 failed"):
+            next(items)
+
+    def test_close_stops_thread(self):
+        def source():
+            i = 0
+            while True:
+                yield i
+                i += 1
+
+        items = prefetch(source(), ahead=2)
+        next(items)
+        items.close()
+        assert not any(t.name == "omi-fetch" for t in threading.enumerate())
+
+    def test_lazy_until_first_item(self):
+        started = []
+
+        def source():
+            started.append(True)
+            yield 1
+
+        items = prefetch(source())
+        assert started == []
+        assert list(items) == [1]
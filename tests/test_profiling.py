@@ -0,0 +1,84 @@
+"""Tests for stage timers and profile output."""
+import cProfile
+import threading
+from omi_sync.profiling import StageTimer, write_profile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStageTimer:
+    def test_nested_stages_are_exclusive(self):
+        """Time inside an inner stage is not counted for the outer one."""
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        with timer.stage("outer"):
+            clock.now += 1
+            with timer.stage("inner"):
+                clock.now += 2
+            clock.now += 3
+
+        assert timer.timings == {"outer": 4, "inner": 2}
+
+    def test_iterate_times_each_step(self):
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        def source():
+            for i in range(3):
+                clock.now += 1
+                yield i
+
+        items = []
+        for item in timer.iterate(source(), "fetch"):
+            clock.now += 10
+            items.append(item)
+
+        assert items == [0, 1, 2]
+        assert timer.timings == {"fetch": 3}
+
+    def test_merge(self):
+        timer = StageTimer()
+        timer.merge({"write": 1.5})
+        timer.merge({"write": 0.5, "render.raw": 2.0})
+
+        assert timer.timings == {"write": 2.0, "render.raw": 2.0}
+
+
+class TestWriteProfile:
+    def test_writes_pstats_and_summary(self, tmp_path):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        sum(range(1000))
+        profiler.disable()
+
+        path = write_profile(profiler, tmp_path / "profiles", top=5, label="run")
+
+        assert path == tmp_path / "profiles" / "run.pstats"
+        assert path.exists()
+        assert "cumulative" in (tmp_path / "profiles" / "run.txt").read_text()
+
+
+class TestStageTimerThreads:
+    def test_stages_nest_per_thread(self):
+        """A stage on another thread does not pause the caller's stage."""
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        def fetch():
+            with timer.stage("fetch.request"):
+                clock.now += 5
+
+        with timer.stage("parse"):
+            clock.now += 1
+            thread = threading.Thread(target=fetch)
+            thread.start()
+            thread.join()
+
+        assert timer.timings == {"parse": 6, "fetch.request": 5}
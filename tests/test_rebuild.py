@@ -1,7 +1,10 @@
 """Tests for rebuild index functionality."""
+import os
 import pytest
 from pathlib import Path
-from omi_sync.rebuild import rebuild_index_from_vault
+from omi_sync import rebuild
+from omi_sync.manifest import ScanManifest
+from omi_sync.rebuild import rebuild_index_from_vault, read_frontmatter, scan_event_header
 from omi_sync.config import Config
 from omi_sync.state import StateManager
 
@@ -73,3 +76,165 @@ More content
         count = rebuild_index_from_vault(config)
 
         assert count == 0
+
+    def test_reads_people_from_event_frontmatter(self, tmp_path):
+        """People listed in event frontmatter are indexed."""
+        vault = tmp_path / "vault"
+        events_dir = vault / "Omi" / "Events"
+        events_dir.mkdir(parents=True)
+        (events_dir / "2026-01-10T100000 - meeting - conv_001.md").write_text("""---
+omi_id: conv_001
+date: '2026-01-10'
+people:
+- Speaker 0
+raw_link: '[[2026-01-10#10:00 — Meeting (omi:conv_001)]]'
+---
+
+# Meeting
+""")
+
+        rebuild_index_from_vault(Config(api_key="test", vault_path=vault))
+
+        state = StateManager(vault)
+        assert [e.omi_id for e in state.get_entries_for_person("Speaker 0")] == ["conv_001"]
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        """Scanning with a process pool yields the same index as a serial scan."""
+        vault = tmp_path / "vault"
+        raw_dir = vault / "Omi" / "Raw"
+        raw_dir.mkdir(parents=True)
+        for day in range(1, 6):
+            (raw_dir / f"2026-01-0{day}.md").write_text(
+                f"# Omi Raw — 2026-01-0{day}\n\n## 09:00 — Café ☕ (omi:conv_{day})\n"
+            )
+        (raw_dir / "empty.md").write_text("")
+
+        config = Config(api_key="test", vault_path=vault)
+        serial_count = rebuild_index_from_vault(config, workers=1)
+        serial_index = (vault / "Omi" / ".omi-sync" / "index.json").read_text()
+        (vault / "Omi" / ".omi-sync" / "index.json").unlink()
+
+        parallel_count = rebuild_index_from_vault(config, workers=2)
+
+        assert serial_count == parallel_count == 5
+        assert (vault / "Omi" / ".omi-sync" / "index.json").read_text() == serial_index
+        entry = StateManager(vault).get_index_entry("conv_3")
+        assert entry.raw_heading == "09:00 — Café ☕ (omi:conv_3)"
+
+
+class TestHeaderScan:
+    def test_read_frontmatter_stops_at_closing_delimiter(self, tmp_path):
+        """Only the frontmatter block is parsed; the body is never read as YAML."""
+        note = tmp_path / "note.md"
+        note.write_text("---\nomi_id: conv_001\n---\n\n: not: valid: yaml: [\n")
+
+        assert read_frontmatter(note) == {"omi_id": "conv_001"}
+
+    def test_read_frontmatter_without_block(self, tmp_path):
+        """Files without frontmatter yield None."""
+        note = tmp_path / "note.md"
+        note.write_text("# Just a heading\n")
+
+        assert read_frontmatter(note) is None
+        assert scan_event_header(note) is None
+
+
+class TestIncrementalRebuild:
+    EVENT = """---
+omi_id: {omi_id}
+date: '2026-01-10'
+raw_link: '[[2026-01-10#10:00 — Meeting (omi:{omi_id})]]'
+---
+
+# Meeting
+"""
+
+    @pytest.fixture
+    def vault(self, tmp_path):
+        vault = tmp_path / "vault"
+        (vault / "Omi" / "Events").mkdir(parents=True)
+        return vault
+
+    def _count_parses(self, monkeypatch):
+        parsed = []
+        original = rebuild._parse_event_header
+
+        def counting(block):
+            parsed.append(block)
+            return original(block)
+
+        monkeypatch.setattr(rebuild, "_parse_event_header", counting)
+        return parsed
+
+    def test_unchanged_files_are_not_reparsed(self, vault, monkeypatch):
+        """A second rebuild serves untouched files from the manifest."""
+        note = vault / "Omi" / "Events" / "a.md"
+        note.write_text(self.EVENT.format(omi_id="conv_001"))
+        config = Config(api_key="test", vault_path=vault)
+        rebuild_index_from_vault(config)
+
+        parsed = self._count_parses(monkeypatch)
+        count = rebuild_index_from_vault(config)
+
+        assert count == 1
+        assert parsed == []
+        assert StateManager(vault).get_index_entry("conv_001").raw_date == "2026-01-10"
+
+    def test_touched_file_with_same_content_is_not_reparsed(self, vault, monkeypatch):
+        """A new mtime with an identical hash reuses the cached result."""
+        note = vault / "Omi" / "Events" / "a.md"
+        note.write_text(self.EVENT.format(omi_id="conv_001"))
+        config = Config(api_key="test", vault_path=vault)
+        rebuild_index_from_vault(config)
+        stat = note.stat()
+        os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        parsed = self._count_parses(monkeypatch)
+        count = rebuild_index_from_vault(config)
+
+        assert count == 1
+        assert parsed == []
+
+    def test_changed_file_is_reparsed(self, vault):
+        """Edits made since the last scan are picked up."""
+        note = vault / "Omi" / "Events" / "a.md"
+        note.write_text(self.EVENT.format(omi_id="conv_001"))
+        config = Config(api_key="test", vault_path=vault)
+        rebuild_index_from_vault(config)
+
+        note.write_text(self.EVENT.format(omi_id="conv_002") + "\nmore\n")
+        rebuild_index_from_vault(config)
+
+        assert StateManager(vault).get_index_entry("conv_002") is not None
+
+    def test_deleted_files_dropped_from_manifest(self, vault):
+        """Files removed from the vault are removed from the manifest."""
+        note = vault / "Omi" / "Events" / "a.md"
+        note.write_text(self.EVENT.format(omi_id="conv_001"))
+        config = Config(api_key="test", vault_path=vault)
+        rebuild_index_from_vault(config)
+
+        note.unlink()
+        rebuild_index_from_vault(config)
+
+        manifest = ScanManifest(StateManager(vault).manifest_file)
+        assert manifest.get("Omi/Events/a.md") is None
+
+    def test_full_rescan_ignores_manifest(self, vault, monkeypatch):
+        """full=True parses every file again."""
+        (vault / "Omi" / "Events" / "a.md").write_text(self.EVENT.format(omi_id="conv_001"))
+        config = Config(api_key="test", vault_path=vault)
+        rebuild_index_from_vault(config)
+
+        parsed = self._count_parses(monkeypatch)
+        rebuild_index_from_vault(config, full=True)
+
+        assert len(parsed) == 1
+
+    def test_file_vanishing_during_scan_is_skipped(self, vault):
+        """A file listed but gone before stat (e.g. mid-sync) does not abort the rebuild."""
+        (vault / "Omi" / "Events" / "a.md").write_text(self.EVENT.format(omi_id="conv_001"))
+        (vault / "Omi" / "Events" / "gone.md").symlink_to(vault / "missing.md")
+        config = Config(api_key="test", vault_path=vault)
+
+        assert rebuild_index_from_vault(config) == 1
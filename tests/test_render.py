@@ -0,0 +1,60 @@
+"""Tests for day rendering."""
+import pytest
+from datetime import datetime, timezone
+from omi_sync.config import Config
+from omi_sync.models import Conversation
+from omi_sync.render import DayRenderer, render_day
+
+GENERATED_AT = "2026-01-10T17:00:00-05:00"
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(api_key="test", vault_path=tmp_path)
+
+
+def _conv(omi_id, hour):
+    return Conversation(
+        id=omi_id,
+        started_at=datetime(2026, 1, 10, hour, 0, tzinfo=timezone.utc),
+        finished_at=datetime(2026, 1, 10, hour, 30, tzinfo=timezone.utc),
+        language="en",
+        source="omi",
+        title=f"Meeting {omi_id}",
+    )
+
+
+class TestRenderDay:
+    def test_renders_raw_events_and_highlights(self, config):
+        """A day yields its Raw file, one event per notable, then Highlights."""
+        day = render_day("2026-01-10", [_conv("a", 14), _conv("b", 16)], {"a"}, config, GENERATED_AT)
+
+        names = [path.parent.name for path, _ in day.files]
+        assert names == ["Raw", "Events", "Highlights"]
+        assert day.event_ids == ["a"]
+        assert [e.omi_id for e in day.entries] == ["a", "b"]
+        assert all(GENERATED_AT in content for _, content in day.files)
+        assert not (config.vault_path / "Omi").exists()
+
+    def test_entries_carry_hashes(self, config):
+        """Index entries include section and event hashes."""
+        day = render_day("2026-01-10", [_conv("a", 14)], {"a"}, config, GENERATED_AT)
+
+        assert day.entries[0].last_content_hash
+        assert day.entries[0].event_content_hash
+        assert day.entries[0].event_path.startswith("Omi/Events/")
+
+
+class TestDayRenderer:
+    def test_results_in_submission_order(self, config):
+        """Pooled days come back in the order they were submitted."""
+        dates = [f"2026-01-{d:02d}" for d in range(1, 9)]
+        done = []
+        with DayRenderer(config, GENERATED_AT, workers=2, executor="thread") as renderer:
+            for date in dates:
+                done.extend(renderer.submit(date, [_conv(date, 14)], set()))
+            done.extend(renderer.drain())
+
+        assert [day.date for day in done] == dates
+        assert all(day.written for day in done)
+        assert len(list((config.vault_path / "Omi" / "Raw").glob("*.md"))) == 8
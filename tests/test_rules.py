@@ -0,0 +1,197 @@
+"""Tests for user-defined notable rules."""
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omi_sync.config import ConfigError
+from omi_sync.models import ActionItem, Conversation, Geolocation, TranscriptSegment
+from omi_sync.rules import RuleSet, compile_rule, load_rules
+
+
+def conversation(
+    minutes=10, action_items=0, category="", language="en", speakers=1,
+    title="Chat", overview="", transcript="", address=None, conv_id="c",
+):
+    started = datetime(2026, 1, 10, 14, 0, tzinfo=timezone.utc)
+    return Conversation(
+        id=conv_id,
+        started_at=started,
+        finished_at=started + timedelta(minutes=minutes),
+        language=language,
+        source="omi",
+        title=title,
+        overview=overview,
+        category=category,
+        action_items=[ActionItem(description="x")] * action_items,
+        transcript_segments=[
+            TranscriptSegment(speaker=f"SPEAKER_0{i}", start=i, end=i + 1, text=transcript)
+            for i in range(speakers)
+        ],
+        geolocation=Geolocation(latitude=0.0, longitude=0.0, address=address) if address else None,
+    )
+
+
+def matches(rule, conv):
+    return all(p.test(conv) for p in compile_rule(rule, "r").predicates)
+
+
+class TestConditions:
+    def test_ranges(self):
+        assert matches({"duration_minutes": {"min": 25}}, conversation(minutes=30))
+        assert not matches({"duration_minutes": {"min": 25}}, conversation(minutes=10))
+        assert matches({"action_items": {"min": 1, "max": 2}}, conversation(action_items=2))
+        assert not matches({"action_items": {"max": 1}}, conversation(action_items=2))
+        assert matches({"speakers": {"min": 3}}, conversation(speakers=3))
+        assert not matches({"speakers": {"min": 3}}, conversation(speakers=2))
+
+    def test_category_and_language(self):
+        assert matches({"category": ["Work", "business"]}, conversation(category="work"))
+        assert not matches({"category": ["work"]}, conversation(category=""))
+        assert matches({"language": ["en", "de"]}, conversation(language="DE"))
+
+    def test_keywords(self):
+        assert matches({"keywords": ["budget"]}, conversation(overview="The Budget review"))
+        assert not matches({"keywords": ["budget"]}, conversation(transcript="budget"))
+        spoken = {"keywords": {"any": ["budget"], "in": ["transcript"]}}
+        assert matches(spoken, conversation(transcript="the budget is due"))
+        assert not matches(spoken, conversation(title="budget"))
+        either = {"keywords": {"any": ["budget"], "in": ["title", "transcript"]}}
+        assert matches(either, conversation(title="budget"))
+        assert matches(either, conversation(transcript="budget"))
+        whole = {"keywords": {"any": ["retro"], "whole_words": True}}
+        assert not matches(whole, conversation(title="retrofit"))
+
+    def test_location(self):
+        assert matches({"location": ["clinic"]}, conversation(address="12 Main St, City Clinic"))
+        assert not matches({"location": ["clinic"]}, conversation())
+
+    def test_all_conditions_must_hold(self):
+        rule = {"category": ["work"], "speakers": {"min": 3}}
+        assert matches(rule, conversation(category="work", speakers=4))
+        assert not matches(rule, conversation(category="work", speakers=1))
+
+    @pytest.mark.parametrize("rule", [
+        {},
+        {"name": "x"},
+        {"colour": ["red"]},
+        {"duration_minutes": 25},
+        {"duration_minutes": {"at_least": 25}},
+        {"duration_minutes": {"min": "25"}},
+        {"category": []},
+        {"category": "work"},
+        {"keywords": {"any": ["a"], "in": ["summary"]}},
+        {"keywords": {"any": ["a"], "case": True}},
+        "long",
+    ])
+    def test_malformed(self, rule):
+        with pytest.raises(ConfigError):
+            compile_rule(rule, "rule 1")
+
+
+class TestRuleSet:
+    RULES = [
+        {"name": "long", "duration_minutes": {"min": 25}},
+        {"name": "busy", "action_items": {"min": 2}},
+        {"name": "spoken", "keywords": {"any": ["budget"], "in": ["transcript"]}},
+        {"name": "team", "category": ["work"], "speakers": {"min": 3}},
+        {"name": "clinic", "location": ["clinic"], "duration_minutes": {"min": 5}},
+        {"name": "german", "language": ["de"], "keywords": ["termin"]},
+    ]
+
+    def _conversations(self, count):
+        rng = random.Random(5)
+        return [
+            conversation(
+                minutes=rng.choice([3, 10, 30]),
+                action_items=rng.randint(0, 3),
+                category=rng.choice(["", "work", "personal"]),
+                language=rng.choice(["en", "de"]),
+                speakers=rng.randint(1, 4),
+                title=rng.choice(["Chat", "Termin", "Plan"]),
+                transcript=rng.choice(["hello", "the budget", ""]),
+                address=rng.choice([None, "City Clinic", "Cafe"]),
+                conv_id=f"c{i}",
+            )
+            for i in range(count)
+        ]
+
+    def test_same_result_as_evaluating_every_rule(self):
+        convs = self._conversations(600)
+        rules = RuleSet([compile_rule(r, "r") for r in self.RULES], calibration=50)
+        expected = [any(matches(r, c) for r in self.RULES) for c in convs]
+        assert [rules.matches(c) for c in convs] == expected
+
+    def test_counters(self):
+        convs = self._conversations(300)
+        rules = RuleSet([compile_rule(r, "r") for r in self.RULES], calibration=50)
+        notable = sum(rules.matches(c) for c in convs)
+        counters = rules.counters()
+        assert list(counters) == [r["name"] for r in self.RULES]
+        assert sum(c["hits"] for c in counters.values()) == notable
+        assert all(0 <= c["hits"] <= c["evaluations"] <= len(convs) for c in counters.values())
+
+    def test_keyword_rules_share_one_matcher(self):
+        spec = [
+            {"name": "acme", "keywords": ["Acme", "Roadrunner"]},
+            {"name": "globex", "keywords": ["globex", "acme"]},
+            {"name": "spoken", "keywords": {"any": ["acme"], "in": ["transcript"]}},
+            {"name": "long", "duration_minutes": {"min": 25}},
+        ]
+        rules = RuleSet([compile_rule(r, "r") for r in spec], calibration=0)
+        assert len(rules._units) == 3
+        convs = [
+            conversation(title="ACME sync", conv_id="a"),
+            conversation(overview="globex review", conv_id="b"),
+            conversation(transcript="acme", conv_id="c"),
+            conversation(conv_id="d"),
+        ]
+        assert [rules.matches(c) for c in convs] == [True, True, True, False]
+        counters = rules.counters()
+        assert (counters["acme"]["hits"], counters["globex"]["hits"], counters["spoken"]["hits"]) == (1, 1, 1)
+        assert counters["acme"]["evaluations"] == counters["globex"]["evaluations"]
+
+    def test_cheap_selective_conditions_run_first(self):
+        rule = compile_rule(
+            {"name": "r", "keywords": {"any": ["budget"], "in": ["transcript"]}, "category": ["work"]}, "r"
+        )
+        RuleSet([rule])
+        assert [p.kind for p in rule.predicates] == ["category", "transcript"]
+
+    def test_reordered_by_measurement(self):
+        # A rule that always hits is moved ahead of one that never does
+        never = compile_rule({"name": "never", "category": ["nope"]}, "never")
+        always = compile_rule({"name": "always", "language": ["en"]}, "always")
+        rules = RuleSet([never, always], calibration=20)
+        for i in range(40):
+            assert rules.matches(conversation(conv_id=f"c{i}"))
+        assert rules.counters() == {
+            "never": {"evaluations": 20, "hits": 0},
+            "always": {"evaluations": 40, "hits": 40},
+        }
+
+
+class TestLoadRules:
+    def test_missing_file(self, tmp_path):
+        assert load_rules(tmp_path / "notable.json") is None
+
+    def test_loads_rules(self, tmp_path):
+        path = tmp_path / "notable.json"
+        path.write_text(json.dumps({"rules": [{"duration_minutes": {"min": 25}}, {"name": "work", "category": ["work"]}]}))
+        rules = load_rules(path)
+        assert len(rules) == 2
+        assert list(rules.counters()) == ["rule 1", "work"]
+
+    @pytest.mark.parametrize("content", [
+        "{not json",
+        json.dumps([{"category": ["work"]}]),
+        json.dumps({"rules": {"category": ["work"]}}),
+        json.dumps({"rules": [{"name": "a", "category": ["x"]}, {"name": "a", "language": ["en"]}]}),
+        json.dumps({"rules": [{"category": ["work"], "mood": ["happy"]}]}),
+    ])
+    def test_invalid_file(self, tmp_path, content):
+        path = tmp_path / "notable.json"
+        path.write_text(content)
+        with pytest.raises(ConfigError, match="notable.json"):
+            load_rules(path)
@@ -109,3 +109,69 @@ class TestStateManager:
 
         manager2 = StateManager(vault_path)
         assert manager2.state["last_run_at"] == "2026-01-10T22:00:00-05:00"
+
+
+class TestSecondaryIndexes:
+    def _entry(self, omi_id, date, event_path=None, people=None):
+        return IndexEntry(
+            omi_id=omi_id,
+            raw_date=date,
+            raw_heading=f"10:00 — Meeting (omi:{omi_id})",
+            event_path=event_path,
+            people=people or [],
+        )
+
+    def test_lookup_by_event_path(self, tmp_path):
+        """Entries can be found by their event note path."""
+        manager = StateManager(tmp_path)
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-10", event_path="Omi/Events/a.md"))
+
+        assert manager.get_entry_by_event_path("Omi/Events/a.md").omi_id == "conv_001"
+        assert manager.get_entry_by_event_path("Omi/Events/missing.md") is None
+
+    def test_lookup_by_person(self, tmp_path):
+        """Entries can be found by participant."""
+        manager = StateManager(tmp_path)
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-10", people=["Speaker 0", "Alice"]))
+        manager.set_index_entry("conv_002", self._entry("conv_002", "2026-01-11", people=["Alice"]))
+
+        assert [e.omi_id for e in manager.get_entries_for_person("Alice")] == ["conv_001", "conv_002"]
+        assert [e.omi_id for e in manager.get_entries_for_person("Speaker 0")] == ["conv_001"]
+
+    def test_replacing_entry_updates_secondary_indexes(self, tmp_path):
+        """Overwriting an entry moves it between date, path and person buckets."""
+        manager = StateManager(tmp_path)
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-10", "Omi/Events/old.md", ["Alice"]))
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-11", "Omi/Events/new.md", ["Bob"]))
+
+        assert manager.get_entries_for_date("2026-01-10") == []
+        assert len(manager.get_entries_for_date("2026-01-11")) == 1
+        assert manager.get_entry_by_event_path("Omi/Events/old.md") is None
+        assert manager.get_entry_by_event_path("Omi/Events/new.md").omi_id == "conv_001"
+        assert manager.get_entries_for_person("Alice") == []
+        assert manager.get_dates() == ["2026-01-11"]
+
+    def test_remove_index_entry(self, tmp_path):
+        """Removing an entry clears it from every index."""
+        manager = StateManager(tmp_path)
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-10", "Omi/Events/a.md", ["Alice"]))
+
+        removed = manager.remove_index_entry("conv_001")
+
+        assert removed.omi_id == "conv_001"
+        assert manager.get_index_entry("conv_001") is None
+        assert manager.get_entries_for_date("2026-01-10") == []
+        assert manager.get_entry_by_event_path("Omi/Events/a.md") is None
+        assert manager.get_entries_for_person("Alice") == []
+
+    def test_secondary_indexes_rebuilt_on_load(self, tmp_path):
+        """Secondary indexes are populated from index.json on load."""
+        manager = StateManager(tmp_path)
+        manager.set_index_entry("conv_001", self._entry("conv_001", "2026-01-10", "Omi/Events/a.md", ["Alice"]))
+        manager.save()
+
+        reloaded = StateManager(tmp_path)
+
+        assert [e.omi_id for e in reloaded.get_entries_for_date("2026-01-10")] == ["conv_001"]
+        assert reloaded.get_entry_by_event_path("Omi/Events/a.md").omi_id == "conv_001"
+        assert reloaded.get_entries_for_person("Alice")[0].people == ["Alice"]
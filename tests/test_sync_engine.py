@@ -1,10 +1,13 @@
 """Tests for sync engine."""
 import pytest
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from freezegun import freeze_time
+from omi_sync import sync_engine
 from omi_sync.sync_engine import SyncEngine
+from omi_sync.state import StateManager
 from omi_sync.config import Config
 
 
@@ -167,6 +170,37 @@ class TestFinalizationFiltering:
         raw_files = list((config.vault_path / "Omi" / "Raw").glob("*.md"))
         assert len(raw_files) == 0
 
+    def test_recent_conversation_queued_as_pending(self, config):
+        """Filtered conversations are queued with the time they become eligible."""
+        recent = _conversation("conv_recent", 10, 22, 0)
+        with freeze_time("2026-01-10T22:05:00Z"):
+            SyncEngine(config).sync([recent])
+
+        assert StateManager(config.vault_path).get_pending() == {
+            "conv_recent": {"eligible_at": "2026-01-10T22:10:00+00:00", "date": "2026-01-10"},
+        }
+
+        with freeze_time("2026-01-10T22:15:00Z"):
+            SyncEngine(config).sync([recent])
+
+        assert StateManager(config.vault_path).get_pending() == {}
+        assert (config.vault_path / "Omi" / "Raw" / "2026-01-10.md").exists()
+
+    def test_date_restricted_sync(self, config):
+        """With dates, other days are neither written nor dropped from the queue."""
+        with freeze_time("2026-01-12T14:05:00Z"):
+            SyncEngine(config).sync([_conversation("conv_12", 12, 14, 0)])
+        with freeze_time("2026-01-12T15:00:00Z"):
+            result = SyncEngine(config).sync(
+                [_conversation("conv_11", 11), _conversation("conv_12", 12, 14, 0)],
+                dates={"2026-01-11"},
+            )
+
+        raw_files = sorted(p.name for p in (config.vault_path / "Omi" / "Raw").glob("*.md"))
+        assert raw_files == ["2026-01-11.md"]
+        assert result["stats"]["dates"] == 1
+        assert list(StateManager(config.vault_path).get_pending()) == ["conv_12"]
+
 
 class TestNotableClassification:
     """Test notable conversation classification in sync."""
@@ -210,3 +244,335 @@ class TestNotableClassification:
 
         event_files = list((config.vault_path / "Omi" / "Events").glob("*.md"))
         assert len(event_files) == 0
+
+    @freeze_time("2026-01-10T22:00:00Z")
+    def test_keyword_in_transcript_links_event_note(self, config):
+        """With the transcript scan on, a keyword only spoken makes the conversation notable."""
+        config.notable_scan_transcript = True
+        data = [{
+            "id": "conv_spoken",
+            "started_at": "2026-01-10T14:00:00Z",
+            "finished_at": "2026-01-10T14:10:00Z",
+            "language": "en",
+            "source": "omi",
+            "structured": {"title": "Short Chat", "overview": "", "action_items": []},
+            "transcript_segments": [
+                {"speaker": "SPEAKER_00", "text": "Hi", "start": 0, "end": 2},
+                {"speaker": "SPEAKER_01", "text": "Back from the doctor", "start": 125, "end": 130},
+            ],
+        }]
+
+        result = SyncEngine(config).sync(data)
+        event_files = list((config.vault_path / "Omi" / "Events").glob("*.md"))
+        assert len(event_files) == 1
+        assert (
+            '"doctor" spoken by SPEAKER_01 at 09:02 (2:05 in) → '
+            "[[2026-01-10#09:00 — Short Chat (omi:conv_spoken)]]"
+        ) in event_files[0].read_text()
+        assert result["stats"]["transcripts_scanned"] == 1
+
+        # The next run reuses the stored result
+        result = SyncEngine(config).sync(data)
+        assert (result["stats"]["transcripts_scanned"], result["stats"]["transcripts_cached"]) == (0, 1)
+
+    @freeze_time("2026-01-10T22:00:00Z")
+    def test_rules_file_replaces_builtin_rules(self, config):
+        """A rules file decides instead of the config thresholds, with counters in the stats."""
+        rules_path = StateManager(config.vault_path).get_notable_rules_path()
+        rules_path.write_text(json.dumps({"rules": [
+            {"name": "work", "category": ["work"]},
+            {"name": "very long", "duration_minutes": {"min": 120}},
+        ]}))
+        data = [
+            {
+                "id": conv_id,
+                "started_at": "2026-01-10T14:00:00Z",
+                "finished_at": "2026-01-10T14:30:00Z",  # notable by the built-in rules
+                "language": "en",
+                "source": "omi",
+                "structured": {"title": conv_id, "overview": "", "category": category, "action_items": []},
+                "transcript_segments": [],
+            }
+            for conv_id, category in (("conv_work", "work"), ("conv_other", "personal"))
+        ]
+
+        result = SyncEngine(config).sync(data)
+        event_files = [p.name for p in (config.vault_path / "Omi" / "Events").glob("*.md")]
+        assert len(event_files) == 1 and "conv_work" in event_files[0]
+        assert result["stats"]["rules"] == {
+            "work": {"evaluations": 2, "hits": 1},
+            "very long": {"evaluations": 1, "hits": 0},
+        }
+
+
+def _conversation(omi_id, day, hour=14, minutes=20, title=None):
+    """API dict for a conversation on 2026-01-<day> at <hour>:00 UTC."""
+    return {
+        "id": omi_id,
+        "started_at": f"2026-01-{day:02d}T{hour:02d}:00:00Z",
+        "finished_at": f"2026-01-{day:02d}T{hour:02d}:{minutes:02d}:00Z",
+        "language": "en",
+        "source": "omi",
+        "structured": {"title": title or f"Meeting {omi_id}", "overview": "", "action_items": []},
+        "transcript_segments": [{"speaker": "SPEAKER_00", "text": f"text {omi_id}", "start": 0, "end": 1}],
+    }
+
+
+def _vault_files(vault):
+    return {
+        str(p.relative_to(vault)): p.read_text()
+        for p in vault.rglob("*.md")
+    }
+
+
+class TestStreamingPipeline:
+    @pytest.fixture
+    def history(self):
+        """Ten days of conversations, newest first like the API."""
+        data = []
+        for day in range(10, 0, -1):
+            for hour, minutes in [(20, 40), (15, 10), (13, 5)]:
+                data.append(_conversation(f"conv_{day:02d}_{hour}", day, hour, minutes))
+        return data
+
+    def _sync(self, tmp_path, name, data, **config_kwargs):
+        vault = tmp_path / name
+        vault.mkdir()
+        config = Config(api_key="test", vault_path=vault, **config_kwargs)
+        with freeze_time("2026-01-20T22:00:00Z"):
+            result = SyncEngine(config).sync(data)
+        return vault, result
+
+    def test_generator_input_matches_list_input(self, tmp_path, history):
+        """Streaming a one-shot iterator writes the same files as a list."""
+        list_vault, list_result = self._sync(tmp_path, "list", history)
+        gen_vault, gen_result = self._sync(tmp_path, "gen", (d for d in history))
+
+        assert _vault_files(list_vault) == _vault_files(gen_vault)
+        assert list_result["stats"] == gen_result["stats"]
+        assert list_result["stats"]["dates"] == 10
+
+    def test_days_flushed_before_stream_ends(self, tmp_path, history, monkeypatch):
+        """A day is staged once the stream is more than a day past it."""
+        # One conversation per finalize batch, so days flush as early as they can
+        monkeypatch.setattr(sync_engine, "BATCH_SIZE", 1)
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        journal = vault / "Omi" / ".omi-sync" / "journal" / "journal.jsonl"
+        staged = []
+
+        def stream():
+            for data in history:
+                if data["id"] == "conv_07_20":
+                    records = [json.loads(line) for line in journal.read_text().splitlines()]
+                    staged.extend(sorted(r["write"] for r in records if r.get("write", "").startswith("Omi/Raw/")))
+                yield data
+
+        # Inline writes, so a day is journaled as soon as it is flushed
+        with freeze_time("2026-01-20T22:00:00Z"):
+            SyncEngine(Config(api_key="test", vault_path=vault, write_workers=0)).sync(stream())
+
+        assert staged == ["Omi/Raw/2026-01-10.md"]
+
+    def test_interrupted_run_rolled_forward(self, tmp_path, history, monkeypatch):
+        """A run that dies mid-stream leaves the vault untouched; the next run keeps its finished days."""
+        monkeypatch.setattr(sync_engine, "BATCH_SIZE", 1)
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        config = Config(api_key="test", vault_path=vault)
+
+        def stream():
+            for data in history:
+                if data["id"] == "conv_07_20":
+                    raise RuntimeError("connection lost")
+                yield data
+
+        with freeze_time("2026-01-20T22:00:00Z"):
+            with pytest.raises(RuntimeError):
+                SyncEngine(config).sync(stream())
+            assert not (vault / "Omi" / "Raw").exists()
+
+            SyncEngine(config).sync([])
+
+        assert (vault / "Omi" / "Raw" / "2026-01-10.md").exists()
+        assert {e.omi_id for e in StateManager(vault).get_entries_for_date("2026-01-10")} == {
+            "conv_10_20", "conv_10_15", "conv_10_13",
+        }
+        assert not (vault / "Omi" / ".omi-sync" / "journal").exists()
+
+    def test_spilling_to_disk_matches_in_memory(self, tmp_path, history):
+        """A tiny max_memory spills buckets without changing output."""
+        memory_vault, _ = self._sync(tmp_path, "memory", history)
+        spill_vault, _ = self._sync(tmp_path, "spill", (d for d in history), max_memory_mb=0.001)
+
+        assert _vault_files(memory_vault) == _vault_files(spill_vault)
+
+    @pytest.mark.parametrize("as_generator", [False, True])
+    def test_late_arrival_rerenders_written_day(self, tmp_path, history, as_generator):
+        """A conversation arriving after its day was written is still included."""
+        late = _conversation("conv_late", 10, 9)
+        data = history + [late]
+        expected_vault, expected = self._sync(tmp_path, "expected", [late] + history)
+        vault, result = self._sync(tmp_path, "late", iter(data) if as_generator else data)
+
+        assert "(omi:conv_late)" in (vault / "Omi" / "Raw" / "2026-01-10.md").read_text()
+        assert _vault_files(vault) == _vault_files(expected_vault)
+        # Re-rendering the day costs extra writes, but the outcome is the same
+        io_counters = {"files_written", "bytes_written"}
+        assert {k: v for k, v in result["stats"].items() if k not in io_counters} == {
+            k: v for k, v in expected["stats"].items() if k not in io_counters
+        }
+        assert result["stats"]["files_written"] > expected["stats"]["files_written"]
+
+    def test_newer_version_moves_between_written_days(self, tmp_path, history):
+        """A newer version finishing on another day replaces the written one."""
+        moved = _conversation("conv_10_13", 11, 15, 30, title="Moved")
+        vault, _ = self._sync(tmp_path, "moved", iter(history + [moved]))
+
+        assert "conv_10_13" not in (vault / "Omi" / "Raw" / "2026-01-10.md").read_text()
+        assert "Moved (omi:conv_10_13)" in (vault / "Omi" / "Raw" / "2026-01-11.md").read_text()
+
+    @pytest.mark.parametrize("as_generator", [False, True])
+    def test_newer_version_empties_written_day(self, tmp_path, as_generator):
+        """A day left without conversations loses its files and the old event note."""
+        data = [
+            _conversation("x", 10, 14, 40, title="Old"),
+            _conversation("y", 9),
+            _conversation("z", 8),
+            _conversation("x", 12, 14, 45, title="New"),
+        ]
+        vault, result = self._sync(tmp_path, "emptied", iter(data) if as_generator else data)
+        files = _vault_files(vault)
+
+        assert "Omi/Raw/2026-01-10.md" not in files
+        assert "Omi/Highlights/2026-01-10 Highlights.md" not in files
+        assert sorted(p for p in files if p.startswith("Omi/Events/")) == [
+            "Omi/Events/2026-01-12T094500 - new - x.md",
+        ]
+        assert result["stats"]["dates"] == 3
+        assert result["stats"]["event_files"] == 1
+
+    def test_superseded_event_note_removed(self, tmp_path, history):
+        """A newer notable version with a new title replaces the old event note."""
+        renamed = _conversation("conv_10_13", 11, 15, 40, title="Renamed")
+        old = _conversation("conv_10_13", 10, 13, 40, title="Original")
+        vault, _ = self._sync(tmp_path, "renamed", iter(history[:1] + [old] + history[1:] + [renamed]))
+        events = sorted(p for p in _vault_files(vault) if p.startswith("Omi/Events/"))
+
+        assert [p for p in events if "conv_10_13" in p] == ["Omi/Events/2026-01-11T104000 - renamed - conv_10_13.md"]
+
+
+class TestOverrideChanges:
+    DAY = [
+        _conversation("long", 10, 14, 40),  # notable by duration
+        _conversation("short", 10, 16, 5),
+        _conversation("other", 10, 18, 5),
+    ]
+
+    def _sync(self, vault, overrides=None, **kwargs):
+        config = Config(api_key="test", vault_path=vault)
+        if overrides is not None:
+            _write_overrides(config, overrides)
+        engine = SyncEngine(config, **kwargs)
+        with freeze_time("2026-01-20T22:00:00Z"):
+            return engine, engine.sync(self.DAY)
+
+    def test_matches_full_sync(self, tmp_path):
+        """Flipped conversations end up exactly as a full sync would render them."""
+        engine, _ = self._sync(tmp_path / "applied")
+        raw = (tmp_path / "applied" / "Omi" / "Raw" / "2026-01-10.md").read_text()
+        _write_overrides(engine.config, {"long": False, "short": True})
+
+        with freeze_time("2026-01-20T22:00:00Z"):
+            result = SyncEngine(engine.config).apply_override_changes()
+        self._sync(tmp_path / "full", overrides={"long": False, "short": True})
+
+        assert _vault_files(tmp_path / "applied") == _vault_files(tmp_path / "full")
+        assert (tmp_path / "applied" / "Omi" / "Raw" / "2026-01-10.md").read_text() == raw
+        stats = result["stats"]
+        assert (stats["reclassified"], stats["event_files"], stats["events_deleted"]) == (2, 1, 1)
+        assert stats["highlights_files"] == 1
+        state = StateManager(tmp_path / "applied")
+        assert state.get_index_entry("long").event_path is None
+        assert state.get_index_entry("short").event_path.endswith("short.md")
+
+    def test_unchanged_file_is_a_no_op(self, tmp_path):
+        engine, _ = self._sync(tmp_path, overrides={"short": True})
+        assert engine.apply_override_changes() is None
+
+        _write_overrides(engine.config, {"short": True, "other": False})
+        result = engine.apply_override_changes()
+        # "other" was not notable anyway
+        assert (result["stats"]["reclassified"], result["stats"]["event_files"]) == (1, 0)
+        assert result["stats"]["highlights_files"] == 0
+        assert engine.apply_override_changes() is None
+
+    def test_next_sync_skips_applied_day(self, tmp_path):
+        engine, _ = self._sync(tmp_path)
+        _write_overrides(engine.config, {"long": False})
+        engine.apply_override_changes()
+
+        _, result = self._sync(tmp_path, skip_unchanged=True)
+        assert result["stats"]["skipped_dates"] == 1
+
+    def test_unstored_day_left_for_next_sync(self, tmp_path):
+        engine, _ = self._sync(tmp_path)
+        engine.store.path("2026-01-10").unlink()
+        _write_overrides(engine.config, {"long": False})
+
+        result = engine.apply_override_changes()
+        assert (result["stats"]["unavailable"], result["stats"]["reclassified"]) == (1, 0)
+        assert list((tmp_path / "Omi" / "Events").glob("*long.md"))
+
+
+def _write_overrides(config, overrides):
+    """Write the overrides file with an mtime distinct from any earlier write."""
+    path = StateManager(config.vault_path).get_notable_overrides_path()
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps(overrides))
+    mtime_ns = max(path.stat().st_mtime_ns, previous + 1_000_000)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestStageTimings:
+    def test_result_includes_stage_timings(self, config):
+        """Every pipeline stage reports its time next to the stats."""
+        with freeze_time("2026-01-20T22:00:00Z"):
+            result = SyncEngine(config).sync([_conversation("conv_a", 10, 14, 40)])
+
+        timings = result["timings"]
+        for stage in ["fetch", "parse", "finalize", "dedupe", "classify", "bucket",
+                      "render.raw", "render.event", "render.highlights", "write", "index", "save"]:
+            assert stage in timings
+        assert timings["total"] >= sum(v for k, v in timings.items() if k != "total" and not k.startswith("render.wait"))
+
+
+class TestParallelRendering:
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_pool_output_identical_to_serial(self, tmp_path, executor):
+        """Rendering days on a pool writes byte-identical files and index."""
+        data = [
+            _conversation(f"conv_{day:02d}_{hour}", day, hour, minutes)
+            for day in range(12, 0, -1)
+            for hour, minutes in [(20, 40), (13, 5)]
+        ]
+        results = {}
+        for name, workers in [("serial", 1), ("pool", 3)]:
+            vault = tmp_path / name
+            vault.mkdir()
+            config = Config(api_key="test", vault_path=vault, render_workers=workers, render_executor=executor)
+            with freeze_time("2026-01-20T22:00:00Z"):
+                result = SyncEngine(config).sync(data)
+            index = (vault / "Omi" / ".omi-sync" / "index.json").read_text()
+            results[name] = (_vault_files(vault), index, result["stats"])
+
+        assert results["pool"] == results["serial"]
+        assert results["pool"][2]["event_files"] == 12
+
+    def test_unknown_executor_rejected(self, config):
+        """A misspelled executor fails before any work is done."""
+        config.render_workers = 2
+        config.render_executor = "fibers"
+
+        with pytest.raises(ValueError, match="fibers"):
+            SyncEngine(config).sync([])
@@ -1,7 +1,10 @@
 """Tests for timezone utilities."""
 import pytest
-from datetime import datetime, timezone
-from omi_sync.timezone_utils import get_local_date, format_time_local, format_datetime_local
+from datetime import datetime, timedelta, timezone
+from omi_sync import timezone_utils
+from omi_sync.timezone_utils import (
+    epoch_seconds, format_datetime_local, format_time_local, get_local_date, local_dates, zone_table,
+)
 from omi_sync.models import Conversation
 
 
@@ -64,3 +67,54 @@ class TestTimezoneGrouping:
         )
         local_date = get_local_date(conv.finished_at, "America/New_York")
         assert local_date == "2026-01-10"
+
+
+ZONES = ["America/New_York", "Europe/London", "Australia/Lord_Howe", "Asia/Kolkata", "UTC", "EST"]
+
+
+def _instants(zone_name):
+    """Instants around every DST change from 2020 to 2030, plus an hourly sweep of 2026."""
+    import pytz
+    tz = pytz.timezone(zone_name)
+    instants = []
+    for t in getattr(tz, "_utc_transition_times", []):
+        if 2020 <= t.year <= 2030:
+            at = t.replace(tzinfo=timezone.utc)
+            instants += [at + timedelta(seconds=s) for s in (-3600, -1, -0.000001, 0, 1, 3600)]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    instants += [start + timedelta(hours=h, minutes=17) for h in range(0, 24 * 365, 5)]
+    return instants
+
+
+class TestZoneTable:
+    @pytest.mark.parametrize("zone_name", ZONES)
+    def test_matches_astimezone(self, zone_name):
+        """Same local date and time as the per-call helpers, including at DST edges."""
+        table = zone_table(zone_name)
+        for dt in _instants(zone_name):
+            epoch = epoch_seconds(dt)
+            assert table.local_date(epoch) == get_local_date(dt, zone_name), dt
+            assert table.local_time(epoch) == format_time_local(dt, zone_name), dt
+
+    def test_naive_datetimes_are_utc(self):
+        naive = datetime(2026, 1, 10, 3, 0)
+        assert local_dates([naive], "America/New_York") == [get_local_date(naive, "America/New_York")]
+
+    @pytest.mark.parametrize("zone_name", ZONES)
+    def test_bulk_matches_scalar(self, zone_name, monkeypatch):
+        instants = _instants(zone_name)
+        expected = [get_local_date(dt, zone_name) for dt in instants]
+        monkeypatch.setattr(timezone_utils, "optional_numpy", lambda: None)
+        assert local_dates(instants, zone_name) == expected
+
+    @pytest.mark.parametrize("zone_name", ZONES)
+    def test_numpy_bulk_matches_scalar(self, zone_name):
+        pytest.importorskip("numpy")
+        instants = _instants(zone_name)
+        assert local_dates(instants, zone_name) == [get_local_date(dt, zone_name) for dt in instants]
+
+    def test_empty_batch(self):
+        assert local_dates([], "America/New_York") == []
+
+    def test_tables_are_cached(self):
+        assert zone_table("America/New_York") is zone_table("America/New_York")
@@ -0,0 +1,86 @@
+"""Tests for the transcript keyword scan."""
+from datetime import datetime, timezone
+
+from omi_sync.keywords import KeywordMatcher
+from omi_sync.models import Conversation, TranscriptSegment
+from omi_sync.transcript_scan import TranscriptMatch, TranscriptScanner
+
+
+def conversation(texts, conv_id="conv_001"):
+    return Conversation(
+        id=conv_id,
+        started_at=datetime(2026, 1, 10, 14, 0, tzinfo=timezone.utc),
+        finished_at=datetime(2026, 1, 10, 14, 10, tzinfo=timezone.utc),
+        language="en",
+        source="omi",
+        transcript_segments=[
+            TranscriptSegment(speaker=f"SPEAKER_0{i % 2}", start=30.0 * i, end=30.0 * i + 25, text=text)
+            for i, text in enumerate(texts)
+        ],
+    )
+
+
+class TestTranscriptScanner:
+    def test_first_match_and_its_segment(self):
+        scanner = TranscriptScanner(KeywordMatcher(["therapy", "doctor"]))
+        conv = conversation(["Morning.", "How was the Doctor?", "Fine, and therapy too."])
+        assert scanner.scan(conv) == TranscriptMatch(keyword="doctor", segment=1, start=30.0)
+
+    def test_no_match(self):
+        scanner = TranscriptScanner(KeywordMatcher(["therapy"]))
+        assert scanner.scan(conversation(["Lunch?", "Sure."])) is None
+        assert scanner.scan(conversation([])) is None
+
+    def test_no_match_across_segments(self):
+        scanner = TranscriptScanner(KeywordMatcher(["one-on-one"]))
+        assert scanner.scan(conversation(["let's do a one-", "on-one later"])) is None
+
+    def test_whole_words(self):
+        scanner = TranscriptScanner(KeywordMatcher(["retro"], whole_words=True))
+        assert scanner.scan(conversation(["a retrofit", "the retro is at 3"])).segment == 1
+
+    def test_segment_found_when_lowercasing_changes_length(self):
+        # "İ".lower() is two characters long
+        scanner = TranscriptScanner(KeywordMatcher(["planning"]))
+        conv = conversation(["İstanbul İzmir", "ok", "planning now"])
+        assert scanner.scan(conv).segment == 2
+
+    def test_unchanged_transcript_served_from_cache(self):
+        scanner = TranscriptScanner(KeywordMatcher(["therapy"]))
+        conv = conversation(["therapy at noon"])
+        first = scanner.scan(conv)
+        assert scanner.scan(conv) == first
+        assert (scanner.scanned, scanner.cached) == (1, 1)
+
+        conv.transcript_segments[0].text = "lunch at noon"
+        assert scanner.scan(conv) is None
+        assert scanner.scanned == 2
+
+    def test_results_persist(self, tmp_path):
+        path = tmp_path / "transcript_scan.json"
+        keywords = KeywordMatcher(["therapy"])
+        scanner = TranscriptScanner(keywords, path)
+        match = scanner.scan(conversation(["x", "therapy"], "a"))
+        scanner.scan(conversation(["nothing"], "b"))
+        scanner.save()
+
+        reloaded = TranscriptScanner(keywords, path)
+        assert reloaded.scan(conversation(["x", "therapy"], "a")) == match
+        assert reloaded.scan(conversation(["nothing"], "b")) is None
+        assert (reloaded.scanned, reloaded.cached) == (0, 2)
+
+    def test_changed_keywords_discard_cache(self, tmp_path):
+        path = tmp_path / "transcript_scan.json"
+        scanner = TranscriptScanner(KeywordMatcher(["therapy"]), path)
+        scanner.scan(conversation(["see the doctor"]))
+        scanner.save()
+
+        reloaded = TranscriptScanner(KeywordMatcher(["therapy", "doctor"]), path)
+        assert reloaded.scan(conversation(["see the doctor"])).keyword == "doctor"
+        assert reloaded.scanned == 1
+
+    def test_unreadable_cache_ignored(self, tmp_path):
+        path = tmp_path / "transcript_scan.json"
+        path.write_text("{not json")
+        scanner = TranscriptScanner(KeywordMatcher(["therapy"]), path)
+        assert scanner.scan(conversation(["therapy"])).segment == 0
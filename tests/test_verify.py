@@ -0,0 +1,140 @@
+"""Tests for vault verification."""
+import io
+import pytest
+from freezegun import freeze_time
+from omi_sync.config import Config
+from omi_sync.hashing import raw_section_hashes, hash_text
+from omi_sync.state import StateManager
+from omi_sync.sync_engine import SyncEngine
+from omi_sync.verify import verify_vault, MISSING, CHANGED, UNREADABLE
+
+
+@pytest.fixture
+def config(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    return Config(api_key="test", vault_path=vault)
+
+
+@pytest.fixture
+def synced(config):
+    """Vault after syncing one notable and one regular conversation."""
+    data = [
+        {
+            "id": "conv_long",
+            "started_at": "2026-01-10T14:00:00Z",
+            "finished_at": "2026-01-10T14:30:00Z",
+            "language": "en",
+            "source": "omi",
+            "structured": {"title": "Long Meeting", "overview": "", "action_items": []},
+            "transcript_segments": [{"speaker": "SPEAKER_00", "text": "Hello", "start": 0, "end": 1}],
+        },
+        {
+            "id": "conv_short",
+            "started_at": "2026-01-10T16:00:00Z",
+            "finished_at": "2026-01-10T16:05:00Z",
+            "language": "en",
+            "source": "omi",
+            "structured": {"title": "Quick Chat", "overview": "", "action_items": []},
+            "transcript_segments": [],
+        },
+    ]
+    with freeze_time("2026-01-10T22:00:00Z"):
+        SyncEngine(config).sync(data)
+    return config
+
+
+class TestRawSectionHashes:
+    def test_sections_split_on_headings(self):
+        """Each section covers its heading up to the next heading."""
+        content = "# Omi Raw\n\n## 09:00 — A (omi:a)\n\nbody a\n## 10:00 — B (omi:b)\nbody b\n"
+        sections = raw_section_hashes(io.BytesIO(content.encode("utf-8")))
+
+        assert sections["a"] == ("09:00 — A (omi:a)", hash_text("## 09:00 — A (omi:a)\n\nbody a\n"))
+        assert sections["b"] == ("10:00 — B (omi:b)", hash_text("## 10:00 — B (omi:b)\nbody b\n"))
+
+
+class TestVerifyVault:
+    def test_clean_vault_has_no_discrepancies(self, synced):
+        """A freshly synced vault matches its index."""
+        assert verify_vault(synced) == []
+
+    def test_sync_records_hashes(self, synced):
+        """SyncEngine records section and event hashes in the index."""
+        state = StateManager(synced.vault_path)
+        assert state.get_index_entry("conv_long").last_content_hash
+        assert state.get_index_entry("conv_long").event_content_hash
+        assert state.get_index_entry("conv_short").event_content_hash is None
+
+    def test_missing_raw_file(self, synced):
+        """Deleting a Raw file reports every entry of that day."""
+        (synced.vault_path / "Omi" / "Raw" / "2026-01-10.md").unlink()
+
+        found = verify_vault(synced)
+
+        assert [(d.marker, d.omi_id) for d in found] == [(MISSING, "conv_long"), (MISSING, "conv_short")]
+
+    def test_edited_raw_section(self, synced):
+        """Editing one section reports only that conversation."""
+        raw = synced.vault_path / "Omi" / "Raw" / "2026-01-10.md"
+        raw.write_text(raw.read_text().replace("- **SPEAKER_00**: Hello", "- **SPEAKER_00**: Goodbye"))
+
+        found = verify_vault(synced)
+
+        assert [(d.marker, d.omi_id) for d in found] == [(CHANGED, "conv_long")]
+
+    def test_missing_heading(self, synced):
+        """A removed heading is reported as missing."""
+        raw = synced.vault_path / "Omi" / "Raw" / "2026-01-10.md"
+        raw.write_text(raw.read_text().replace("(omi:conv_short)", "(omi:other)"))
+
+        found = verify_vault(synced)
+
+        assert [(d.marker, d.omi_id) for d in found] == [(MISSING, "conv_short")]
+
+    def test_missing_and_changed_event_note(self, synced):
+        """Event notes are checked for presence and content."""
+        entry = StateManager(synced.vault_path).get_index_entry("conv_long")
+        event = synced.vault_path / entry.event_path
+        event.write_text(event.read_text() + "\nmy notes\n")
+
+        assert [d.marker for d in verify_vault(synced)] == [CHANGED]
+
+        event.unlink()
+        found = verify_vault(synced)
+
+        assert [d.marker for d in found] == [MISSING]
+        assert entry.event_path in str(found[0])
+
+    def test_carriage_returns_in_transcript(self, config):
+        """A transcript containing \\r verifies cleanly right after sync."""
+        data = [{
+            "id": "conv_cr",
+            "started_at": "2026-01-10T14:00:00Z",
+            "finished_at": "2026-01-10T14:05:00Z",
+            "structured": {"title": "CR", "overview": "", "action_items": []},
+            "transcript_segments": [{"speaker": "SPEAKER_00", "text": "line one\r\nline two\rthree", "start": 0, "end": 1}],
+        }]
+        with freeze_time("2026-01-10T22:00:00Z"):
+            SyncEngine(config).sync(data)
+
+        assert verify_vault(config) == []
+
+    def test_unreadable_raw_file(self, synced):
+        """A Raw file that is not UTF-8 is reported instead of crashing."""
+        raw = synced.vault_path / "Omi" / "Raw" / "2026-01-10.md"
+        raw.write_bytes(b"## 09:00 \xff\xfe (omi:conv_long)\n")
+
+        found = verify_vault(synced)
+
+        assert {d.marker for d in found} == {UNREADABLE}
+        assert len(found) == 2
+
+    def test_event_path_is_directory(self, synced):
+        """An event path that cannot be read as a file is reported."""
+        entry = StateManager(synced.vault_path).get_index_entry("conv_long")
+        event = synced.vault_path / entry.event_path
+        event.unlink()
+        event.mkdir()
+
+        assert [d.marker for d in verify_vault(synced)] == [UNREADABLE]
@@ -0,0 +1,74 @@
+"""Tests for the write-behind queue."""
+import threading
+
+import pytest
+from omi_sync.write_queue import WriteQueue
+
+
+def _write(log, name, size=1):
+    log.append(name)
+    return size
+
+
+class TestWriteQueue:
+    @pytest.mark.parametrize("workers", [0, 3])
+    def test_callbacks_run_in_submission_order(self, workers):
+        written, done = [], []
+        with WriteQueue(workers=workers) as queue:
+            for day in range(10):
+                queue.submit(
+                    [(_write, (written, f"{day}-{i}", 10)) for i in range(3)],
+                    then=lambda day=day: done.append(day),
+                )
+            queue.barrier()
+
+            assert done == list(range(10))
+            assert sorted(written) == sorted(f"{d}-{i}" for d in range(10) for i in range(3))
+            assert queue.bytes_written == 300
+
+    def test_empty_batch_keeps_its_place(self):
+        release = threading.Event()
+        done = []
+        with WriteQueue(workers=1) as queue:
+            queue.submit([(lambda: release.wait() and 0, ())], then=lambda: done.append("write"))
+            queue.submit([], then=lambda: done.append("delete"))
+            assert done == []
+            release.set()
+            queue.barrier()
+
+        assert done == ["write", "delete"]
+
+    def test_backpressure_blocks_submit(self):
+        release = threading.Event()
+        queue = WriteQueue(workers=1, max_pending=1)
+        queue.submit([(lambda: release.wait() and 0, ())])
+        submitted = threading.Event()
+        producer = threading.Thread(target=lambda: (queue.submit([(lambda: 0, ())]), submitted.set()))
+        producer.start()
+
+        assert not submitted.wait(0.2)
+        release.set()
+        assert submitted.wait(5)
+        producer.join()
+        queue.close()
+
+    def test_write_error_raised_to_caller(self):
+        done = []
+
+        def fail():
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            with WriteQueue(workers=2) as queue:
+                queue.submit([(fail, ())], then=lambda: done.append("failed batch"))
+                queue.barrier()
+
+        assert done == []
+
+    def test_close_finishes_successful_batches(self):
+        done = []
+        queue = WriteQueue(workers=2)
+        queue.submit([(lambda: 0, ())], then=lambda: done.append("first"))
+        queue.close()
+
+        assert done == ["first"]